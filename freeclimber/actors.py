@@ -104,7 +104,7 @@ class Status(Entity):
         self.loser_anim = Animate([resources.get_bitmap(e) for e in anim], 0.75, mode = PingPongMode)
         if self.type == 'normal':
             effect = AlphaFade(255,0.75)+Delay(3.0)+AlphaFade(0,0.5)+Delay(1.0)
-            self.do(Repeat(effect))
+            self.do(Timeline(effect))
         elif self.type == 'ghost':
             self.do(ColorFade(colormap[color_player],2.0)+AlphaFade(alpha,1.5))
             bg.do(ColorFade(colormap[color_player],2.0)+AlphaFade(alpha,1.5)+RotateDelta(360,4.0,RepeatMode))
@@ -121,9 +121,7 @@ class Status(Entity):
             self.position.set(centerx = self.centerx, centery = self.centery)
 
     def loser(self):
-        self.abort_actions(AlphaFade)
-        self.abort_actions(Delay)
-        self.abort_actions(Animate)
+        self.abort_actions((AlphaFade, Delay, Animate, Timeline))
         self.do(AlphaFade(255,1.0))
         self.do(self.loser_anim)
 
@@ -297,6 +295,8 @@ class Climber(Entity):
                         'parachute': Repeat(Animate([resources.get_bitmap(e) for e in fall], 0.5),times = 2) + Wait([resources.get_bitmap(e) for e in parachute], 0.5) + RotateDelta(20,0.5,PingPongMode)
                         }
 
+        self._chains = {}
+
         self.movements={'up1left': MoveDelta(0, ceil(-self.altura/2.0), 0.4)+Delay(0.1),\
                         'up1right': MoveDelta(0, ceil(-self.altura/2.0), 0.4)+Delay(0.1),\
                         'up2left': Delay(0.1)+MoveDelta(0, floor(-self.altura/2.0), 0.5)+Delay(0.1),\
@@ -383,6 +383,14 @@ class Climber(Entity):
         self.levelboard.set_status(self.level)
         self.lifeboard.set_lifes(self.lifes)
 
+    def chained(self, first, then):
+        """Animation *first* followed by *then*, chained once and reused."""
+        action = self._chains.get((first, then))
+        if action is None:
+            action = self.animations[first] + self.animations[then]
+            self._chains[(first, then)] = action
+        return action
+
     def move(self, movement="wait", stage = None):
         debug("Requested %s" % movement)
         if (self.ismoving() and not movement == 'hit') or self.last_movement == "fall":
@@ -420,13 +428,13 @@ class Climber(Entity):
                     self.window -= 1
                 else:
                     self.window += 1
-                self.do(self.animations[movement]+self.animations['wait'])
+                self.do(self.chained(movement, 'wait'))
                 self.last_movement = None
                 self.score += 50
                 self.update()
                 self.manos = 2
         elif movement == "down":
-            self.do(self.animations[movement]+self.animations['wait'])
+            self.do(self.chained(movement, 'wait'))
             if self.last_movement and self.last_movement.startswith("up1"):
                 movement = "halfdown"
             else:
@@ -445,18 +453,18 @@ class Climber(Entity):
         elif movement == "up_right":
             if self.last_movement == None:
                 movement = "up1right"
-                self.do(self.animations[movement]+self.animations['waitright'])
+                self.do(self.chained(movement, 'waitright'))
                 self.last_movement = movement
                 self.manos = 1
             elif self.last_movement == 'up1left':
                 movement = "up2right"
-                self.do(self.animations[movement]+self.animations['waitright'])
+                self.do(self.chained(movement, 'waitright'))
                 self.last_movement = movement
                 self.level += 1
                 self.manos = 1
             elif self.last_movement == 'up2left' or self.last_movement == "hit":
                 movement = "up3right"
-                self.do(self.animations[movement]+self.animations['wait'])
+                self.do(self.chained(movement, 'wait'))
                 self.last_movement = None
                 self.score += 100
                 self.update()
@@ -464,18 +472,18 @@ class Climber(Entity):
         elif movement == "up_left":
             if self.last_movement == None:
                 movement = "up1left"
-                self.do(self.animations[movement]+self.animations['waitleft'])
+                self.do(self.chained(movement, 'waitleft'))
                 self.last_movement = movement
                 self.manos = 1
             elif self.last_movement == 'up1right':
                 movement = "up2left"
-                self.do(self.animations[movement]+self.animations['waitleft'])
+                self.do(self.chained(movement, 'waitleft'))
                 self.last_movement = movement
                 self.level += 1
                 self.manos = 1
             elif self.last_movement == 'up2right' :
                 movement = "up3left"
-                self.do(self.animations[movement]+self.animations['wait'])
+                self.do(self.chained(movement, 'wait'))
                 self.last_movement = None
                 self.score += 100
                 self.update()
@@ -505,13 +513,15 @@ class Climber(Entity):
             #self.escudo.do(self.movements[movement])
 
     def ismoving(self):
-        return len(self.get_actions(MoveDelta))+len(self.get_actions(Delay))
+        return self.count_actions((MoveDelta, Delay))
 
     moving = property(ismoving)
 
     def invencible(self):
-       for a in list(self.current_actions):
-           if isinstance(a, Blink) or isinstance(a, AlphaFade):
+       if self.has_actions((Blink, AlphaFade)):
+           return True
+       for a in self.get_actions(Timeline):
+           if a.runs(AlphaFade):
                return True
 
     def auto_move(self, stage):
@@ -564,11 +574,12 @@ class Climber(Entity):
 
 class Supertirititran(Entity):
     image=os.path.join(LINUX_GAME_PATH, 'images', 'common','super.png')
-    layer="actors"
+    ## Flies across the screen, whatever the camera does
+    layer="info"
 
     def init(self, scale):
         self.set(x = SELECTED_RESOLUTION[0]*11//12, y = SELECTED_RESOLUTION[1]+self.height,scale=scale)
-        self.do(MoveTo(self.x-self.width//2,SELECTED_RESOLUTION[1]*2//3,0.75)+MoveTo(self.x+self.width//3,SELECTED_RESOLUTION[1]//3,1.05)+MoveTo(self.x,-self.height, 0.85)+Delete())
+        self.do(MoveTo(self.x-self.width//2,SELECTED_RESOLUTION[1]*2//3,0.75,ease=QuadOut)+MoveTo(self.x+self.width//3,SELECTED_RESOLUTION[1]//3,1.05)+MoveTo(self.x,-self.height, 0.85,ease=QuadIn)+Delete())
 
 
 if __name__ == "__main__":
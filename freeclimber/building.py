@@ -19,6 +19,12 @@ SELECTED_RESOLUTION = get_game_resolution()
 
 closed_windows = 0
 
+## How much the far away city follows the camera
+CITY_PARALLAX = 1/16.0
+
+## Draw the walls and rooms of each floor from one cached texture per layer
+BAKE_CELLS = True
+
 class Escalable(Entity):
 
     image = os.path.join(LINUX_GAME_PATH, 'images','stages','default','dummy.png')
@@ -41,21 +47,16 @@ class Escalable(Entity):
 
     escalable = property(isescalable)
 
-    def move(self, dx, dy, secs):
-        try:
-            self.do(MoveDelta(dx, dy, secs))
-            for name, e in self.entities.items():
-                e.abort_actions()
-                if e.bottom >= 0 or e.top <= SELECTED_RESOLUTION[1]:
-                    e.do(MoveDelta(dx, dy, secs))
-                else:
-                    e.set(x = e.x +dx, y = e.y+dy)
-        except:
-            formatExceptionInfo()
-
     def ismoving(self):
         return False
 
+    ## Parts that can be drawn from a cached texture: the wall and the
+    ## room.  Items and glass move, and the frames have soft edges and
+    ## keep their place among the items in the building layer.
+    def still_parts(self):
+        parts = [self, self.entities.get('room')]
+        return [p for p in parts if p is not None and p.shape is not None and p.shape.binary_alpha]
+
     def abort_actions(self, typefilter=None):
         for name, ent in self.entities.items():
             ent.abort_actions(typefilter)
@@ -86,7 +87,7 @@ class MetaWindow(Escalable):
         if cerrar and not self.ismoving() or self.is_closed():
             if self.entities['glass'].top > self.top:
                 self.entities['glass'].y = self.y-0.5*self.height
-            self.entities['glass'].do(Show()+MoveTo(self.x, self.y, uniform(2.0,5.0)) + CallFunc(self.set_num_closed, 1) + Delay(uniform(2.0,4.0)) + CallFunc(self.set_num_closed, -1) + MoveTo(self.x, self.y-self.height//2, uniform(2.0,5.0))+Hide())
+            self.entities['glass'].do(Show()+MoveTo(self.x, self.y, uniform(2.0,5.0), ease=QuadInOut) + CallFunc(self.set_num_closed, 1) + Delay(uniform(2.0,4.0)) + CallFunc(self.set_num_closed, -1) + MoveTo(self.x, self.y-self.height//2, uniform(2.0,5.0), ease=QuadInOut)+Hide())
             #self.entities['glass'].do( Delay(uniform(2.0,4.0) ))
             #self.entities['glass'].do( MoveDelta(0, -self.height/2, uniform(2.0,5.0) ))
         else:
@@ -119,23 +120,6 @@ class MetaWindow(Escalable):
 
     close = property(is_closed, close_window)
 
-    def move(self, dx, dy, secs):
-        interrupted = self.ismoving()
-        self.do(MoveDelta(dx, dy, secs))
-        for name, e in self.entities.items():
-            if (isinstance(e,Bonus) or isinstance(e,Life1up)) and e.destroyed:
-                continue
-            else:
-                e.abort_actions(MoveTo)
-                e.abort_actions(Delay)
-                e.abort_actions(CallFunc)
-                e.abort_actions(Hide)
-                if interrupted and name == 'glass':
-                    e.do(MoveDelta(dx, dy, secs))
-                    self.do(Delay(secs+0.15)+CallFunc(self.close_window))
-                else:
-                    e.do(MoveDelta(dx, dy, secs))
-
 
 ## We'll subclass the Entity class for our Window objects
 class Window(Entity):
@@ -286,17 +270,6 @@ class MetaObstacle(Escalable):
     def isescalable(self):
         return False
 
-    def move(self, dx, dy, secs):
-        try:
-            self.do(MoveDelta(dx, dy, secs))
-            for name, e in self.entities.items():
-                if e.bottom >= 0 or e.top <= SELECTED_RESOLUTION[1]:
-                    e.do(MoveDelta(dx, dy, secs))
-                else:
-                    e.set(x = e.x +dx, y = e.y+dy)
-        except:
-            formatExceptionInfo()
-
 class MetaLBottom(Escalable):
 
     def __init__(self, x, y, width = None, height = None, theme='default'):
@@ -373,12 +346,6 @@ class LeftBorder(Entity):
             self.shape.compile()
         self.set(x=x, y=y, scale=escala) # also set the drawing scale here
 
-    def move(self, dx, dy, secs):
-        if self.bottom >= 0 or self.top <= SELECTED_RESOLUTION[1]:
-            self.do(MoveDelta(dx, dy, secs))
-        else:
-            self.set(x = self.x +dx, y = self.y+dy)
-
 class RightBorder(Entity):
 
     image = os.path.join(LINUX_GAME_PATH, 'images','stages','default','rborder.png')
@@ -390,12 +357,6 @@ class RightBorder(Entity):
             self.shape.compile()
         self.set(x=x, y=y, scale=escala) # also set the drawing scale here
 
-    def move(self, dx, dy, secs):
-        if self.bottom >= 0 or self.top <= SELECTED_RESOLUTION[1]:
-            self.do(MoveDelta(dx, dy, secs))
-        else:
-            self.set(x = self.x +dx, y = self.y+dy)
-
 class Ground(Entity):
 
     image = os.path.join(LINUX_GAME_PATH, 'images','stages','default','ground.png')
@@ -418,16 +379,6 @@ class Ground(Entity):
         self.banco = Entity(os.path.join(LINUX_GAME_PATH, 'images','stages','default','banco.png'))
         self.banco.set(x=SELECTED_RESOLUTION[0]*9//10,centery=self.centery-20,scale=escala).place('actors')
 
-    def move(self, dx, dy, secs):
-        if self.bottom >= 0 or self.top <= SELECTED_RESOLUTION[1]:
-            self.do(MoveDelta(dx, dy, secs))
-            self.bin.do(MoveDelta(dx, dy, secs))
-            self.banco.do(MoveDelta(dx, dy, secs))
-        else:
-            self.set(x = self.x +dx, y = self.y+dy)
-            self.bin.set(x = self.x +dx, y = self.y+dy)
-            self.banco.set(x = self.x +dx, y = self.y+dy)
-
 class StaticOsbtacle(Entity):
 
     image = os.path.join(LINUX_GAME_PATH, 'images','stages','default','dummy.png')
@@ -565,7 +516,7 @@ class Plant(Entity):
         self.do(Scale(0.5,0.4)+CallFunc(self.abort_actions, RotateDelta)+Delete())
 
     def activate(self):
-        if self.y > 0 and self.y < SELECTED_RESOLUTION[1] and not self.destroyed and not self.active:
+        if 0 < self.screen_pos()[1] < SELECTED_RESOLUTION[1] and not self.destroyed and not self.active:
             self.active = True
             self.do(RotateDelta(20,0.16,PingPongMode))
             self.do(Delay(2.5)+Move(0,SELECTED_RESOLUTION[1]//7))
@@ -671,27 +622,33 @@ class Stage:
                         offset[0] += objeto.width
                     else:
                         offset[0] += width_object
+                if BAKE_CELLS:
+                    self.bake(planta)
                 offset[1] -= h
             LeftCity(width=self.width_unit*1.75, theme = theme)
             RightCity(width=self.width_unit*2, theme = theme)
 
+    ## One texture per layer for the still parts of a floor's cells; it
+    ## stays on the parts' layer, so the drawing order doesn't change.
+    ## It is drawn again when the lights of a room change.
+    def bake(self, planta):
+        layers = {}
+        for cell in self.escenario[planta]:
+            if isinstance(cell, Escalable):
+                for part in cell.still_parts():
+                    if part._layer is not None:
+                        layers.setdefault(part._layer.name, []).append(part)
+        for name, parts in layers.items():
+            if len(parts) > 1:
+                Composite(parts).place(name)
+
+    ## Scrolling moves the camera: the building, its contents and
+    ## everything in a parallax layer follow it in a single tween.
     def subir(self, desp = SELECTED_RESOLUTION[1]//10, secs= 0.5):
-        self.ground.move(0, desp, secs = secs)
-        for p in self.escenario:
-            for e in p:
-                if e and isinstance(e, Escalable):
-                    #e.abort_actions()
-                    #desp = desp and desp or e.height
-                    e.move(0, desp, secs = secs)
+        director.scene.camera.do(MoveDelta(0, -desp, secs))
 
     def bajar(self, desp = -SELECTED_RESOLUTION[1]//10, secs = 0.5):
-        self.ground.move(0, desp, secs = secs)
-        for p in self.escenario:
-            for e in p:
-                if e and isinstance(e, Escalable):
-                    #e.abort_actions()
-                    #desp = desp and desp or -e.height
-                    e.move(0, desp, secs = secs)
+        director.scene.camera.do(MoveDelta(0, -desp, secs))
 
     def initialize(self):
         #inicializar escenario:
@@ -792,12 +749,14 @@ class Stage:
         #   print p
 
     def get_middle_level(self):
-        return self.escenario[self.dim[0]//2][self.dim[1]//2].centery
+        ## On screen, for the weather layers
+        e = self.escenario[self.dim[0]//2][self.dim[1]//2]
+        return e.to_screen(e.centerx, e.centery)[1]
 
     def check_windows(self, x):
         for p in self.escenario:
             for e in p:
-                if isinstance(e, MetaWindow) and (e.y > 0 and e.y < SELECTED_RESOLUTION[1]):
+                if isinstance(e, MetaWindow) and 0 < e.screen_pos()[1] < SELECTED_RESOLUTION[1]:
                     if (e.x == x and not randint(0,250) or not randint(0,2700//DIF)): # random close window
                         e.close_window(True)
                     elif 'item' in e.entities and isinstance(e.entities['item'], Plant) and e.x == x and not randint(0,300//DIF):
@@ -828,14 +787,15 @@ class Building(Scene):
         ## they are rendered more efficiently.
         self.new_static("bg")
 
-        self.new_layer("city")
+        ## The city is far away: it scrolls a little behind the building
+        self.new_layer("city", parallax=CITY_PARALLAX)
 
         ## The actors layer contains the ship and bullets.
-        self.new_layer("dummy")
-        self.new_layer("room")
-        self.new_layer("glass")
-        self.new_stabile("building")
-        self.new_stabile("actors")
+        self.new_layer("dummy", parallax=1)
+        self.new_layer("room", parallax=1)
+        self.new_layer("glass", parallax=1)
+        self.new_stabile("building", parallax=1)
+        self.new_stabile("actors", parallax=1)
 
         ## Load the background.
         e = Entity(os.path.join(LINUX_GAME_PATH, 'images','stages', Building.theme, ASPECT, 'tile.jpg'), hotspot=(0,0))
@@ -861,22 +821,14 @@ class Building(Scene):
             director.quit()
         if ev.key == K_DOWN:
             self.escenario.bajar()
-            for e in self.get_layer("city"):
-                e.do(MoveDelta(0,-20, secs= 0.50))
         elif ev.key == K_UP:
             self.escenario.subir()
-            for e in self.get_layer("city"):
-                e.do(MoveDelta(0,+20, secs= 0.50))
 
     def handle_joyaxismotion(self, ev):
-        if ev.axis == 1 and ev.value == 1:
+        if ev.axis == 1 and ev.peak == 1:
             self.escenario.bajar()
-            for e in self.get_layer("city"):
-                e.do(MoveDelta(0,-20, secs= 0.50))
-        elif ev.axis == 1 and ev.value == -1:
+        elif ev.axis == 1 and ev.peak == -1:
             self.escenario.subir()
-            for e in self.get_layer("city"):
-                e.do(MoveDelta(0, +20, secs= 0.50))
 
 def init_gamepad(dev = 0):
     try:
@@ -43,6 +43,12 @@ RESOLUTIONS = {
 
 # --- Fixed defaults ---
 FPS = 40.0
+FIXED_STEP = False  # fixed-step accumulator with catch-up realticks
+MAX_FPS = 60        # frame cap while playing (0 = uncapped)
+MENU_FPS = 30       # frame cap on intro and menu
+PAUSE_FPS = 15      # frame cap while the game is paused
+VSYNC = False
+PROFILE = "--profile" in sys.argv  # per-phase frame profiler (F3: overlay)
 CONTROLLER = 'keyboard'
 
 
@@ -5,9 +5,11 @@ Usage (replaces ``from pygext.gl.all import *``)::
     from engine import *
 """
 
-from .director import director, screen, Ticker
+from .director import director, screen, Ticker, FramePacer, VirtualClock
 from .scene import Scene
+from .camera import Camera
 from .entity import Entity, TextEntity
+from .composite import Composite
 from .node import Node
 from .actions import (
     Action, IntervalAction,
@@ -17,21 +19,34 @@ from .actions import (
     Animate, Delay,
     CallFunc, CallFuncE,
     Delete, Hide, Show,
-    Blink, RotateDelta, Repeat,
+    Blink, RotateDelta, Repeat, Timeline,
+    Parallel, Broadcast,
     StopMode, RepeatMode, PingPongMode,
 )
 from .collision import RadialCollisions
-from .resources import resources
+from .resources import resources, Prefetch
+from .textures import textures, TextureCache
 from .particles import BitmapParticleSystem, RingEmitter, Random
 from .font import GLFont
+from .profiler import FrameProfiler
+from .telemetry import ActionStats
+from .scheduler import Scheduler, Timer
+from .input import InputQueue, InputSnapshot, CHORD
+from .tween import TweenBatch
+from .easing import (
+    Easing, CURVES, Linear,
+    QuadIn, QuadOut, QuadInOut, CubicIn, CubicOut, CubicInOut,
+    BackIn, BackOut, BackInOut, ElasticIn, ElasticOut, ElasticInOut,
+    BounceIn, BounceOut, BounceInOut,
+)
 
 __all__ = [
     # Director & screen
-    "director", "screen", "Ticker",
+    "director", "screen", "Ticker", "FramePacer", "VirtualClock",
     # Scene
-    "Scene",
+    "Scene", "Camera",
     # Entities
-    "Entity", "TextEntity", "Node",
+    "Entity", "TextEntity", "Node", "Composite",
     # Actions
     "Action", "IntervalAction",
     "MoveTo", "MoveDelta", "Move",
@@ -40,14 +55,28 @@ __all__ = [
     "Animate", "Delay",
     "CallFunc", "CallFuncE",
     "Delete", "Hide", "Show",
-    "Blink", "RotateDelta", "Repeat",
+    "Blink", "RotateDelta", "Repeat", "Timeline",
+    "Parallel", "Broadcast",
     "StopMode", "RepeatMode", "PingPongMode",
     # Collision
     "RadialCollisions",
     # Resources
-    "resources",
+    "resources", "Prefetch", "textures", "TextureCache",
     # Particles
     "BitmapParticleSystem", "RingEmitter", "Random",
     # Font
     "GLFont",
+    # Profiling
+    "FrameProfiler", "ActionStats",
+    # Scheduling
+    "Scheduler", "Timer",
+    # Input
+    "InputQueue", "InputSnapshot", "CHORD",
+    # Tweens
+    "TweenBatch",
+    # Easing
+    "Easing", "CURVES", "Linear",
+    "QuadIn", "QuadOut", "QuadInOut", "CubicIn", "CubicOut", "CubicInOut",
+    "BackIn", "BackOut", "BackInOut", "ElasticIn", "ElasticOut", "ElasticInOut",
+    "BounceIn", "BounceOut", "BounceInOut",
 ]
@@ -1,8 +1,18 @@
 """Action system — replaces pygext action classes with chaining support."""
 
-import copy
+from bisect import bisect_right
+
 import pygame
 
+from . import tween
+from .easing import Easing
+from .telemetry import action_stats
+
+
+# Free lists of finished action instances, per concrete class
+_pools = {}
+POOL_SIZE = 256
+
 
 # ---------------------------------------------------------------------------
 # Interpolation modes
@@ -29,30 +39,99 @@ def PingPongMode(t):
 # ---------------------------------------------------------------------------
 
 class Action:
-    """Base class for all actions."""
+    """Base class for all actions.
 
-    _next = None  # chained action
+    An action built by user code is a prototype: it is never ticked and
+    must not be changed once it has been started or chained.  ``do()``
+    takes a running instance from a per-class free list and fills it
+    from the prototype's attributes; ``end()``/``abort()`` hand it back.
+    Don't keep references to running instances after they finish.
+    """
+
+    _next = None    # chained prototype
+    _then = None    # callback run after the last action of a chain
+    _live = False   # True while a running instance is out of the pool
+    _batch = None   # TweenBatch running this instance, if any
+    _reactor = None  # reactor (time domain) it was scheduled in
+    _born = None    # start time, while counted by telemetry
+    parkable = False    # may sit out while its entity is off-screen
 
     def __add__(self, other):
         """Chain two actions: ``a + b`` means *b* runs after *a* ends."""
-        a = copy.copy(self)
-        # Walk to end of chain
+        a = self._clone()
+        # Copy the left chain so its prototypes stay untouched
         tail = a
         while tail._next is not None:
+            tail._next = tail._next._clone()
             tail = tail._next
-        tail._next = copy.copy(other)
+        tail._next = other
         return a
 
+    def _clone(self):
+        c = object.__new__(type(self))
+        c.__dict__.update(self.__dict__)
+        return c
+
+    def _acquire(self, internal=False):
+        """Return a running instance initialised from this prototype.
+
+        *internal* instances are driven by another action, not started.
+        """
+        pool = _pools.get(type(self))
+        fresh = not pool and action_stats.enabled
+        c = pool.pop() if pool else object.__new__(type(self))
+        c.__dict__.update(self.__dict__)
+        if fresh:
+            if internal:
+                action_stats.created(type(self), True)
+            else:
+                c._fresh = True     # counted as created if it is started
+        c._live = True
+        return c
+
+    def _release(self):
+        if self._live:
+            self.__dict__.clear()
+            pool = _pools.setdefault(type(self), [])
+            if len(pool) < POOL_SIZE:
+                pool.append(self)
+
     def do(self, entity):
         """Start this action on *entity*.  Called by Entity.do()."""
-        c = copy.copy(self)
+        return self._run(entity, None)
+
+    def _run(self, entity, then):
+        c = self._acquire()
         c.entity = entity
+        c._then = then
         c._start(entity)
         entity.current_actions.add(c)
+        if action_stats.enabled:
+            action_stats.started(c)
         from .director import director
-        director.reactor.add(c)
+        c._reactor = director.reactor.domain_for(entity)
+        c._schedule(c._reactor)
         return c
 
+    def _schedule(self, reactor):
+        reactor.add(self)
+
+    def _chain(self, entity, then):
+        """Start the next action of the chain, or call *then* at its end."""
+        if self._next is not None:
+            self._next._run(entity, then)
+        elif then is not None:
+            then()
+
+    def _continue(self):
+        """Release this running instance and go on with its chain."""
+        entity, then, nxt = self.entity, self._then, self._next
+        self._release()
+        if nxt is not None:
+            nxt._run(entity, then)
+        elif then is not None:
+            then()
+
     def _start(self, entity):
         """Override to capture starting state."""
         self.init()
@@ -67,25 +146,30 @@ class Action:
 
     def end(self):
         """Called when the action finishes normally."""
+        entity, then = self.entity, self._then
+        nxt = self._next
+        if self._born is not None:
+            action_stats.finished(self, False)
         self.abort()
-        if self._next is not None:
-            self._next.do(self.entity)
+        if nxt is not None:
+            nxt._run(entity, then)
+        elif then is not None:
+            then()
 
     def abort(self):
         """Remove this action from entity + reactor."""
+        if self._born is not None:
+            action_stats.finished(self, True)
         try:
             self.entity.current_actions.discard(self)
         except AttributeError:
             pass
-        from .director import director
-        director.reactor.remove(self)
-
-    # Convenience for Repeat / chain building
-    def _deep_copy_chain(self):
-        c = copy.copy(self)
-        if c._next is not None:
-            c._next = c._next._deep_copy_chain()
-        return c
+        # The reactor it runs in, even if its scene is suspended now
+        if self._batch is not None:
+            self._batch.remove(self)
+        elif self._reactor is not None:
+            self._reactor.remove(self)
+        self._release()
 
 
 # ---------------------------------------------------------------------------
@@ -93,11 +177,23 @@ class Action:
 # ---------------------------------------------------------------------------
 
 class IntervalAction(Action):
-    """Action that runs over a fixed *secs* duration with a *mode*."""
+    """Action that runs over a fixed *secs* duration with a *mode*.
+
+    Classes listed in ``_BATCHED`` (exact type, not subclasses) run in a
+    shared ``TweenBatch`` instead of ticking on their own when they use
+    one of the built-in modes; they provide ``_tween_values()``.
+
+    *ease* (an ``easing.Easing`` or any ``f(t)``) reshapes the progress
+    after the mode; only ``Easing`` curves can be batched.
+    """
+
+    _row = None     # row in the TweenBatch (-1 while pending)
+    ease = None
 
-    def __init__(self, secs=1.0, mode=StopMode):
+    def __init__(self, secs=1.0, mode=StopMode, ease=None):
         self.secs = float(secs)
         self.mode = mode
+        self.ease = ease
 
     def _start(self, entity):
         self._elapsed = 0.0
@@ -107,6 +203,19 @@ class IntervalAction(Action):
         """Override: capture starting values."""
         pass
 
+    def _schedule(self, reactor):
+        kind = _BATCHED.get(type(self))
+        if (kind is not None and tween.enabled and self.mode in _MODE_CODES
+                and (self.ease is None or isinstance(self.ease, Easing))):
+            channels, apply = _TWEEN_KINDS[kind]
+            reactor.batch(kind, channels, apply).add(self)
+        else:
+            reactor.add(self)
+
+    def _tween_row(self):
+        start, delta = self._tween_values()
+        return start, delta, self.secs, _MODE_CODES[self.mode], self.ease
+
     def tick(self, delta):
         self._elapsed += delta
         if self.secs <= 0:
@@ -114,6 +223,8 @@ class IntervalAction(Action):
         else:
             raw_t = self._elapsed / self.secs
         t = self.mode(raw_t)
+        if self.ease is not None:
+            t = self.ease(t)
         self.update(t)
         if self.mode is StopMode and raw_t >= 1.0:
             self.end()
@@ -122,6 +233,14 @@ class IntervalAction(Action):
         """Override: apply interpolated value (t in [0,1])."""
         pass
 
+    def _finish(self):
+        """Override: tidy up after the last ``update()`` of a normal end."""
+        pass
+
+    def end(self):
+        self._finish()
+        super().end()
+
 
 # ---------------------------------------------------------------------------
 # Concrete actions
@@ -130,8 +249,8 @@ class IntervalAction(Action):
 class MoveTo(IntervalAction):
     """Move entity to absolute (x, y) over *secs*."""
 
-    def __init__(self, x, y, secs=1.0, mode=StopMode):
-        super().__init__(secs, mode)
+    def __init__(self, x, y, secs=1.0, mode=StopMode, ease=None):
+        super().__init__(secs, mode, ease)
         self.target_x = float(x)
         self.target_y = float(y)
 
@@ -141,6 +260,9 @@ class MoveTo(IntervalAction):
         self.dx = self.target_x - self.start_x
         self.dy = self.target_y - self.start_y
 
+    def _tween_values(self):
+        return (self.start_x, self.start_y), (self.dx, self.dy)
+
     def update(self, t):
         self.entity.x = self.start_x + self.dx * t
         self.entity.y = self.start_y + self.dy * t
@@ -149,8 +271,8 @@ class MoveTo(IntervalAction):
 class MoveDelta(IntervalAction):
     """Move entity by (dx, dy) relative to starting position over *secs*."""
 
-    def __init__(self, dx, dy, secs=1.0, mode=StopMode):
-        super().__init__(secs, mode)
+    def __init__(self, dx, dy, secs=1.0, mode=StopMode, ease=None):
+        super().__init__(secs, mode, ease)
         self.move_dx = float(dx)
         self.move_dy = float(dy)
 
@@ -158,6 +280,9 @@ class MoveDelta(IntervalAction):
         self.start_x = float(entity.x)
         self.start_y = float(entity.y)
 
+    def _tween_values(self):
+        return (self.start_x, self.start_y), (self.move_dx, self.move_dy)
+
     def update(self, t):
         self.entity.x = self.start_x + self.move_dx * t
         self.entity.y = self.start_y + self.move_dy * t
@@ -181,14 +306,17 @@ class Move(Action):
 class AlphaFade(IntervalAction):
     """Interpolate entity alpha to *target* over *secs*."""
 
-    def __init__(self, target, secs=1.0, mode=StopMode):
-        super().__init__(secs, mode)
+    def __init__(self, target, secs=1.0, mode=StopMode, ease=None):
+        super().__init__(secs, mode, ease)
         self.target_alpha = float(target)
 
     def start(self, entity):
         self.start_alpha = float(entity.alpha)
         self.dalpha = self.target_alpha - self.start_alpha
 
+    def _tween_values(self):
+        return (self.start_alpha,), (self.dalpha,)
+
     def update(self, t):
         self.entity.alpha = int(self.start_alpha + self.dalpha * t)
 
@@ -196,8 +324,8 @@ class AlphaFade(IntervalAction):
 class ColorFade(IntervalAction):
     """Interpolate entity color tuple to *target_color* over *secs*."""
 
-    def __init__(self, target_color, secs=1.0, mode=StopMode):
-        super().__init__(secs, mode)
+    def __init__(self, target_color, secs=1.0, mode=StopMode, ease=None):
+        super().__init__(secs, mode, ease)
         self.target_color = tuple(float(c) for c in target_color)
 
     def start(self, entity):
@@ -215,14 +343,17 @@ class ColorFade(IntervalAction):
 class Scale(IntervalAction):
     """Interpolate entity scale to *target* over *secs*."""
 
-    def __init__(self, target, secs=1.0, mode=StopMode):
-        super().__init__(secs, mode)
+    def __init__(self, target, secs=1.0, mode=StopMode, ease=None):
+        super().__init__(secs, mode, ease)
         self.target_scale = float(target)
 
     def start(self, entity):
         self.startscale = float(entity.scale)
         self.dscale = self.target_scale - self.startscale
 
+    def _tween_values(self):
+        return (self.startscale,), (self.dscale,)
+
     def update(self, t):
         self.entity.scale = self.startscale + self.dscale * t
 
@@ -238,8 +369,9 @@ class CenteredScale(Scale):
     version here so it's available from the engine import.
     """
 
-    def __init__(self, target, secs=1.0, center=None, mode=StopMode):
-        super().__init__(target, secs, mode)
+    def __init__(self, target, secs=1.0, center=None, mode=StopMode,
+                 ease=None):
+        super().__init__(target, secs, mode, ease)
         self.center = center
 
     def start(self, entity):
@@ -252,11 +384,16 @@ class CenteredScale(Scale):
 
 
 class Animate(IntervalAction):
-    """Cycle through a list of bitmap frames over *secs*."""
+    """Cycle through a list of bitmap frames over *secs*.
 
-    def __init__(self, frames, secs=1.0, mode=StopMode):
-        super().__init__(secs, mode)
+    Looping animations stop ticking while their entity is off-screen
+    (see ``Reactor``) and pick up in phase when it scrolls back in.
+    """
+
+    def __init__(self, frames, secs=1.0, mode=StopMode, ease=None):
+        super().__init__(secs, mode, ease)
         self.frames = list(frames)
+        self.parkable = mode is not StopMode
 
     def start(self, entity):
         self._frame_idx = -1
@@ -277,11 +414,10 @@ class Animate(IntervalAction):
             self.entity.shape = self.frames[0]
             self.entity._texture_dirty = True
 
-    def end(self):
+    def _finish(self):
         # Don't reset frame on normal end if mode loops
         if self.mode is StopMode:
             self.cleanup()
-        super().end()
 
 
 class Delay(IntervalAction):
@@ -294,93 +430,59 @@ class Delay(IntervalAction):
         pass
 
 
-class CallFunc(Action):
+class _Instant(Action):
+    """Action that takes no time: ``_fire()`` runs on the prototype."""
+
+    def _run(self, entity, then):
+        self._fire(entity)
+        self._chain(entity, then)
+        return self
+
+    def _fire(self, entity):
+        pass
+
+
+class CallFunc(_Instant):
     """Call func(*args) immediately, then chain."""
 
     def __init__(self, func, *args):
         self.func = func
         self.args = args
 
-    def _start(self, entity):
-        pass
+    def _fire(self, entity):
+        self.func(*self.args)
 
-    def do(self, entity):
-        c = copy.copy(self)
-        c.entity = entity
-        c.func(*c.args)
-        c._finish_chain(entity)
-        return c
-
-    def _finish_chain(self, entity):
-        if self._next is not None:
-            self._next.do(entity)
 
-
-class CallFuncE(Action):
+class CallFuncE(_Instant):
     """Call func(entity, *args) immediately, then chain."""
 
     def __init__(self, func, *args):
         self.func = func
         self.args = args
 
-    def _start(self, entity):
-        pass
+    def _fire(self, entity):
+        self.func(entity, *self.args)
 
-    def do(self, entity):
-        c = copy.copy(self)
-        c.entity = entity
-        c.func(entity, *c.args)
-        c._finish_chain(entity)
-        return c
 
-    def _finish_chain(self, entity):
-        if self._next is not None:
-            self._next.do(entity)
-
-
-class Delete(Action):
+class Delete(_Instant):
     """Delete the entity immediately, then chain."""
 
-    def _start(self, entity):
-        pass
-
-    def do(self, entity):
-        c = copy.copy(self)
-        c.entity = entity
+    def _fire(self, entity):
         entity.delete()
-        if c._next is not None:
-            c._next.do(entity)
-        return c
 
 
-class Hide(Action):
+class Hide(_Instant):
     """Hide the entity immediately, then chain."""
 
-    def _start(self, entity):
-        pass
-
-    def do(self, entity):
-        c = copy.copy(self)
-        c.entity = entity
+    def _fire(self, entity):
         entity.hidden = True
-        if c._next is not None:
-            c._next.do(entity)
-        return c
 
 
-class Show(Action):
+class Show(_Instant):
     """Show the entity immediately, then chain."""
 
-    def _start(self, entity):
-        pass
-
-    def do(self, entity):
-        c = copy.copy(self)
-        c.entity = entity
+    def _fire(self, entity):
         entity.hidden = False
-        if c._next is not None:
-            c._next.do(entity)
-        return c
 
 
 class Blink(IntervalAction):
@@ -412,9 +514,8 @@ class Blink(IntervalAction):
         phase = elapsed % self.cycle
         self.entity.hidden = phase >= self.on_time
 
-    def end(self):
+    def _finish(self):
         self.entity.hidden = False
-        super().end()
 
     def abort(self):
         try:
@@ -427,8 +528,8 @@ class Blink(IntervalAction):
 class RotateDelta(IntervalAction):
     """Rotate entity by *angle* degrees over *secs*."""
 
-    def __init__(self, angle, secs=1.0, mode=StopMode):
-        super().__init__(secs, mode)
+    def __init__(self, angle, secs=1.0, mode=StopMode, ease=None):
+        super().__init__(secs, mode, ease)
         self.target_angle = float(angle)
 
     def start(self, entity):
@@ -439,55 +540,282 @@ class RotateDelta(IntervalAction):
 
 
 class Repeat(Action):
-    """Repeat an action chain *times* times (None = infinite)."""
+    """Repeat an action chain *times* times (None = infinite).
+
+    Each iteration restarts the inner prototype chain with a callback
+    for its end, so repeating allocates nothing but pooled instances.
+    """
 
     def __init__(self, action, times=None):
         self.inner_action = action
         self.times = times
 
-    def _start(self, entity):
-        pass
-
-    def do(self, entity):
-        c = copy.copy(self)
+    def _run(self, entity, then):
+        c = self._acquire()
         c.entity = entity
+        c._then = then
         c._count = 0
-        c._run_inner(entity)
+        c._iterate = c._iteration_done
+        c._run_inner()
         return c
 
-    def _run_inner(self, entity):
+    def _run_inner(self):
         if self.times is not None and self._count >= self.times:
             # Done repeating — chain to next
-            if self._next is not None:
-                self._next.do(entity)
+            self._continue()
             return
         self._count += 1
-        # Build a copy of the inner action chain with a sentinel at the end
-        inner = self.inner_action._deep_copy_chain()
-        # Find tail of inner chain
-        tail = inner
-        while tail._next is not None:
-            tail = tail._next
-        # Append a CallFunc that triggers the next repetition
-        sentinel = _RepeatSentinel(self)
-        tail._next = sentinel
-        inner.do(entity)
+        self.inner_action._run(self.entity, self._iterate)
 
-    def _on_iteration_done(self):
-        self._run_inner(self.entity)
+    def _iteration_done(self):
+        self._run_inner()
 
 
-class _RepeatSentinel(Action):
-    """Internal helper — signals that one repeat iteration has finished."""
+class Parallel(Action):
+    """Run several actions (or chains) on the same entity at once.
 
-    def __init__(self, repeat_action):
-        self._repeat = repeat_action
+    What is chained after a ``Parallel`` starts when the last branch
+    ends; if a branch is aborted, the chain doesn't go on.
+    """
 
-    def _start(self, entity):
-        pass
+    def __init__(self, *actions):
+        self.actions = actions
 
-    def do(self, entity):
-        c = copy.copy(self)
+    def _run(self, entity, then):
+        c = self._acquire()
         c.entity = entity
-        c._repeat._on_iteration_done()
+        c._then = then
+        c._branches = len(self.actions)
+        if not c._branches:
+            c._continue()
+            return c
+        branch_done = c._branch_done
+        for action in self.actions:
+            action._run(entity, branch_done)
         return c
+
+    def _branch_done(self):
+        self._branches -= 1
+        if not self._branches:
+            self._continue()
+
+
+class Broadcast(IntervalAction):
+    """One interval tween driven on many nodes by a single action.
+
+    ``owner.do(Broadcast(MoveDelta(0, 40, 0.5), nodes))`` starts the
+    tween on every node of *nodes* (each from its own current value),
+    then computes the progress once per tick and writes all of them.
+    *action* must be a ``MoveTo``, ``MoveDelta``, ``AlphaFade`` or
+    ``Scale``.  The broadcast belongs to the owner: it shows up in the
+    owner's actions, not in the targets'.
+    """
+
+    def __init__(self, action, targets):
+        kind = _BATCHED.get(type(action))
+        if kind is None:
+            raise ValueError("can't broadcast %s" % type(action).__name__)
+        super().__init__(action.secs, action.mode, action.ease)
+        self.tween = action
+        self.targets = list(targets)
+        self.apply = _TWEEN_KINDS[kind][1]
+
+    def start(self, entity):
+        # Capture every target's start with one scratch instance
+        w = self.tween._acquire(True)
+        starts = []
+        deltas = []
+        for node in self.targets:
+            w.entity = node
+            w.start(node)
+            start, delta = w._tween_values()
+            starts.append(start)
+            deltas.append(delta)
+        w._release()
+        if tween.numpy is not None:
+            starts = tween.numpy.array(starts, dtype=float)
+            deltas = tween.numpy.array(deltas, dtype=float)
+        self._starts = starts
+        self._deltas = deltas
+
+    def update(self, t):
+        if not self.targets:
+            return
+        if tween.numpy is not None:
+            values = (self._starts + self._deltas * t).tolist()
+        else:
+            values = [[s + d * t for s, d in zip(start, delta)]
+                      for start, delta in zip(self._starts, self._deltas)]
+        self.apply(self.targets, values)
+
+
+class Timeline(Action):
+    """A chain compiled once into a flat table of steps, played by offset.
+
+    ``Timeline(a + b + c, times=None)`` plays like ``Repeat`` but keeps
+    one running instance per step for its whole life and restarts them
+    in place, so iterations allocate nothing; ``seek(secs)`` jumps to
+    any point of the current iteration.  Steps must take a finite time:
+    ``StopMode`` interval actions, instant actions, finite ``Repeat``s
+    and other timelines.  Steps are driven by the timeline and don't show
+    up in ``get_actions()``; ``runs(cls)`` tells whether one is a *cls*.
+    """
+
+    def __init__(self, action, times=None):
+        self.times = times
+        steps = []
+        _compile(action, 0.0, steps)
+        # (offset, secs, prototype) per step, in play order
+        self.steps = tuple(steps)
+        self.duration = max([o + s for o, s, p in self.steps] or [0.0])
+        self._starts = [o for o, s, p in self.steps]
+        if times is None and self.duration <= 0:
+            raise ValueError("an endless Timeline needs a duration")
+
+    def runs(self, cls):
+        """True if any step of the timeline is a *cls*."""
+        return any(isinstance(p, cls) for o, s, p in self.steps)
+
+    def _start(self, entity):
+        workers = []
+        for offset, secs, proto in self.steps:
+            if isinstance(proto, _Instant):
+                workers.append(proto)
+            else:
+                w = proto._acquire(True)
+                w.entity = entity
+                workers.append(w)
+        self._workers = workers
+        self._offset = 0.0
+        self._count = 0
+        self._cursor = -1
+        self._play(0.0)
+
+    def tick(self, delta):
+        offset = self._offset + delta
+        total = self.duration
+        while offset >= total:
+            # Close this iteration
+            self._play(total)
+            if not self._live:
+                return
+            if self._cursor >= 0:
+                self._complete(self._cursor)
+            self._count += 1
+            if self.times is not None and self._count >= self.times:
+                self.end()
+                return
+            offset -= total
+            self._cursor = -1
+        self._offset = offset
+        self._play(offset)
+
+    def seek(self, secs):
+        """Jump to *secs* into the current iteration.
+
+        Steps not reached yet are started and run to their end on the
+        way; seeking back re-evaluates the step at *secs* from the values
+        it captured when it started.
+        """
+        self._offset = min(max(float(secs), 0.0), self.duration)
+        self._play(self._offset)
+
+    def _play(self, offset):
+        k = bisect_right(self._starts, offset) - 1
+        while self._cursor < k:
+            if self._cursor >= 0:
+                self._complete(self._cursor)
+            self._cursor += 1
+            self._enter(self._cursor)
+            if not self._live:  # a step deleted the entity
+                return
+        if k >= 0:
+            start, secs, proto = self.steps[k]
+            if secs > 0:
+                w = self._workers[k]
+                t = min((offset - start) / secs, 1.0)
+                w.update(t if w.ease is None else w.ease(t))
+
+    def _enter(self, i):
+        w = self._workers[i]
+        if isinstance(w, _Instant):
+            w._fire(self.entity)
+        else:
+            w._start(self.entity)
+
+    def _complete(self, i):
+        w = self._workers[i]
+        if not isinstance(w, _Instant):
+            w.update(1.0)
+            w._finish()
+
+    def abort(self):
+        workers = self.__dict__.get("_workers", ())
+        super().abort()
+        for w in workers:
+            if not isinstance(w, _Instant):
+                w._release()
+
+
+def _compile(action, offset, steps):
+    """Append the (offset, secs, prototype) steps of chain *action*."""
+    while action is not None:
+        if isinstance(action, Timeline):
+            if action.times is None:
+                raise ValueError("can't nest an endless Timeline")
+            for i in range(action.times):
+                steps.extend((offset + o, s, p) for o, s, p in action.steps)
+                offset += action.duration
+        elif isinstance(action, Repeat):
+            if action.times is None:
+                raise ValueError("can't compile an endless Repeat")
+            for i in range(action.times):
+                offset = _compile(action.inner_action, offset, steps)
+        elif isinstance(action, _Instant):
+            steps.append((offset, 0.0, action))
+        elif isinstance(action, IntervalAction) and action.mode is StopMode:
+            steps.append((offset, action.secs, action))
+            offset += action.secs
+        else:
+            raise ValueError("%s can't be compiled into a Timeline"
+                             % type(action).__name__)
+        action = action._next
+    return offset
+
+
+# ---------------------------------------------------------------------------
+# Batched tweens
+# ---------------------------------------------------------------------------
+
+def _apply_position(entities, values):
+    for e, (x, y) in zip(entities, values):
+        e.x = x
+        e.y = y
+
+
+def _apply_alpha(entities, values):
+    for e, (a,) in zip(entities, values):
+        e.alpha = int(a)
+
+
+def _apply_scale(entities, values):
+    for e, (s,) in zip(entities, values):
+        e.scale = s
+
+
+_MODE_CODES = {StopMode: tween.STOP, RepeatMode: tween.REPEAT,
+               PingPongMode: tween.PINGPONG}
+
+# kind -> (channels, apply)
+_TWEEN_KINDS = {
+    "position": (2, _apply_position),
+    "alpha": (1, _apply_alpha),
+    "scale": (1, _apply_scale),
+}
+
+_BATCHED = {
+    MoveTo: "position",
+    MoveDelta: "position",
+    AlphaFade: "alpha",
+    Scale: "scale",
+}
@@ -0,0 +1,79 @@
+"""Texture atlases — many small bitmaps packed into a few large pages."""
+
+import pygame
+
+PAGE_SIZE = 2048    # safe maximum texture size on any SDL2 renderer
+
+
+def pack(sizes, page_size=PAGE_SIZE, padding=2):
+    """Shelf-pack ``(w, h)`` *sizes* into square pages of *page_size*.
+
+    Returns one ``(page, x, y)`` per size, in the same order, or ``None``
+    for a size that doesn't fit in a page.  Taller sizes are placed first
+    so each shelf is filled with images of similar height; *padding*
+    pixels are kept free to the right of and below every image.
+    """
+    order = sorted(range(len(sizes)), key=lambda i: (-sizes[i][1], -sizes[i][0]))
+    places = [None] * len(sizes)
+    pages = []      # per page: shelves as [y, height, used width]
+    for i in order:
+        w = sizes[i][0] + padding
+        h = sizes[i][1] + padding
+        if w > page_size or h > page_size:
+            continue
+        for p, shelves in enumerate(pages):
+            spot = _fit(shelves, w, h, page_size)
+            if spot is not None:
+                break
+        else:
+            p = len(pages)
+            pages.append([])
+            spot = _fit(pages[p], w, h, page_size)
+        places[i] = (p,) + spot
+    return places
+
+
+def _fit(shelves, w, h, page_size):
+    for shelf in shelves:
+        y, height, used = shelf
+        if h <= height and used + w <= page_size:
+            shelf[2] = used + w
+            return used, y
+    top = shelves[-1][0] + shelves[-1][1] if shelves else 0
+    if top + h > page_size:
+        return None
+    shelves.append([top, h, w])
+    return 0, top
+
+
+def build(bitmaps, page_size=PAGE_SIZE, padding=2):
+    """Copy *bitmaps* into atlas pages.
+
+    Returns ``(packed, pages)``: one bitmap per input, in order, cut from
+    a page (bitmaps too big for a page come back unchanged), and the page
+    bitmaps themselves.  A packed bitmap's ``surface`` is a subsurface of
+    its page, so it still works wherever a plain bitmap does.
+    """
+    from .resources import _Bitmap
+
+    places = pack([(b.width, b.height) for b in bitmaps], page_size, padding)
+    extents = {}
+    for b, place in zip(bitmaps, places):
+        if place is not None:
+            p, x, y = place
+            w, h = extents.get(p, (0, 0))
+            extents[p] = (max(w, x + b.width), max(h, y + b.height))
+    pages = [_Bitmap(pygame.Surface(extents[p], pygame.SRCALPHA))
+             for p in sorted(extents)]
+    packed = []
+    for b, place in zip(bitmaps, places):
+        if place is None:
+            packed.append(b)
+            continue
+        p, x, y = place
+        page = pages[p]
+        rect = pygame.Rect(x, y, b.width, b.height)
+        page.surface.blit(b.surface, rect)
+        packed.append(_Bitmap(page.surface.subsurface(rect), b.hotspot,
+                              page=page, rect=rect))
+    return packed, pages
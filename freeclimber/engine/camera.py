@@ -0,0 +1,50 @@
+"""Camera — the scroll offset of a scene, shared by all its layers."""
+
+from .node import Node, _Tracked, damage
+
+
+class _Scroll(_Tracked):
+    """Camera ``x``/``y``: moving shifts every following layer, on a layer or not."""
+
+    __slots__ = ()
+
+    def __set__(self, camera, value):
+        if camera.__dict__.get(self.name) != value:
+            damage.dirty = True
+        _Tracked.__set__(self, camera, value)
+
+
+class Camera(Node):
+    """Scroll position of a scene.
+
+    Every layer is drawn shifted by ``-camera * layer.parallax``: layers
+    with parallax 1 scroll with the camera, 0 (the default) stays fixed
+    on screen (HUD) and values in between give depth.  Entities keep
+    their world coordinates, so scrolling the whole scene is one tween
+    on the camera (``scene.camera.do(MoveDelta(0, -100, 0.5))``) instead
+    of one per entity.
+
+    ``to_screen()`` / ``to_world()`` convert points of a layer with the
+    given parallax; nodes have ``screen_pos()`` and ``to_world()`` that
+    look up their own layer.
+    """
+
+    x = _Scroll("x")
+    y = _Scroll("y")
+
+    def offset(self, parallax):
+        """``(dx, dy)`` from world to screen coordinates of a layer."""
+        if not parallax:
+            return (0.0, 0.0)
+        return (-self.x * parallax, -self.y * parallax)
+
+    def to_screen(self, x, y, parallax=1.0):
+        return (x - self.x * parallax, y - self.y * parallax)
+
+    def to_world(self, x, y, parallax=1.0):
+        return (x + self.x * parallax, y + self.y * parallax)
+
+    def reset(self):
+        self.abort_actions()
+        self.x = 0.0
+        self.y = 0.0
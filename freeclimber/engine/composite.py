@@ -0,0 +1,136 @@
+"""Composite — several entities drawn as one cached texture."""
+
+from math import ceil
+
+import pygame
+from .entity import Entity
+
+BLENDMODE_BLEND = 1     # SDL_BLENDMODE_BLEND
+
+
+class Composite(Entity):
+    """Draws a group of *parts* from a texture rendered once.
+
+    The parts leave their layers and are rendered, in the given order,
+    into a render target the size of *rect* (``(left, top, right,
+    bottom)`` in world space; default: the bounds of the visible parts).
+    The composite draws that texture with a single blit where it is
+    placed, and renders it again only after a visible change to a part:
+    moving, fading, hiding, a new shape...  Parts keep their actions and
+    collision nodes, and are clipped to *rect*.  Place it on the layer
+    the parts came from to keep the drawing order.
+
+    The texture only holds parts drawn fully opaque over hard-edged
+    bitmaps (see ``_Bitmap.binary_alpha``): blending a translucent pixel
+    into the texture and the texture onto the screen would apply its
+    alpha twice.  While a part is faded or translucent or has actions
+    running, and when the renderer can't render to a texture, the parts
+    are drawn one by one.
+    """
+
+    caches = True   # parts mark it stale when they change
+
+    def __init__(self, parts, rect=None, **kw):
+        super().__init__(hotspot=(0, 0), **kw)
+        parts = list(parts)
+        self.stale = True
+        self.bakes = 0          # times the texture was rendered
+        self._renderer = None
+        self._target = None     # render target texture (owned, not shared)
+        if rect is None:
+            boxes = [p.bounds() for p in parts if not p.hidden] or [(0, 0, 1, 1)]
+            rect = (min(b[0] for b in boxes), min(b[1] for b in boxes),
+                    max(b[2] for b in boxes), max(b[3] for b in boxes))
+        left, top, right, bottom = rect
+        self.set(x=left, y=top)
+        self._base_width = max(1, ceil(right - left))
+        self._base_height = max(1, ceil(bottom - top))
+        self.parts = []
+        for p in parts:
+            if p._layer is not None:
+                p._layer.remove(p)
+            p._layer = self
+            self.parts.append(p)
+
+    # The parts' layer: they scroll like the composite does
+    @property
+    def parallax(self):
+        return getattr(self._layer, "parallax", 0.0)
+
+    @property
+    def camera(self):
+        return getattr(self._layer, "camera", None)
+
+    def remove(self, part):
+        """Drop *part* (it was deleted or placed on a layer)."""
+        if part in self.parts:
+            self.parts.remove(part)
+            self.stale = True
+
+    def _release_texture(self):
+        for p in self.parts:
+            p._release_texture()
+        self._target = None
+        self.stale = True
+        super()._release_texture()
+
+    def delete(self):
+        for p in list(self.parts):
+            p.delete()
+        self._target = None
+        super().delete()
+
+    def _flat(self):
+        """True if every visible part can go into the texture as it is.
+
+        Animated parts would have it rendered again every frame.
+        """
+        for p in self.parts:
+            if p.hidden or p.deleted:
+                continue
+            if p.alpha < 255 or (p.shape is not None and not p.shape.binary_alpha):
+                return False
+            if p.current_actions:
+                return False
+        return True
+
+    def _bake(self, renderer):
+        if self._target is None:
+            try:
+                from pygame._sdl2.video import Texture
+                self._target = Texture(renderer, (self._base_width, self._base_height),
+                                       target=True)
+                self._target.blend_mode = BLENDMODE_BLEND
+            except Exception:
+                self._target = None
+                self.stale = False
+                return
+        old_target = renderer.target
+        old_color = renderer.draw_color
+        renderer.target = self._target
+        renderer.draw_color = (0, 0, 0, 0)
+        renderer.clear()
+        for p in self.parts:
+            p.draw(renderer, -self.x, -self.y)
+        renderer.target = old_target
+        renderer.draw_color = old_color
+        self.stale = False
+        self.bakes += 1
+
+    def draw(self, renderer, dx=0.0, dy=0.0):
+        if self.hidden or self.deleted:
+            return
+        if renderer is not self._renderer:
+            self._renderer = renderer
+            self._target = None
+            self.stale = True
+        if self.stale and self._flat():
+            self._bake(renderer)
+        if self._target is None or self.stale:
+            for p in self.parts:
+                p.draw(renderer, dx, dy)
+            return
+        w = int(self._base_width * self.scale)
+        h = int(self._base_height * self.scale)
+        self._target.alpha = max(0, min(255, int(self.alpha)))
+        renderer.blit(self._target, pygame.Rect(int(self.x + dx), int(self.y + dy), w, h))
@@ -1,7 +1,14 @@
 """Director singleton, Ticker, Reactor, Screen — game loop."""
 
+import time
 import pygame
 from .scene import Scene
+from .profiler import FrameProfiler
+from .telemetry import action_stats
+from .scheduler import Scheduler
+from .input import InputQueue
+from .node import damage
+from .tween import TweenBatch
 
 
 # ---------------------------------------------------------------------------
@@ -9,11 +16,20 @@ from .scene import Scene
 # ---------------------------------------------------------------------------
 
 class Ticker:
-    """Fixed-rate tick generator matching pygext's Ticker API."""
+    """Fixed-rate tick generator matching pygext's Ticker API.
 
-    def __init__(self, resolution=40):
+    By default at most one realtick fires per frame, so slow frames drop
+    ticks.  With ``set_fixed_step()`` the ticker accumulates elapsed time
+    and reports how many fixed-size steps are due this frame (``steps``),
+    bounded by ``max_steps`` and by ``max_frame_time`` so a long stall can't
+    spiral into ever longer frames.  ``alpha`` is the fraction of a step
+    left in the accumulator, for interpolated rendering.
+    """
+
+    def __init__(self, resolution=40, clock=None):
         self.resolution = float(resolution)
         self.tick_delay = 1000.0 / self.resolution
+        self.clock = clock or pygame.time.get_ticks  # returns milliseconds
         self.now = 0.0
         self.prev_tick = 0.0
         self.prev_realtick = 0.0
@@ -22,26 +38,78 @@ class Ticker:
         self.tick_delta = 0.0       # same as delta (compat)
         self.realtick_delta = 0.0   # time since last realtick
         self.realtick = False       # True on frames where a realtick fires
+        # Fixed-step accumulator mode
+        self.fixed_step = False
+        self.max_steps = 5          # catch-up realticks allowed per frame
+        self.max_frame_time = 250.0  # ms of elapsed time accepted per frame
+        self.accumulator = 0.0      # ms not yet consumed by a step
+        self.steps = 0              # realticks due this frame
+        self.alpha = 1.0            # interpolation factor between steps
+        self.dropped_ticks = 0      # steps discarded by the guards
+
+    def set_fixed_step(self, enabled=True, max_steps=None, max_frame_time=None):
+        """Enable or disable the fixed-step accumulator mode."""
+        self.fixed_step = enabled
+        if max_steps is not None:
+            self.max_steps = max(1, int(max_steps))
+        if max_frame_time is not None:
+            self.max_frame_time = float(max_frame_time)
+        self.accumulator = 0.0
+        self.steps = 0
+        self.alpha = 1.0
+
+    @property
+    def step_secs(self):
+        """Duration of one fixed step in seconds."""
+        return self.tick_delay / 1000.0
 
     def tick(self):
         """Call once per frame.  Updates timing and sets ``realtick`` flag."""
-        self.now = pygame.time.get_ticks()
+        self.now = self.clock()
         elapsed = self.now - self.prev_tick
         self.prev_tick = self.now
         self.delta = elapsed / 1000.0
         self.tick_delta = self.delta
 
-        if self.now >= self.next_realtick:
+        if self.fixed_step:
+            self._accumulate(elapsed)
+        elif self.now >= self.next_realtick:
             self.realtick = True
+            self.steps = 1
             self.realtick_delta = (self.now - self.prev_realtick) / 1000.0
             self.prev_realtick = self.now
-            self.next_realtick = self.now + self.tick_delay
+            # Schedule from the previous deadline so a frame cap that isn't
+            # a multiple of the tick rate doesn't drift the realtick rate
+            self.next_realtick += self.tick_delay
+            if self.next_realtick <= self.now:
+                self.next_realtick = self.now + self.tick_delay
         else:
             self.realtick = False
+            self.steps = 0
             self.realtick_delta = 0.0
 
+    def _accumulate(self, elapsed):
+        if elapsed > self.max_frame_time:
+            self.dropped_ticks += int((elapsed - self.max_frame_time) // self.tick_delay)
+            elapsed = self.max_frame_time
+        self.accumulator += elapsed
+        steps = int(self.accumulator // self.tick_delay)
+        if steps > self.max_steps:
+            self.dropped_ticks += steps - self.max_steps
+            steps = self.max_steps
+            self.accumulator %= self.tick_delay
+        else:
+            self.accumulator -= steps * self.tick_delay
+        self.steps = steps
+        self.realtick = steps > 0
+        self.realtick_delta = steps * self.step_secs
+        if steps:
+            self.prev_realtick = self.now
+            self.next_realtick = self.now + self.tick_delay - self.accumulator
+        self.alpha = self.accumulator / self.tick_delay
+
     def reset(self):
-        self.now = pygame.time.get_ticks()
+        self.now = self.clock()
         self.prev_tick = self.now
         self.prev_realtick = self.now
         self.next_realtick = self.now + self.tick_delay
@@ -49,6 +117,23 @@ class Ticker:
         self.tick_delta = 0.0
         self.realtick_delta = 0.0
         self.realtick = False
+        self.accumulator = 0.0
+        self.steps = 0
+        self.alpha = 1.0
+        self.dropped_ticks = 0
+
+
+class VirtualClock:
+    """Manually advanced millisecond clock for headless, deterministic runs."""
+
+    def __init__(self, start=0.0):
+        self.now = float(start)
+
+    def __call__(self):
+        return self.now
+
+    def advance(self, ms):
+        self.now += ms
 
 
 # ---------------------------------------------------------------------------
@@ -56,38 +141,268 @@ class Ticker:
 # ---------------------------------------------------------------------------
 
 class Reactor:
-    """Set of tickable objects with safe add/remove during iteration."""
-
-    def __init__(self):
-        self._objects = set()
-        self._to_add = set()
-        self._to_remove = set()
+    """Tickable objects in a slot array, ticked in insertion order.
+
+    Removing an object only clears its slot, so it is cheap at any time,
+    including from inside a ``tick()``; objects added during a tick start
+    ticking on the next one.  Cleared slots are compacted away (keeping
+    the order) at the start of a tick once they make up half the array.
+
+    Simple interval tweens are not slots: they live in one ``TweenBatch``
+    per kind (see ``batch()``), and the batches tick before the slots.
+
+    With ``bounds`` set to the visible area (left, top, right, bottom),
+    objects with a true ``parkable`` attribute whose entity lies outside
+    it are taken out of the slots every ``PARK_EVERY`` ticks.  When the
+    entity comes back they get one ``tick()`` with all the time they
+    missed, so looping animations resume in phase.
+
+    A reactor is also a time domain: its objects advance by ``scale``
+    times the frame delta, and not at all while ``paused`` (they are not
+    even visited, and resume exactly where they stopped).  The scene's
+    reactor owns the named domains returned by ``domain(name)``; they
+    tick after it on their own scale and pause, so pausing the scene's
+    reactor leaves them running.  Actions and emitters pick the domain
+    of their node when they start (see ``domain_for()``).  ``timers`` is
+    a ``Scheduler`` on the domain's own clock: its callbacks are delayed
+    by the scale and wait out pauses like the actions do.
+    """
+
+    _MIN_COMPACT = 32
+    PARK_EVERY = 8
+
+    def __init__(self, name=None):
+        self.name = name
+        self.scale = 1.0
+        self.paused = False
+        self.bounds = None
+        self._slots = []    # tickables in insertion order; None = removed
+        self._index = {}    # tickable -> slot index
+        self._holes = 0
+        self._batches = {}  # kind -> TweenBatch, ticked before the slots
+        self._parked = {}   # parked tickable -> reactor time when parked
+        self._domains = {}  # name -> Reactor, ticked after this one
+        self.timers = Scheduler()   # keyed on this domain's time (ms)
+        self._time = 0.0
+        self._ticks = 0
 
     def add(self, obj):
-        self._to_add.add(obj)
-        self._to_remove.discard(obj)
+        if obj not in self._index:
+            self._index[obj] = len(self._slots)
+            self._slots.append(obj)
 
     def remove(self, obj):
-        self._to_remove.add(obj)
-        self._to_add.discard(obj)
+        i = self._index.pop(obj, None)
+        if i is not None:
+            self._slots[i] = None
+            self._holes += 1
+        elif obj in self._parked:
+            del self._parked[obj]
+        else:
+            for d in self._domains.values():
+                d.remove(obj)
+
+    def __len__(self):
+        """Number of live tickables, batched, parked and domain ones included."""
+        return (len(self._index) + len(self._parked)
+                + sum(len(b) for b in self._batches.values())
+                + sum(len(d) for d in self._domains.values()))
+
+    @property
+    def parked(self):
+        """Number of tickables parked off-screen."""
+        return len(self._parked) + sum(d.parked for d in self._domains.values())
+
+    @property
+    def time(self):
+        """Seconds this domain has run (scaled, pauses excluded)."""
+        return self._time
+
+    def domain(self, name):
+        """Return the time domain *name*, creating it on first use."""
+        if name is None:
+            return self
+        d = self._domains.get(name)
+        if d is None:
+            d = self._domains[name] = Reactor(name)
+        return d
+
+    def domain_for(self, node):
+        """The domain of *node*: its ``time_domain`` or its layer's."""
+        name = node.time_domain
+        if name is None:
+            name = getattr(node._layer, "time_domain", None)
+        return self if name is None else self.domain(name)
+
+    def batch(self, kind, channels, apply):
+        """Return the tween batch for *kind*, creating it on first use."""
+        b = self._batches.get(kind)
+        if b is None:
+            b = self._batches[kind] = TweenBatch(channels, apply)
+        return b
+
+    def __contains__(self, obj):
+        return (obj in self._index or obj in self._parked
+                or any(obj in d for d in self._domains.values()))
 
     def tick(self, delta):
-        # Apply deferred adds/removes
-        if self._to_add:
-            self._objects |= self._to_add
-            self._to_add.clear()
-        if self._to_remove:
-            self._objects -= self._to_remove
-            self._to_remove.clear()
-
-        for obj in list(self._objects):
-            if obj not in self._to_remove:
+        if not self.paused:
+            self._tick(delta * self.scale)
+        for d in self._domains.values():
+            d.bounds = self.bounds
+            d.tick(delta)
+
+    def _tick(self, delta):
+        for b in self._batches.values():
+            b.tick(delta)
+        if self._holes > self._MIN_COMPACT and self._holes * 2 > len(self._slots):
+            self._compact()
+        slots = self._slots
+        for i in range(len(slots)):
+            obj = slots[i]
+            if obj is not None:
                 obj.tick(delta)
+        self._time += delta
+        self._ticks += 1
+        self.timers.run(self._time * 1000.0)
+        if self._ticks % self.PARK_EVERY == 0:
+            if self.bounds is not None:
+                self._park(self.bounds)
+            elif self._parked:
+                self._unpark_all()
+
+    def _park(self, bounds):
+        now = self._time
+        parked = self._parked
+        for obj, since in list(parked.items()):
+            if obj in parked and not _outside(obj.entity, bounds):
+                del parked[obj]
+                self.add(obj)
+                obj.tick(now - since)
+        index = self._index
+        for obj in self._slots:
+            if (obj is not None and getattr(obj, "parkable", False)
+                    and _outside(obj.entity, bounds)):
+                self._slots[index.pop(obj)] = None
+                self._holes += 1
+                parked[obj] = now
+
+    def _unpark_all(self):
+        now = self._time
+        parked, self._parked = self._parked, {}
+        for obj, since in parked.items():
+            self.add(obj)
+            obj.tick(now - since)
+
+    def _compact(self):
+        slots = self._slots
+        index = self._index
+        n = 0
+        for obj in slots:
+            if obj is not None:
+                slots[n] = obj
+                index[obj] = n
+                n += 1
+        del slots[n:]
+        self._holes = 0
 
     def clear(self):
-        self._objects.clear()
-        self._to_add.clear()
-        self._to_remove.clear()
+        # Dropped actions never end; let telemetry know they're gone
+        for obj in list(self._index) + list(self._parked):
+            if getattr(obj, "_born", None) is not None:
+                action_stats.finished(obj, True)
+        for b in self._batches.values():
+            for obj in b:
+                if obj._born is not None:
+                    action_stats.finished(obj, True)
+        self._slots.clear()
+        self._index.clear()
+        self._parked.clear()
+        self._holes = 0
+        for b in self._batches.values():
+            b.clear()
+        self._batches.clear()
+        for d in self._domains.values():
+            d.clear()
+        self._domains.clear()
+        self.timers.clear()
+        self.scale = 1.0
+        self.paused = False
+        self._time = 0.0
+        self._ticks = 0
+
+
+def _outside(entity, bounds):
+    """True if *entity* (padded by its size) lies outside *bounds* on screen."""
+    left, top, right, bottom = bounds
+    size = max(getattr(entity, "width", 0), getattr(entity, "height", 0))
+    x, y = entity.screen_pos()
+    return (x + size < left or x - size > right
+            or y + size < top or y - size > bottom)
+
+
+# ---------------------------------------------------------------------------
+# FramePacer — frame cap with adaptive sleep
+# ---------------------------------------------------------------------------
+
+class FramePacer:
+    """Caps the frame rate by sleeping until the next frame is due.
+
+    ``max_fps`` of 0 leaves the loop uncapped.  The pacer sleeps for the
+    bulk of the remaining frame time and busy-waits only the last
+    ``margin`` seconds; the margin adapts to how much the OS oversleeps,
+    so the loop hits the target without burning a core.
+
+    *clock* (seconds) and *sleep* default to ``time.perf_counter`` and
+    ``time.sleep``; tests pass virtual ones.
+    """
+
+    def __init__(self, max_fps=0, clock=None, sleep=None):
+        self.max_fps = max_fps
+        self.clock = clock or time.perf_counter
+        self.sleep = sleep or time.sleep
+        self.margin = 0.001         # secs left for the final busy-wait
+        self.slept = 0.0            # secs slept on the last frame
+        self.frame_time = 0.0       # secs between the last two frames
+        self._next_frame = None
+        self._last_frame = None
+
+    def reset(self):
+        self._next_frame = None
+        self._last_frame = None
+
+    def wait(self, max_fps=None):
+        """Block until the next frame is due.  *max_fps* overrides ``max_fps``."""
+        fps = self.max_fps if max_fps is None else max_fps
+        clock = self.clock
+        now = clock()
+        self.slept = 0.0
+        if fps and fps > 0:
+            period = 1.0 / fps
+            if self._next_frame is None or now - self._next_frame > period:
+                # First frame, or too far behind to catch up: resync
+                self._next_frame = now
+            target = self._next_frame
+            remaining = target - now
+            if remaining > 0:
+                if remaining > self.margin:
+                    self.sleep(remaining - self.margin)
+                    late = clock() - target
+                    # Grow the margin quickly on oversleep, shrink it slowly
+                    if late > 0:
+                        self.margin = min(self.margin + late, 0.004)
+                    else:
+                        self.margin = max(self.margin * 0.95, 0.0002)
+                while clock() < target:
+                    pass
+                self.slept = clock() - now
+            self._next_frame = target + period
+        else:
+            self._next_frame = None
+        now = clock()
+        if self._last_frame is not None:
+            self.frame_time = now - self._last_frame
+        self._last_frame = now
 
 
 # ---------------------------------------------------------------------------
@@ -102,10 +417,11 @@ class Screen:
         self._window = None
         self._renderer = None
 
-    def init(self, resolution, fullscreen=False, title=""):
+    def init(self, resolution, fullscreen=False, title="", vsync=False):
         """Initialize the display via SDL2 Renderer.
 
-        Creates a ``pygame._sdl2.Window`` + ``Renderer``.
+        Creates a ``pygame._sdl2.Window`` + ``Renderer``.  With *vsync*,
+        ``present()`` waits for the display refresh.
         """
         pygame.init()
 
@@ -113,7 +429,7 @@ class Screen:
         self._window = Window(title, resolution)
         if fullscreen:
             self._window.set_fullscreen(True)
-        self._renderer = Renderer(self._window)
+        self._renderer = Renderer(self._window, vsync=vsync)
 
         # Wire into director
         director._renderer = self._renderer
@@ -135,8 +451,11 @@ class _Director:
     def __init__(self):
         self.ticker = Ticker(40)
         self.reactor = Reactor()
+        self.scheduler = Scheduler()
+        self.input = InputQueue()
         self.scene = None
-        self._next_scene = None
+        self._next_scene = None     # pending (op, scene) transition
+        self._stack = []            # suspended scenes, innermost last
         self._renderer = None
         self._window = None
         self._resolution = (800, 600)
@@ -144,10 +463,59 @@ class _Director:
         self.ticks = 0
         self.realticks = 0
         self.secs = 0.0
-        self._clock = None
+        self.pacer = FramePacer()
+        self.headless = False
+        self.profiler = FrameProfiler()
+        self.action_stats = action_stats
+        self.profiler.panels.append(action_stats)
+        self._prof = None
+        self.skip_idle_frames = True
+        self.skipped_frames = 0
+        self.offscreen_margin = 64  # px around the view; None = never park
+        self.cull_margin = 16       # px around the view; None = draw all
+        self._drawn_clear_color = None
+        self._next_draw = None      # ticker ms the next capped draw is due
+        self._interpolated = set()
 
     def run(self, scene_or_class):
         """Main game loop.  Accepts a Scene instance or Scene subclass."""
+        self._start(scene_or_class)
+        while self.running:
+            self._frame()
+            # --- Frame pacing: never slower than the tick rate ---
+            self.pacer.wait(self._loop_cap())
+        self._stop()
+
+    def run_headless(self, scene_or_class, realticks, frame_ms=None):
+        """Run a scene without a window, as fast as the CPU allows.
+
+        The ticker reads a ``VirtualClock`` advanced by *frame_ms* each
+        frame (one tick period by default), nothing is drawn, SDL events
+        are not pumped and the frame cap is ignored, so the run is
+        deterministic.  Stops after *realticks* realticks or when the
+        scene quits, and returns the number of realticks run.
+        """
+        clock = VirtualClock()
+        step = self.ticker.tick_delay if frame_ms is None else float(frame_ms)
+        saved = (self.ticker.clock, self._renderer, self.headless)
+        self.ticker.clock = clock
+        self._renderer = None
+        self.headless = True
+        try:
+            self._start(scene_or_class)
+            while self.running and self.realticks < realticks:
+                clock.advance(step)
+                self._frame()
+            self._stop()
+        finally:
+            self.ticker.clock, self._renderer, self.headless = saved
+        return self.realticks
+
+    def get_ticks(self):
+        """Milliseconds on the ticker's clock (virtual in headless runs)."""
+        return self.ticker.clock()
+
+    def _start(self, scene_or_class):
         if isinstance(scene_or_class, type) and issubclass(scene_or_class, Scene):
             scene = scene_or_class()
         else:
@@ -157,85 +525,299 @@ class _Director:
         self.ticks = 0
         self.realticks = 0
         self.secs = 0.0
-        self._clock = pygame.time.Clock()
-
+        self.skipped_frames = 0
+        self.scheduler.clear(self.ticker.clock())
+        self.input.clear()
+        self._drop_stack()
         self._set_scene_immediate(scene)
 
         self.ticker.reset()
+        self.pacer.reset()
+        self._next_draw = None
 
-        while self.running:
-            # --- Draw ---
-            if self._renderer is not None:
-                cc = screen.clear_color
-                if cc is not None:
-                    self._renderer.draw_color = cc
-                    self._renderer.clear()
-                if self.scene is not None:
-                    for layer in self.scene.ordered_layers:
-                        layer.draw(self._renderer)
-                self._renderer.present()
-
-            # --- Timing ---
-            self.ticker.tick()
-            delta = self.ticker.delta
-            self.ticks += 1
-            self.secs += delta
-
+    def _stop(self):
+        # Leaving run loop
+        if self.scene is not None:
+            self.scene._deactivate()
+            self.scene = None
+        self._drop_stack()
+
+    def _frame(self):
+        """Draw, advance time and run the logic for one frame."""
+        prof = self._prof = self.profiler if self.profiler.enabled else None
+        if prof:
+            prof.begin_frame()
+
+        # --- Draw (skipped while nothing visible has changed) ---
+        drawing = self._renderer is not None and self._draw_due()
+        if drawing and not self._needs_redraw(prof):
+            self.skipped_frames += 1
+        elif drawing:
+            damage.dirty = False
+            self.input.exposed = False
+            cc = screen.clear_color
+            self._drawn_clear_color = cc
+            if cc is not None:
+                self._renderer.draw_color = cc
+                self._renderer.clear()
+            if prof:
+                prof.mark("clear")
+            if self.scene is not None:
+                view = self._view_bounds(self.cull_margin)
+                camera = self.scene.camera
+                for layer in self.scene.ordered_layers:
+                    layer.draw(self._renderer, view, camera.offset(layer.parallax))
+                    if prof:
+                        prof.mark("draw:" + layer.name)
+            if prof and prof.overlay:
+                prof.draw_overlay(self._renderer)
+                prof.mark("overlay")
+            self._renderer.present()
+            if prof:
+                prof.mark("present")
+
+        # --- Timing ---
+        self.ticker.tick()
+        delta = self.ticker.delta
+        self.ticks += 1
+        self.secs += delta
+        stats = action_stats if action_stats.enabled else None
+        if stats:
+            stats.now = self.secs
+
+        # --- Input: polled every frame, dispatched on realticks ---
+        if not self.headless:
+            self._poll_input()
+            if prof:
+                prof.mark("poll")
+
+        # --- Scheduled callbacks ---
+        self.scheduler.run(self.ticker.now)
+        if prof:
+            prof.mark("scheduler")
+
+        self.reactor.bounds = self._view_bounds(self.offscreen_margin)
+
+        if self.ticker.fixed_step:
+            # --- Fixed steps: realtick + reactor, with catch-up ---
+            step = self.ticker.step_secs
+            for _ in range(self.ticker.steps):
+                self._snapshot_interpolated()
+                self.realticks += 1
+                self._realtick()
+                self.reactor.tick(step)
+                if prof:
+                    prof.mark("reactor")
+                if self._next_scene is not None or not self.running:
+                    break
+            self._scene_tick()
+        else:
             # --- Realtick (fixed-rate logic) ---
             if self.ticker.realtick:
                 self.realticks += 1
-                if self.scene is not None:
-                    # Collision checks
-                    if self.scene.coll is not None:
-                        self.scene.coll.check_collisions()
-                    # Pygame events
-                    self._handle_events()
-                    # State-specific realtick
-                    if self.scene._state_realtick is not None:
-                        self.scene._state_realtick()
-                    else:
-                        self.scene.realtick()
+                self._realtick()
 
             # --- Per-frame tick ---
-            if self.scene is not None:
-                if self.scene._state_tick is not None:
-                    self.scene._state_tick()
-                else:
-                    self.scene.tick()
+            self._scene_tick()
 
             # --- Reactor (actions, particles) ---
             self.reactor.tick(delta)
-
-            # --- Deferred scene switch ---
-            if self._next_scene is not None:
-                next_s = self._next_scene
-                self._next_scene = None
+            if prof:
+                prof.mark("reactor")
+
+        # --- Deferred scene switch ---
+        if self._next_scene is not None:
+            op, next_s = self._next_scene
+            self._next_scene = None
+            if op == "push":
+                self._push_immediate(next_s)
+            elif op == "pop":
+                self._pop_immediate()
+            else:
                 self._set_scene_immediate(next_s)
+            if prof:
+                prof.mark("switch")
+
+        if stats:
+            stats.end_frame()
+        if prof:
+            prof.end_frame()
+
+    def _view_bounds(self, margin):
+        """The visible area grown by *margin* px (``None``: no bounds)."""
+        if margin is None:
+            return None
+        w, h = self._resolution
+        return (-margin, -margin, w + margin, h + margin)
+
+    def _needs_redraw(self, prof):
+        if not self.skip_idle_frames or damage.dirty or self.input.exposed:
+            return True
+        if screen.clear_color != self._drawn_clear_color:
+            return True
+        if prof and prof.overlay:
+            return True
+        # Interpolated nodes move between steps even without a realtick
+        return self.ticker.fixed_step and bool(self._interpolated)
+
+    def _frame_cap(self):
+        """Frames drawn per second at most (0 or ``None``: uncapped)."""
+        if self.scene is not None and self.scene.max_fps is not None:
+            return self.scene.max_fps
+        return self.pacer.max_fps
+
+    def _loop_cap(self):
+        """Frame rate the loop is paced at.
+
+        A cap below the tick rate only thins out drawing (``_draw_due()``):
+        the loop keeps running at the tick rate, so realticks and the
+        reactor aren't throttled with it.
+        """
+        cap = self._frame_cap()
+        if cap and cap < self.ticker.resolution:
+            return self.ticker.resolution
+        return cap
+
+    def _draw_due(self):
+        """False on the frames a cap below the tick rate doesn't draw."""
+        cap = self._frame_cap()
+        if not cap or cap >= self.ticker.resolution:
+            self._next_draw = None
+            return True
+        now = self.ticker.clock()
+        period = 1000.0 / cap
+        if self._next_draw is not None and now < self._next_draw:
+            return False
+        if self._next_draw is None or now - self._next_draw > period:
+            self._next_draw = now + period
+        else:
+            self._next_draw += period
+        return True
+
+    def _realtick(self):
+        if self.scene is None:
+            return
+        prof = self._prof
+        # Collision checks
+        if self.scene.coll is not None:
+            self.scene.coll.check_collisions()
+        if prof:
+            prof.mark("collisions")
+        # Pygame events
+        self._handle_events()
+        if prof:
+            prof.mark("events")
+        # State-specific realtick
+        if self.scene._state_realtick is not None:
+            self.scene._state_realtick()
+        else:
+            self.scene.realtick()
+        if prof:
+            prof.mark("realtick")
+
+    def _scene_tick(self):
+        if self.scene is None:
+            return
+        if self.scene._state_tick is not None:
+            self.scene._state_tick()
+        else:
+            self.scene.tick()
+        if self._prof:
+            self._prof.mark("tick")
 
-            # Cap frame rate loosely (don't burn CPU)
-            if self._clock:
-                self._clock.tick(0)  # no cap — just track time
+    def track_interpolation(self, node):
+        """Snapshot *node*'s position before each fixed step."""
+        self._interpolated.add(node)
 
-        # Leaving run loop
-        if self.scene is not None:
-            self.scene._deactivate()
-            self.scene = None
+    def untrack_interpolation(self, node):
+        self._interpolated.discard(node)
+
+    def _snapshot_interpolated(self):
+        for node in self._interpolated:
+            node._prev_x = node.x
+            node._prev_y = node.y
+
+    def _poll_input(self):
+        chords = self.scene.chords if self.scene is not None else None
+        self.input.poll(self.ticker.clock(), chords)
 
     def _handle_events(self):
-        for event in pygame.event.get():
-            if event.type == pygame.QUIT:
-                self.running = False
-                return
+        now = self.ticker.clock()
+        snap = self.input.take(now)
+        if self.input.quit:
+            self.running = False
+            return
+        for event in snap.events:
+            if (event.type == pygame.KEYDOWN and self.profiler.enabled
+                    and event.key == self.profiler.toggle_key):
+                self.profiler.toggle_overlay()
+                continue
             if self.scene is not None:
+                self.input.record_latency(event, now)
                 self.scene.dispatch_event(event)
 
     def set_scene(self, scene_or_class, *args, **kw):
-        """Deferred scene switch — takes effect at end of current frame."""
+        """Deferred scene switch — takes effect at end of current frame.
+
+        Replaces the current scene only; suspended scenes stay stacked.
+        """
+        self._next_scene = ("set", self._make_scene(scene_or_class, args, kw))
+
+    def push_scene(self, scene_or_class, *args, **kw):
+        """Deferred: suspend the current scene and run another on top.
+
+        The suspended scene is not deactivated: its layers, collision
+        engine and actions (frozen in their own reactor) are kept until
+        ``pop_scene()`` resumes it, instead of being rebuilt by
+        ``enter()``.  Scheduler timers keep running; cancel them in the
+        scene's ``suspend()`` if they shouldn't.
+        """
+        self._next_scene = ("push", self._make_scene(scene_or_class, args, kw))
+
+    def pop_scene(self):
+        """Deferred: deactivate the current scene and resume the one below.
+
+        Quits if there is no suspended scene.
+        """
+        self._next_scene = ("pop", None)
+
+    @property
+    def scene_stack(self):
+        """Suspended scenes, innermost last (the current scene excluded)."""
+        return [entry[0] for entry in self._stack]
+
+    def _make_scene(self, scene_or_class, args, kw):
         if isinstance(scene_or_class, type) and issubclass(scene_or_class, Scene):
-            scene = scene_or_class(*args, **kw)
-        else:
-            scene = scene_or_class
-        self._next_scene = scene
+            return scene_or_class(*args, **kw)
+        return scene_or_class
+
+    def _push_immediate(self, scene):
+        current = self.scene
+        if current is not None:
+            current._suspend()
+            self._stack.append((current, self.reactor, self._interpolated,
+                                screen.clear_color))
+            self.scene = None
+            self.reactor = Reactor()
+            self._interpolated = set()
+        self._set_scene_immediate(scene)
+
+    def _pop_immediate(self):
+        if not self._stack:
+            self.quit()
+            return
+        self._set_scene_immediate(None)
+        scene, self.reactor, self._interpolated, screen.clear_color = self._stack.pop()
+        self.scene = scene
+        damage.dirty = True
+        scene._resume()
+
+    def _drop_stack(self):
+        """Deactivate every suspended scene, innermost first."""
+        while self._stack:
+            scene, reactor = self._stack.pop()[:2]
+            reactor.clear()
+            scene._deactivate()
 
     def _set_scene_immediate(self, scene):
         """Activate *scene* now."""
@@ -244,6 +826,8 @@ class _Director:
         self.scene = scene
         # Clear reactor — old scene's actions should not persist
         self.reactor.clear()
+        self._interpolated.clear()
+        damage.dirty = True
         if scene is not None:
             scene._activate()
 
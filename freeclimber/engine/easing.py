@@ -0,0 +1,124 @@
+"""Easing curves sampled into lookup tables.
+
+Pass one as ``ease=`` to any interval action, e.g.
+``MoveTo(x, y, 1.0, ease=BounceOut)``.  The curve reshapes the action's
+progress after its mode (so ``PingPongMode`` with ``QuadInOut`` eases
+both ways).  Curves are evaluated by linear interpolation in a table
+sampled once at import, which the batch tween engine also uses.
+"""
+
+from math import sin, pi
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+LUT_SIZE = 1024
+
+
+class Easing:
+    """An easing curve ``f(t)`` for t in [0, 1], with f(0)=0 and f(1)=1."""
+
+    def __init__(self, name, func, size=LUT_SIZE):
+        self.name = name
+        self.func = func
+        self.size = size
+        self.table = [float(func(i / float(size))) for i in range(size + 1)]
+        # Exact endpoints, so tweens land on their targets
+        self.table[0], self.table[size] = 0.0, 1.0
+        self.table.append(self.table[-1])   # lets t == 1.0 skip a check
+        self.array = numpy.array(self.table) if numpy is not None else None
+
+    def __call__(self, t):
+        x = min(max(t, 0.0), 1.0) * self.size
+        i = int(x)
+        a = self.table[i]
+        return a + (self.table[i + 1] - a) * (x - i)
+
+    def map_array(self, t):
+        """``__call__`` over a NumPy array, with the same arithmetic."""
+        x = numpy.clip(t, 0.0, 1.0) * self.size
+        i = x.astype(int)
+        a = self.array[i]
+        return a + (self.array[i + 1] - a) * (x - i)
+
+    def __repr__(self):
+        return "<Easing %s>" % self.name
+
+
+# ---------------------------------------------------------------------------
+# Curves (after Robert Penner's equations)
+# ---------------------------------------------------------------------------
+
+_BACK = 1.70158
+_BACK_IO = _BACK * 1.525
+
+
+def _bounce_out(t):
+    if t < 1 / 2.75:
+        return 7.5625 * t * t
+    if t < 2 / 2.75:
+        t -= 1.5 / 2.75
+        return 7.5625 * t * t + 0.75
+    if t < 2.5 / 2.75:
+        t -= 2.25 / 2.75
+        return 7.5625 * t * t + 0.9375
+    t -= 2.625 / 2.75
+    return 7.5625 * t * t + 0.984375
+
+
+def _elastic_in(t):
+    if t <= 0.0 or t >= 1.0:
+        return t
+    return -(2 ** (10 * t - 10)) * sin((10 * t - 10.75) * (2 * pi / 3))
+
+
+def _elastic_out(t):
+    if t <= 0.0 or t >= 1.0:
+        return t
+    return 2 ** (-10 * t) * sin((10 * t - 0.75) * (2 * pi / 3)) + 1
+
+
+def _elastic_in_out(t):
+    if t <= 0.0 or t >= 1.0:
+        return t
+    s = sin((20 * t - 11.125) * (2 * pi / 4.5))
+    if t < 0.5:
+        return -(2 ** (20 * t - 10)) * s / 2
+    return 2 ** (-20 * t + 10) * s / 2 + 1
+
+
+def _in_out(f_in):
+    """Build the in-out form of an ease-in function."""
+    return lambda t: f_in(2 * t) / 2 if t < 0.5 else 1 - f_in(2 - 2 * t) / 2
+
+
+Linear = Easing("Linear", lambda t: t)
+
+QuadIn = Easing("QuadIn", lambda t: t * t)
+QuadOut = Easing("QuadOut", lambda t: 1 - (1 - t) ** 2)
+QuadInOut = Easing("QuadInOut", _in_out(lambda t: t * t))
+
+CubicIn = Easing("CubicIn", lambda t: t ** 3)
+CubicOut = Easing("CubicOut", lambda t: 1 - (1 - t) ** 3)
+CubicInOut = Easing("CubicInOut", _in_out(lambda t: t ** 3))
+
+BackIn = Easing("BackIn", lambda t: (_BACK + 1) * t ** 3 - _BACK * t * t)
+BackOut = Easing("BackOut",
+                 lambda t: 1 + (_BACK + 1) * (t - 1) ** 3 + _BACK * (t - 1) ** 2)
+BackInOut = Easing("BackInOut",
+                   _in_out(lambda t: (_BACK_IO + 1) * t ** 3 - _BACK_IO * t * t))
+
+ElasticIn = Easing("ElasticIn", _elastic_in)
+ElasticOut = Easing("ElasticOut", _elastic_out)
+ElasticInOut = Easing("ElasticInOut", _elastic_in_out)
+
+BounceIn = Easing("BounceIn", lambda t: 1 - _bounce_out(1 - t))
+BounceOut = Easing("BounceOut", _bounce_out)
+BounceInOut = Easing("BounceInOut", _in_out(lambda t: 1 - _bounce_out(1 - t)))
+
+CURVES = dict((e.name, e) for e in (
+    Linear, QuadIn, QuadOut, QuadInOut, CubicIn, CubicOut, CubicInOut,
+    BackIn, BackOut, BackInOut, ElasticIn, ElasticOut, ElasticInOut,
+    BounceIn, BounceOut, BounceInOut))
@@ -1,9 +1,12 @@
 """Entity and TextEntity — sprite rendering via SDL2 Renderer."""
 
 import os
+from math import hypot
+
 import pygame
-from .node import Node
+from .node import Node, _track
 from .resources import resources, _Bitmap
+from .textures import textures
 
 
 class Entity(Node):
@@ -20,10 +23,14 @@ class Entity(Node):
     - ``layer``: default layer name — entity auto-places on this layer
 
     Keyword arguments to the constructor are forwarded to ``init()``.
+
+    Textures come from the shared ``textures`` cache: entities with the
+    same bitmap draw the same texture.
     """
 
     image = None
     layer = None
+    cullable = True
 
     def __init__(self, image=None, hotspot="default", **kw):
         super().__init__()
@@ -31,7 +38,8 @@ class Entity(Node):
         img = image or self.__class__.image
         self.shape = None           # _Bitmap or None
         self._texture = None        # pygame._sdl2 Texture (lazy)
-        self._texture_dirty = True  # need to (re)create texture
+        self._texture_key = None    # bitmap _texture was acquired for
+        self._texture_dirty = True  # shape changed since _texture was set
         self._base_width = 1
         self._base_height = 1
 
@@ -145,6 +153,33 @@ class Entity(Node):
     def centery(self, val):
         self.y = val - (0.5 - self._hy) * self.height
 
+    def bounds(self):
+        """``(left, top, right, bottom)`` in world coordinates, cached until it moves.
+
+        Rotated entities get the square that holds them at any angle.
+        """
+        b = self._bounds
+        if b is None:
+            w = self._base_width * self.scale
+            h = self._base_height * self.scale
+            left = self.x - self._hx * w
+            top = self.y - self._hy * h
+            if self.angle:
+                r = hypot(w, h) / 2.0
+                cx = left + w / 2.0
+                cy = top + h / 2.0
+                b = (cx - r, cy - r, cx + r, cy + r)
+            else:
+                b = (left, top, left + w, top + h)
+            self._bounds = b
+        return b
+
+    def screen_bounds(self):
+        """``bounds()`` after the camera, i.e. where it is drawn."""
+        left, top, right, bottom = self.bounds()
+        dx, dy = self.screen_offset()
+        return (left + dx, top + dy, right + dx, bottom + dy)
+
     # Compatibility aliases used by weather.py particles
     @property
     def realx(self):
@@ -167,21 +202,33 @@ class Entity(Node):
     # ------------------------------------------------------------------
 
     def _ensure_texture(self, renderer):
-        """Create / recreate SDL2 Texture from the current shape surface."""
-        if self.shape is None:
-            self._texture = None
-            return
-        try:
-            from pygame._sdl2.video import Texture
-            surf = self.shape.surface
-            self._texture = Texture.from_surface(renderer, surf)
-            self._base_width = self.shape.width
-            self._base_height = self.shape.height
-        except Exception:
-            self._texture = None
+        """Point ``_texture`` at the shared texture of the current shape."""
+        shape = self.shape
+        # Frames packed in the same atlas page share its texture
+        key = shape if shape is None or shape.page is None else shape.page
+        if key is not self._texture_key:
+            self._release_texture()
+            if key is not None:
+                self._texture = textures.acquire(renderer, key)
+                if self._texture is not None:
+                    self._texture_key = key
+        if shape is not None:
+            self._base_width = shape.width
+            self._base_height = shape.height
         self._texture_dirty = False
 
-    def draw(self, renderer):
+    def _release_texture(self):
+        if self._texture_key is not None:
+            textures.release(self._texture_key)
+            self._texture_key = None
+        self._texture = None
+
+    def delete(self):
+        super().delete()
+        self._release_texture()
+
+    def draw(self, renderer, dx=0.0, dy=0.0):
+        """Draw at the position shifted by *dx*, *dy* (the layer's camera offset)."""
         if self.hidden or self.deleted:
             return
         if self.shape is None:
@@ -196,9 +243,17 @@ class Entity(Node):
         if w <= 0 or h <= 0:
             return
 
+        x, y = self.x, self.y
+        if self._prev_x is not None:
+            # Blend between the last two fixed steps
+            from .director import director
+            a = director.ticker.alpha
+            x = self._prev_x + (x - self._prev_x) * a
+            y = self._prev_y + (y - self._prev_y) * a
+
         # Draw position is always top-left, computed from hotspot
-        draw_x = int(self.x - self._hx * w)
-        draw_y = int(self.y - self._hy * h)
+        draw_x = int(x + dx - self._hx * w)
+        draw_y = int(y + dy - self._hy * h)
         dest = pygame.Rect(draw_x, draw_y, w, h)
 
         # Apply alpha
@@ -211,11 +266,14 @@ class Entity(Node):
 
         if self.angle != 0:
             from pygame._sdl2.video import Image
-            img = Image(self._texture)
+            img = Image(self._texture, srcrect=self.shape.rect)
             img.angle = self.angle
             img.draw(dstrect=dest)
         else:
-            renderer.blit(self._texture, dest)
+            renderer.blit(self._texture, dest, self.shape.rect)
+
+
+_track(Entity, ("shape", "_base_width", "_base_height", "_hx", "_hy"))
 
 
 class TextEntity(Entity):
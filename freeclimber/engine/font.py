@@ -35,4 +35,4 @@ class GLFont:
         surf = self._font.render(str(text), True, self.color)
         if self.alpha < 255:
             surf.set_alpha(self.alpha)
-        return _Bitmap(surf, hotspot=None)
+        return _Bitmap(surf, hotspot=None, transient=True)
@@ -0,0 +1,138 @@
+"""Per-frame input polling with a timestamped queue."""
+
+from collections import deque
+
+import pygame
+
+# Synthetic event posted when every key of a chord is held down
+CHORD = pygame.event.custom_type()
+
+
+class InputSnapshot:
+    """Everything polled since the previous realtick."""
+
+    __slots__ = ("events", "chords", "pressed", "time")
+
+    def __init__(self, events, chords, pressed, time):
+        self.events = events        # pygame events in poll order
+        self.chords = chords        # chord names resolved at poll time
+        self.pressed = pressed      # frozenset of keys held at take() time
+        self.time = time
+
+
+class InputQueue:
+    """Polls SDL every frame and hands out one snapshot per realtick.
+
+    Each event gets a ``poll_time`` attribute (ticker milliseconds).
+    Key state is tracked from the polled KEYDOWN/KEYUP events, so chords
+    (*name* -> tuple of keys, see ``Scene.chords``) are resolved against
+    the keys held at the moment of the key press rather than whatever
+    ``pygame.key.get_pressed()`` says at the next realtick.  A flood of
+    ``JOYAXISMOTION`` events is coalesced to one event per axis and run
+    of motion: the last one, in its own place among the other events, so
+    a return to centre is never lost.  Its ``peak`` attribute holds the
+    largest deflection of the run for threshold checks.
+
+    ``latency`` keeps the last poll-to-dispatch delays in milliseconds.
+    ``exposed`` is set when the window needs repainting (expose/resize).
+    """
+
+    _EXPOSE_EVENTS = frozenset((pygame.WINDOWEXPOSED, pygame.WINDOWRESIZED,
+                                pygame.WINDOWSIZECHANGED, pygame.WINDOWRESTORED,
+                                pygame.VIDEOEXPOSE))
+
+    def __init__(self):
+        self.pressed = set()
+        self.quit = False
+        self.exposed = False
+        self.latency = deque(maxlen=240)
+        self.snapshot = None
+        self._pending = []
+        self._chords = []
+        self._axes = {}     # (device, axis) -> index in _pending
+        self._holes = 0     # coalesced events left as None in _pending
+
+    def poll(self, now, chords=None, events=None):
+        """Queue SDL events (or *events*) stamped with *now*."""
+        if events is None:
+            events = pygame.event.get()
+        pending = self._pending
+        axes = self._axes
+        for ev in events:
+            ev.poll_time = now
+            etype = ev.type
+            if axes and etype != pygame.JOYAXISMOTION:
+                axes.clear()    # never coalesce across other input
+            if etype == pygame.QUIT:
+                self.quit = True
+            elif etype == pygame.KEYDOWN:
+                self.pressed.add(ev.key)
+                pending.append(ev)
+                if chords:
+                    self._resolve_chords(ev, chords, now)
+            elif etype == pygame.KEYUP:
+                self.pressed.discard(ev.key)
+                pending.append(ev)
+            elif etype == pygame.WINDOWFOCUSLOST:
+                # KEYUPs are lost while unfocused; don't leave keys stuck
+                self.pressed.clear()
+                pending.append(ev)
+            elif etype in self._EXPOSE_EVENTS:
+                self.exposed = True
+                pending.append(ev)
+            elif etype == pygame.JOYAXISMOTION:
+                key = (getattr(ev, "instance_id", getattr(ev, "joy", 0)), ev.axis)
+                i = axes.get(key)
+                ev.peak = ev.value
+                if i is not None:
+                    peak = pending[i].peak
+                    if abs(peak) > abs(ev.value):
+                        ev.peak = peak
+                    pending[i] = None
+                    self._holes += 1
+                axes[key] = len(pending)
+                pending.append(ev)
+            else:
+                pending.append(ev)
+
+    def _resolve_chords(self, ev, chords, now):
+        pressed = self.pressed
+        for name, keys in chords.items():
+            if ev.key in keys and all(k in pressed for k in keys):
+                self._chords.append(name)
+                self._pending.append(pygame.event.Event(
+                    CHORD, chord=name, key=ev.key, poll_time=now))
+
+    def take(self, now):
+        """Return the snapshot of input queued since the last call."""
+        events = self._pending
+        if self._holes:
+            events = [ev for ev in events if ev is not None]
+        snap = InputSnapshot(events, self._chords,
+                             frozenset(self.pressed), now)
+        self._pending = []
+        self._chords = []
+        self._axes.clear()
+        self._holes = 0
+        self._holes = 0
+        self.snapshot = snap
+        return snap
+
+    def record_latency(self, event, now):
+        self.latency.append(now - event.poll_time)
+
+    def latency_stats(self):
+        """Return ``(mean, max)`` poll-to-dispatch latency in ms."""
+        if not self.latency:
+            return (0.0, 0.0)
+        return (sum(self.latency) / len(self.latency), max(self.latency))
+
+    def clear(self):
+        self.pressed.clear()
+        self.quit = False
+        self.exposed = False
+        self.snapshot = None
+        self._pending = []
+        self._chords = []
+        self._axes.clear()
+        self._holes = 0
@@ -1,14 +1,150 @@
 """Node — base class with position, actions, and collision nodes."""
 
 
+# Attributes that change what a node looks like on screen
+_VISUAL_ATTRS = frozenset(("x", "y", "scale", "angle", "alpha", "color",
+                           "hidden", "deleted", "shape"))
+# Attributes that move or resize a node's bounds
+_GEOMETRY_ATTRS = frozenset(("x", "y", "scale", "angle", "shape",
+                             "_base_width", "_base_height", "_hx", "_hy"))
+_MISSING = object()
+
+
+class _Tracked:
+    """Write hook for one visual or geometry attribute of a node.
+
+    It only defines ``__set__``, so reads still come straight from the
+    instance dict; a write clears the cached bounds (geometry) and, for
+    a node on a layer, marks the frame and a caching layer damaged
+    (visual) when the value changes.
+    """
+
+    __slots__ = ("name", "visual", "geometry")
+
+    def __init__(self, name):
+        self.name = name
+        self.visual = name in _VISUAL_ATTRS
+        self.geometry = name in _GEOMETRY_ATTRS
+
+    def __set__(self, node, value):
+        d = node.__dict__
+        name = self.name
+        if self.geometry:
+            d["_bounds"] = None
+        if self.visual:
+            layer = d.get("_layer")
+            if layer is not None and d.get(name, _MISSING) != value:
+                damage.dirty = True
+                if layer.caches:
+                    layer.stale = True
+        d[name] = value
+
+
+class _Damage:
+    """Frame-level dirty flag shared by nodes, layers and the Director.
+
+    Set whenever something visible changes; the Director skips drawing
+    and presenting a frame while it stays clear.
+    """
+
+    __slots__ = ("dirty",)
+
+    def __init__(self):
+        self.dirty = True
+
+
+damage = _Damage()
+
+
+class ActionSet:
+    """The running actions of a node, indexed by their exact class.
+
+    Behaves like a set for ``add``/``discard``/``in``/``len``/iteration.
+    ``count()``, ``of_type()`` and ``abort()`` take a class or a tuple
+    (or set) of classes with ``isinstance`` semantics, and only visit
+    the buckets of matching classes, so queries don't grow with the
+    number of running actions.
+    """
+
+    __slots__ = ("_by_type", "_len", "_match")
+
+    def __init__(self):
+        self._by_type = {}  # class -> set of running actions
+        self._len = 0
+        self._match = {}    # typefilter -> matching classes in _by_type
+
+    def add(self, action):
+        bucket = self._by_type.get(type(action))
+        if bucket is None:
+            bucket = self._by_type[type(action)] = set()
+            self._match.clear()
+        if action not in bucket:
+            bucket.add(action)
+            self._len += 1
+
+    def discard(self, action):
+        bucket = self._by_type.get(type(action))
+        if bucket is not None and action in bucket:
+            bucket.remove(action)
+            self._len -= 1
+
+    def __contains__(self, action):
+        bucket = self._by_type.get(type(action))
+        return bucket is not None and action in bucket
+
+    def __len__(self):
+        return self._len
+
+    def __iter__(self):
+        return iter([a for bucket in self._by_type.values() for a in bucket])
+
+    def _buckets(self, typefilter):
+        if isinstance(typefilter, (set, frozenset, list)):
+            typefilter = tuple(typefilter)
+        types = self._match.get(typefilter)
+        if types is None:
+            types = [t for t in self._by_type if issubclass(t, typefilter)]
+            self._match[typefilter] = types
+        return [self._by_type[t] for t in types]
+
+    def count(self, typefilter=None):
+        if typefilter is None:
+            return self._len
+        return sum(len(b) for b in self._buckets(typefilter))
+
+    def of_type(self, typefilter=None):
+        if typefilter is None:
+            return list(self)
+        return [a for b in self._buckets(typefilter) for a in b]
+
+    def abort(self, typefilter=None):
+        for a in self.of_type(typefilter):
+            a.abort()
+
+
 class Node:
     """Positional node with action and collision support.
 
     This is the base for Entity/TextEntity.  It tracks position, scale,
     angle, alpha, color, visibility, and manages the set of running
     actions and collision nodes attached to it.
+
+    Set ``interpolate = True`` on a subclass to have the Director record
+    the position before each fixed step, so the node is drawn between
+    simulation states when the ticker runs in fixed-step mode.
+
+    ``time_domain`` names the ``Reactor.domain()`` its actions start in;
+    ``None`` follows the node's layer, which defaults to the scene's.
+
+    ``x``/``y`` are world coordinates of the node's layer; the scene
+    camera decides where they end up on screen (see ``screen_pos()``).
     """
 
+    interpolate = False
+    time_domain = None  # name of the reactor domain its actions run in
+    cullable = False    # layers may skip drawing it outside the view
+    _bounds = None      # cached bounds(), cleared when the geometry changes
+
     def __init__(self):
         self.x = 0.0
         self.y = 0.0
@@ -19,7 +155,9 @@ class Node:
         self.hidden = False
         self.deleted = False
         self._layer = None
-        self.current_actions = set()
+        self._prev_x = None
+        self._prev_y = None
+        self.current_actions = ActionSet()
         self._collision_nodes = set()
 
     # ------------------------------------------------------------------
@@ -52,17 +190,52 @@ class Node:
             action.do(self)
 
     def get_actions(self, typefilter=None):
-        """Return list of current actions, optionally filtered by type."""
-        if typefilter is None:
-            return list(self.current_actions)
-        return [a for a in self.current_actions if isinstance(a, typefilter)]
+        """Return list of current actions, optionally filtered by type.
+
+        *typefilter* is a class or a tuple/set of classes.
+        """
+        return self.current_actions.of_type(typefilter)
+
+    def count_actions(self, typefilter=None):
+        """Number of current actions matching *typefilter*."""
+        return self.current_actions.count(typefilter)
+
+    def has_actions(self, typefilter=None):
+        return self.current_actions.count(typefilter) > 0
 
     def abort_actions(self, typefilter=None):
-        """Abort all current actions, optionally only those matching *typefilter*."""
-        to_abort = list(self.current_actions)
-        for a in to_abort:
-            if typefilter is None or isinstance(a, typefilter):
-                a.abort()
+        """Abort all current actions, optionally only those matching *typefilter*.
+
+        Pass a tuple or set of classes to abort several kinds in one call.
+        """
+        self.current_actions.abort(typefilter)
+
+    # ------------------------------------------------------------------
+    # World / screen coordinates
+    # ------------------------------------------------------------------
+
+    def screen_offset(self):
+        """``(dx, dy)`` the scene camera shifts this node's layer by."""
+        layer = self._layer
+        camera = getattr(layer, "camera", None)
+        if camera is None:
+            return (0.0, 0.0)
+        return camera.offset(layer.parallax)
+
+    def screen_pos(self):
+        """``(x, y)`` of the node on screen, after the camera."""
+        dx, dy = self.screen_offset()
+        return (self.x + dx, self.y + dy)
+
+    def to_screen(self, x, y):
+        """Convert a point of this node's layer to screen coordinates."""
+        dx, dy = self.screen_offset()
+        return (x + dx, y + dy)
+
+    def to_world(self, x, y):
+        """Convert a screen point to coordinates of this node's layer."""
+        dx, dy = self.screen_offset()
+        return (x - dx, y - dy)
 
     # ------------------------------------------------------------------
     # Collision
@@ -93,6 +266,8 @@ class Node:
                     self._layer.remove(self)
                 layer.add(self)
                 self._layer = layer
+                if self.interpolate:
+                    director.track_interpolation(self)
         return self
 
     def delete(self):
@@ -105,8 +280,18 @@ class Node:
         self.abort_actions()
         # Remove collision nodes
         from .director import director
+        director.untrack_interpolation(self)
         scene = director.scene
         if scene is not None and scene.coll is not None:
             for cn in list(self._collision_nodes):
                 scene.coll.remove_node(cn)
         self._collision_nodes.clear()
+
+
+def _track(cls, names):
+    """Route writes of the attributes *names* of *cls* through ``_Tracked``."""
+    for name in names:
+        setattr(cls, name, _Tracked(name))
+
+
+_track(Node, ("x", "y", "scale", "angle", "alpha", "color", "hidden", "deleted"))
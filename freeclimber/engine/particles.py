@@ -7,7 +7,9 @@ import math
 import random
 import pygame
 from .entity import Entity
+from .node import damage
 from .resources import resources
+from .textures import textures
 
 
 class _Particle:
@@ -42,6 +44,7 @@ class BitmapParticleSystem(Entity):
     image = None
     layer = None
     mutators = []
+    cullable = False    # particles fly well outside the system's own bounds
 
     def __init__(self, **kw):
         self._particles = []
@@ -60,14 +63,17 @@ class BitmapParticleSystem(Entity):
         self._emitters.append(emitter)
         # Register with reactor so tick() is called
         from .director import director
-        director.reactor.add(emitter)
+        director.reactor.domain_for(node).add(emitter)
         return emitter
 
     def _add_particle(self, p):
         self._particles.append(p)
+        damage.dirty = True
 
     def tick(self, delta):
         """Update all particles."""
+        if self._particles:
+            damage.dirty = True
         dead = []
         for p in self._particles:
             p.age += delta
@@ -88,28 +94,28 @@ class BitmapParticleSystem(Entity):
         for p in dead:
             self._particles.remove(p)
 
-    def draw(self, renderer):
+    def draw(self, renderer, dx=0.0, dy=0.0):
         if self.hidden or self.deleted:
             return
         for p in self._particles:
-            if p.shape is None:
+            shape = p.shape
+            if shape is None:
                 continue
-            # Ensure texture
+            # Ensure texture (shared with everything drawing this bitmap)
             if p._texture is None:
-                try:
-                    from pygame._sdl2.video import Texture
-                    p._texture = Texture.from_surface(renderer, p.shape.surface)
-                except Exception:
+                p._texture = textures.get(
+                    renderer, shape if shape.page is None else shape.page)
+                if p._texture is None:
                     continue
-            w = int(p.shape.width * p.scale)
-            h = int(p.shape.height * p.scale)
+            w = int(shape.width * p.scale)
+            h = int(shape.height * p.scale)
             if w <= 0 or h <= 0:
                 continue
-            dest = pygame.Rect(int(p.x - w / 2), int(p.y - h / 2), w, h)
+            dest = pygame.Rect(int(p.x + dx - w / 2), int(p.y + dy - h / 2), w, h)
             p._texture.alpha = max(0, min(255, int(p.alpha)))
             if p.color and len(p.color) >= 3:
                 p._texture.color = p.color[:3]
-            renderer.blit(p._texture, dest)
+            renderer.blit(p._texture, dest, shape.rect)
 
 
 class RingEmitter:
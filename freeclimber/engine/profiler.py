@@ -0,0 +1,144 @@
+"""Per-phase frame profiler with on-screen overlay and CSV export."""
+
+import csv
+import time
+from collections import deque
+
+import pygame
+
+
+class FrameProfiler:
+    """Times each phase of every frame into a ring buffer.
+
+    The Director calls ``begin_frame()`` at the top of a frame and
+    ``mark(name)`` after each phase; every mark records the time elapsed
+    since the previous one.  Only the last ``capacity`` frames are kept.
+
+    Phases recorded by the Director: ``clear``, ``draw:<layer>``,
+    ``present``, ``poll``, ``scheduler``, ``collisions``, ``events``,
+    ``realtick``, ``tick``, ``reactor`` and ``switch`` (deferred scene
+    switch).
+
+    Objects in ``panels`` add their ``overlay_lines()`` below the table
+    (the Director adds the action telemetry).
+    """
+
+    def __init__(self, capacity=300):
+        self.enabled = False
+        self.overlay = False
+        self.toggle_key = pygame.K_F3
+        self.frames = deque(maxlen=capacity)
+        self.phases = []            # phase names in first-seen order
+        self._current = None
+        self._frame_start = 0.0
+        self._last = 0.0
+        self._overlay_texture = None
+        self._overlay_age = 0
+        self._font = None
+        self.panels = []
+
+    def begin_frame(self):
+        self._current = {}
+        self._frame_start = self._last = time.perf_counter()
+
+    def mark(self, name):
+        """Charge the time since the previous mark to phase *name*."""
+        now = time.perf_counter()
+        cur = self._current
+        if name not in cur:
+            cur[name] = now - self._last
+            if name not in self.phases:
+                self.phases.append(name)
+        else:
+            cur[name] += now - self._last
+        self._last = now
+
+    def end_frame(self):
+        cur = self._current
+        cur["total"] = time.perf_counter() - self._frame_start
+        self.frames.append(cur)
+        self._current = None
+
+    def clear(self):
+        self.frames.clear()
+        self.phases = []
+
+    # ------------------------------------------------------------------
+    # Reports
+    # ------------------------------------------------------------------
+
+    def averages(self):
+        """Return ``{phase: mean seconds per frame}`` over the buffer."""
+        n = len(self.frames)
+        if not n:
+            return {}
+        sums = dict.fromkeys(self.phases + ["total"], 0.0)
+        for frame in self.frames:
+            for name, secs in frame.items():
+                sums[name] += secs
+        return dict((name, secs / n) for name, secs in sums.items())
+
+    def worst(self):
+        """Return ``{phase: max seconds in a single frame}`` over the buffer."""
+        worst = {}
+        for frame in self.frames:
+            for name, secs in frame.items():
+                if secs > worst.get(name, 0.0):
+                    worst[name] = secs
+        return worst
+
+    def dump_csv(self, path):
+        """Write one row per buffered frame, times in milliseconds."""
+        columns = ["total"] + self.phases
+        with open(path, "w", newline="") as f:
+            writer = csv.writer(f)
+            writer.writerow(["frame"] + columns)
+            for i, frame in enumerate(self.frames):
+                writer.writerow([i] + ["%.3f" % (frame.get(c, 0.0) * 1000.0)
+                                       for c in columns])
+
+    # ------------------------------------------------------------------
+    # Overlay
+    # ------------------------------------------------------------------
+
+    def toggle_overlay(self):
+        self.overlay = not self.overlay
+        self._overlay_texture = None
+
+    def draw_overlay(self, renderer):
+        """Blit a table of average/worst ms per phase in the top-left corner."""
+        # Re-render the text every 20 frames; it's only a readout
+        self._overlay_age -= 1
+        if self._overlay_texture is None or self._overlay_age <= 0:
+            self._overlay_age = 20
+            self._overlay_texture = self._render_overlay(renderer)
+        if self._overlay_texture is not None:
+            tex = self._overlay_texture
+            renderer.blit(tex, pygame.Rect(4, 4, tex.width, tex.height))
+
+    def _render_overlay(self, renderer):
+        try:
+            from pygame._sdl2.video import Texture
+            if self._font is None:
+                self._font = pygame.font.Font(None, 18)
+            avg = self.averages()
+            worst = self.worst()
+            lines = ["%-18s %7s %7s" % ("phase", "avg ms", "max ms")]
+            for name in ["total"] + self.phases:
+                lines.append("%-18s %7.2f %7.2f" % (
+                    name[:18], avg.get(name, 0.0) * 1000.0,
+                    worst.get(name, 0.0) * 1000.0))
+            for panel in self.panels:
+                if getattr(panel, "enabled", True):
+                    lines.append("")
+                    lines.extend(panel.overlay_lines())
+            rendered = [self._font.render(l, True, (255, 255, 0)) for l in lines]
+            h = self._font.get_linesize()
+            w = max(s.get_width() for s in rendered)
+            surf = pygame.Surface((w + 8, h * len(rendered) + 8), pygame.SRCALPHA)
+            surf.fill((0, 0, 0, 170))
+            for i, s in enumerate(rendered):
+                surf.blit(s, (4, 4 + i * h))
+            return Texture.from_surface(renderer, surf)
+        except Exception:
+            return None
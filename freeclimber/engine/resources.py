@@ -1,6 +1,8 @@
 """Resource loading and caching — replaces pygext resource system."""
 
 import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
 import pygame
 
 
@@ -11,14 +13,24 @@ class _Bitmap:
     (``_listid``) and a ``compile()`` method.  Game code sometimes checks
     ``shape._listid is None`` and calls ``shape.compile()`` — both are
     now harmless no-ops because we use SDL2 textures at draw time.
+
+    A bitmap packed into an atlas has the page bitmap in ``page`` and its
+    area of the page in ``rect``; it is drawn from the page's texture.
+    A ``transient`` bitmap (rendered text) is not drawn again once its
+    users let go, so its texture isn't kept around for reuse.
     """
 
-    def __init__(self, surface, hotspot=None):
+    def __init__(self, surface, hotspot=None, page=None, rect=None,
+                 transient=False):
         self.surface = surface
         self.width = surface.get_width()
         self.height = surface.get_height()
         # hotspot: fractional anchor (0-1, 0-1) or None for center
         self.hotspot = hotspot
+        self.page = page
+        self.rect = rect
+        self.transient = transient
+        self._binary_alpha = None
         # Compatibility stub — game code checks this
         self._listid = True
 
@@ -26,6 +38,15 @@ class _Bitmap:
         """No-op kept for API compatibility."""
         pass
 
+    @property
+    def binary_alpha(self):
+        """True if every pixel is either opaque or fully transparent."""
+        if self._binary_alpha is None:
+            s = self.surface
+            self._binary_alpha = (pygame.mask.from_surface(s, 0).count()
+                                  == pygame.mask.from_surface(s, 254).count())
+        return self._binary_alpha
+
     def get_width(self):
         return self.width
 
@@ -33,29 +54,130 @@ class _Bitmap:
         return self.height
 
 
+class Prefetch:
+    """Progress of a ``ResourceHandler.prefetch()`` batch."""
+
+    def __init__(self, futures):
+        self.futures = futures
+        self.total = len(futures)
+
+    @property
+    def done(self):
+        return sum(1 for f in self.futures if f.done())
+
+    @property
+    def fraction(self):
+        """Completed share of the batch, 0.0 to 1.0."""
+        if not self.total:
+            return 1.0
+        return self.done / float(self.total)
+
+    @property
+    def finished(self):
+        return all(f.done() for f in self.futures)
+
+    def wait(self):
+        """Block until every image in the batch is decoded."""
+        for f in self.futures:
+            f.result()
+
+
 class ResourceHandler:
-    """Loads and caches image surfaces."""
+    """Loads and caches image surfaces.
 
-    def __init__(self):
+    ``prefetch()`` decodes a batch of images on a thread pool; a later
+    ``get_surface()`` for an image still being decoded waits for that
+    decode instead of starting another one.
+    """
+
+    def __init__(self, workers=None):
         self._cache = {}
+        self._pending = {}      # key -> Future of an in-flight decode
+        self._lock = threading.Lock()
+        self._workers = workers or min(4, os.cpu_count() or 1)
+        self._pool = None
 
     def get_surface(self, path, hotspot=None):
         key = (path, hotspot if hotspot is not None else "default")
-        if key not in self._cache:
-            try:
-                surf = pygame.image.load(path)
-            except Exception:
-                return None
-            bmp = _Bitmap(surf, hotspot)
-            self._cache[key] = bmp
-        return self._cache[key]
+        bmp = self._cache.get(key)
+        if bmp is not None:
+            return bmp
+        future = self._pending.get(key)
+        if future is not None:
+            return future.result()
+        # A worker may have finished between the two lookups above
+        bmp = self._cache.get(key)
+        if bmp is not None:
+            return bmp
+        try:
+            surf = pygame.image.load(path)
+        except Exception:
+            return None
+        bmp = _Bitmap(surf, hotspot)
+        self._cache[key] = bmp
+        return bmp
 
     def get_bitmap(self, path, hotspot=None):
         """Alias for get_surface — matches pygext API."""
         return self.get_surface(path, hotspot)
 
+    def prefetch(self, paths, hotspot=None):
+        """Start decoding *paths* in the background; returns a ``Prefetch``."""
+        if self._pool is None:
+            self._pool = ThreadPoolExecutor(self._workers,
+                                            thread_name_prefix="prefetch")
+        futures = []
+        with self._lock:
+            for path in paths:
+                key = (path, hotspot if hotspot is not None else "default")
+                if key in self._cache:
+                    continue
+                future = self._pending.get(key)
+                if future is None:
+                    future = self._pool.submit(self._decode, key, path, hotspot)
+                    self._pending[key] = future
+                futures.append(future)
+        return Prefetch(futures)
+
+    def _decode(self, key, path, hotspot):
+        try:
+            bmp = _Bitmap(pygame.image.load(path), hotspot)
+        except Exception:
+            bmp = None
+        with self._lock:
+            if bmp is not None:
+                self._cache.setdefault(key, bmp)
+                bmp = self._cache[key]
+            self._pending.pop(key, None)
+        return bmp
+
+    def build_atlas(self, paths, page_size=None, padding=2):
+        """Repack the images of *paths* into shared atlas pages.
+
+        Loads what isn't cached yet, then replaces every cached bitmap of
+        those paths (any hotspot) by one cut from a page, so entities
+        created afterwards draw from a few large textures.  Bitmaps handed
+        out before keep working on their own.  Returns the page bitmaps.
+        """
+        from .atlas import build, PAGE_SIZE
+        paths = [p for p in dict.fromkeys(paths) if self.get_surface(p) is not None]
+        loose = [p for p in paths if self.get_surface(p).page is None]
+        packed, pages = build([self.get_surface(p) for p in loose],
+                              page_size or PAGE_SIZE, padding)
+        by_path = dict((p, b) for p, b in zip(loose, packed) if b.page is not None)
+        with self._lock:
+            for key, bmp in list(self._cache.items()):
+                b = by_path.get(key[0])
+                if b is not None and bmp.page is None:
+                    self._cache[key] = _Bitmap(b.surface, bmp.hotspot,
+                                               page=b.page, rect=b.rect)
+        return pages
+
     def clear(self):
+        for future in list(self._pending.values()):
+            future.cancel()
         self._cache.clear()
+        self._pending.clear()
 
 
 resources = ResourceHandler()
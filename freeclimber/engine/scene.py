@@ -1,14 +1,85 @@
 """Scene and Layer classes — replaces pygext Scene/Layer system."""
 
 import pygame
+from .camera import Camera
 from .collision import RadialCollisions
+from .input import CHORD
+from .node import damage
 
 
 # ---------------------------------------------------------------------------
 # Layers
 # ---------------------------------------------------------------------------
 
-class Layer:
+def _draw_entities(layer, entities, renderer, view, offset=None):
+    """Draw *entities*, skipping cullable ones whose bounds miss *view*.
+
+    *view* is in screen coordinates; entities are shifted by *offset*
+    (the layer's camera offset) on the way.  Records the counts of the
+    frame in ``layer.drawn`` / ``layer.culled``.
+    """
+    dx, dy = offset if offset is not None else (0.0, 0.0)
+    drawn = culled = 0
+    if view is None:
+        for e in entities:
+            if not e.deleted:
+                e.draw(renderer, dx, dy)
+                drawn += 1
+    else:
+        # Cull in world space: move the view instead of every entity
+        left, top, right, bottom = view
+        left -= dx
+        right -= dx
+        top -= dy
+        bottom -= dy
+        for e in entities:
+            if e.deleted:
+                continue
+            if e.cullable:
+                l, t, r, b = e.bounds()
+                if r < left or l > right or b < top or t > bottom:
+                    culled += 1
+                    continue
+            e.draw(renderer, dx, dy)
+            drawn += 1
+    layer.drawn = drawn
+    layer.culled = culled
+
+
+def _untrack(entities):
+    """Stop snapshotting the interpolated ones of *entities* (left a layer)."""
+    from .director import director
+    for e in entities:
+        if e.interpolate:
+            director.untrack_interpolation(e)
+
+
+def _release(entities):
+    """Hand back the shared textures *entities* hold (layer cleared)."""
+    for e in entities:
+        release = getattr(e, "_release_texture", None)
+        if release is not None:
+            release()
+
+
+class _BaseLayer:
+    """What every layer has, whatever order it draws its entities in.
+
+    ``draw()`` shifts entities by *offset* and skips the ones outside
+    *view* (left, top, right, bottom, on screen); ``drawn`` and
+    ``culled`` count the entities of the last draw.  ``parallax`` is how
+    much the layer follows the scene camera (0: fixed on screen).
+    """
+
+    time_domain = None  # reactor domain of the actions of its nodes
+    parallax = 0.0      # camera offset factor
+    camera = None       # camera of the scene that created it
+    caches = False      # True for containers that cache their drawing
+    drawn = 0
+    culled = 0
+
+
+class Layer(_BaseLayer):
     """Unordered layer — entities drawn in arbitrary order (fast add/remove)."""
 
     def __init__(self, name):
@@ -17,14 +88,16 @@ class Layer:
 
     def add(self, entity):
         self._entities.add(entity)
+        damage.dirty = True
 
     def remove(self, entity):
-        self._entities.discard(entity)
+        if entity in self._entities:
+            self._entities.discard(entity)
+            _untrack((entity,))
+            damage.dirty = True
 
-    def draw(self, renderer):
-        for e in list(self._entities):
-            if not e.deleted:
-                e.draw(renderer)
+    def draw(self, renderer, view=None, offset=None):
+        _draw_entities(self, list(self._entities), renderer, view, offset)
 
     def __iter__(self):
         return iter(set(self._entities))
@@ -33,11 +106,14 @@ class Layer:
         return len(self._entities)
 
     def clear(self):
+        _untrack(self._entities)
+        _release(self._entities)
         self._entities.clear()
+        damage.dirty = True
 
 
-class StabileLayer:
-    """Ordered layer — entities drawn in insertion order."""
+class StabileLayer(_BaseLayer):
+    """Ordered layer — entities drawn in insertion order, culled like ``Layer``."""
 
     def __init__(self, name):
         self.name = name
@@ -48,19 +124,20 @@ class StabileLayer:
         if entity not in self._entity_set:
             self._entities.append(entity)
             self._entity_set.add(entity)
+            damage.dirty = True
 
     def remove(self, entity):
         if entity in self._entity_set:
             self._entity_set.discard(entity)
+            _untrack((entity,))
             try:
                 self._entities.remove(entity)
             except ValueError:
                 pass
+            damage.dirty = True
 
-    def draw(self, renderer):
-        for e in list(self._entities):
-            if not e.deleted:
-                e.draw(renderer)
+    def draw(self, renderer, view=None, offset=None):
+        _draw_entities(self, list(self._entities), renderer, view, offset)
 
     def __iter__(self):
         return iter(list(self._entities))
@@ -69,15 +146,20 @@ class StabileLayer:
         return len(self._entities)
 
     def clear(self):
+        _untrack(self._entities)
+        _release(self._entities)
         self._entities.clear()
         self._entity_set.clear()
+        damage.dirty = True
 
 
-class StaticLayer:
+class StaticLayer(_BaseLayer):
     """Static layer — renders entities once to a texture, then blits the cached result.
 
     Entities on static layers shouldn't change after creation.
-    Falls back to normal rendering if the cache can't be built.
+    Falls back to normal (culled) rendering if the cache can't be built.
+    The cache covers the screen at camera offset 0; a scrolling static
+    layer moves the cached image, so only what was on screen then shows.
     """
 
     def __init__(self, name):
@@ -92,27 +174,29 @@ class StaticLayer:
             self._entities.append(entity)
             self._entity_set.add(entity)
             self._dirty = True
+            damage.dirty = True
 
     def remove(self, entity):
         if entity in self._entity_set:
             self._entity_set.discard(entity)
+            _untrack((entity,))
             try:
                 self._entities.remove(entity)
             except ValueError:
                 pass
             self._dirty = True
+            damage.dirty = True
 
-    def draw(self, renderer):
+    def draw(self, renderer, view=None, offset=None):
         if self._dirty:
             self._rebuild(renderer)
         if self._cache_texture is not None:
             from pygame._sdl2.video import Image
+            dx, dy = offset if offset is not None else (0, 0)
             img = Image(self._cache_texture)
-            img.draw(dstrect=(0, 0, self._cache_texture.width, self._cache_texture.height))
+            img.draw(dstrect=(int(dx), int(dy), self._cache_texture.width, self._cache_texture.height))
         else:
-            for e in list(self._entities):
-                if not e.deleted:
-                    e.draw(renderer)
+            _draw_entities(self, list(self._entities), renderer, view, offset)
 
     def _rebuild(self, renderer):
         """Render all entities into a cached texture."""
@@ -141,10 +225,13 @@ class StaticLayer:
         return len(self._entities)
 
     def clear(self):
+        _untrack(self._entities)
+        _release(self._entities)
         self._entities.clear()
         self._entity_set.clear()
         self._dirty = True
         self._cache_texture = None
+        damage.dirty = True
 
 
 # ---------------------------------------------------------------------------
@@ -156,19 +243,36 @@ class Scene:
 
     Subclasses override ``init()``, ``enter()``, ``leave()``,
     ``realtick()``, and define ``handle_*`` event methods and
-    ``collision_X_Y`` callbacks.
+    ``collision_X_Y`` callbacks.  A scene covered by
+    ``director.push_scene()`` gets ``suspend()``, and ``resume()`` when
+    it is popped back, with its layers and actions intact.
+
+    ``max_fps`` overrides the Director's frame cap while the scene is
+    active (``None`` uses the Director's default, ``0`` is uncapped).
+    It caps drawing only: below the tick rate, realticks keep their rate.
+
+    ``chords`` maps a name to a tuple of keys; when the last key of a
+    chord goes down while the others are held, ``handle_chord`` receives
+    an event whose ``chord`` attribute is the name.
+
+    ``camera`` scrolls the layers created with a ``parallax`` factor;
+    it is back at (0, 0) every time the scene is entered.
     """
 
     collengine = None  # Set to RadialCollisions on subclasses that need it
+    max_fps = None
+    chords = {}
 
     def __init__(self, **kw):
         self._layers = {}       # name -> Layer
         self._layer_order = []  # insertion-ordered list of layer names
         self.event_handler = {}
         self.coll = None
+        self.suspended = False
         self._state = None
         self._state_realtick = None
         self._state_tick = None
+        self.camera = Camera()
         self._discover_handlers()
         self.init(**kw)
 
@@ -187,6 +291,7 @@ class Scene:
             "handle_mousebuttondown": pygame.MOUSEBUTTONDOWN,
             "handle_mousebuttonup": pygame.MOUSEBUTTONUP,
             "handle_mousemotion": pygame.MOUSEMOTION,
+            "handle_chord": CHORD,
         }
         for method_name, event_type in _event_map.items():
             method = getattr(self, method_name, None)
@@ -216,6 +321,7 @@ class Scene:
         # Reset layers
         self._layers.clear()
         self._layer_order.clear()
+        self.camera.reset()
         self.event_handler.clear()
         self._state = None
         self._state_realtick = None
@@ -226,9 +332,24 @@ class Scene:
 
     def _deactivate(self):
         """Called by Director when leaving this scene."""
+        self.suspended = False
         self.leave()
         if self.coll is not None:
             self.coll.clear()
+        # Entities left on the layers give their textures back; they
+        # take them again if they are ever drawn
+        for layer in self.ordered_layers:
+            _release(layer)
+
+    def _suspend(self):
+        """Called by Director when another scene is pushed on top."""
+        self.suspended = True
+        self.suspend()
+
+    def _resume(self):
+        """Called by Director when the scene on top is popped."""
+        self.suspended = False
+        self.resume()
 
     def enter(self):
         """User override — called when the scene becomes active."""
@@ -238,6 +359,14 @@ class Scene:
         """User override — called when the scene is deactivated."""
         pass
 
+    def suspend(self):
+        """User override — called when a scene is pushed on top of this one."""
+        pass
+
+    def resume(self):
+        """User override — called when this scene is on top again."""
+        pass
+
     def realtick(self):
         """User override — called at fixed rate (FPS) by the Director."""
         pass
@@ -268,27 +397,32 @@ class Scene:
     # Layer management
     # ------------------------------------------------------------------
 
-    def new_layer(self, name):
-        layer = Layer(name)
+    def _new_layer(self, cls, name, time_domain, parallax):
+        layer = cls(name)
+        layer.time_domain = time_domain
+        layer.parallax = parallax
+        layer.camera = self.camera
         self._layers[name] = layer
         self._layer_order.append(name)
         return layer
 
-    def new_static(self, name):
-        layer = StaticLayer(name)
-        self._layers[name] = layer
-        self._layer_order.append(name)
-        return layer
+    def new_layer(self, name, time_domain=None, parallax=0.0):
+        return self._new_layer(Layer, name, time_domain, parallax)
 
-    def new_stabile(self, name):
-        layer = StabileLayer(name)
-        self._layers[name] = layer
-        self._layer_order.append(name)
-        return layer
+    def new_static(self, name, time_domain=None, parallax=0.0):
+        return self._new_layer(StaticLayer, name, time_domain, parallax)
+
+    def new_stabile(self, name, time_domain=None, parallax=0.0):
+        return self._new_layer(StabileLayer, name, time_domain, parallax)
 
     def get_layer(self, name):
         return self._layers.get(name)
 
+    def draw_stats(self):
+        """Return ``{layer name: (drawn, culled)}`` for the last frame drawn."""
+        return dict((layer.name, (layer.drawn, layer.culled))
+                    for layer in self.ordered_layers)
+
     @property
     def ordered_layers(self):
         """Yield layers in creation order."""
@@ -0,0 +1,77 @@
+"""Tick-driven scheduler — timed callbacks run from the main loop."""
+
+import heapq
+
+
+class Timer:
+    """Handle for a scheduled callback.  ``cancel()`` is safe to call twice."""
+
+    __slots__ = ("due", "interval", "func", "args", "active")
+
+    def __init__(self, due, interval, func, args):
+        self.due = due
+        self.interval = interval
+        self.func = func
+        self.args = args
+        self.active = True
+
+    def cancel(self):
+        self.active = False
+
+
+class Scheduler:
+    """Min-heap of callbacks keyed on ticker time (milliseconds).
+
+    The Director calls ``run(now)`` once per frame with the ticker's
+    clock, so callbacks execute on the main thread and follow virtual
+    time in headless runs.  Delays are given in seconds, like actions.
+    Each reactor has one more on its own clock, ``Reactor.timers``, for
+    callbacks that should pause and scale with a scene.
+    """
+
+    def __init__(self):
+        self._heap = []
+        self._seq = 0       # tie-breaker: same due time runs in FIFO order
+        self.now = 0.0
+
+    def schedule(self, secs, func, *args):
+        """Call ``func(*args)`` once, *secs* seconds from now."""
+        return self._push(Timer(self.now + secs * 1000.0, None, func, args))
+
+    def schedule_interval(self, secs, func, *args):
+        """Call ``func(*args)`` every *secs* seconds until cancelled."""
+        interval = max(secs * 1000.0, 1.0)
+        return self._push(Timer(self.now + interval, interval, func, args))
+
+    def _push(self, timer):
+        self._seq += 1
+        heapq.heappush(self._heap, (timer.due, self._seq, timer))
+        return timer
+
+    def run(self, now):
+        """Fire every callback due at or before *now*."""
+        self.now = now
+        heap = self._heap
+        while heap and heap[0][0] <= now:
+            timer = heapq.heappop(heap)[2]
+            if not timer.active:
+                continue
+            if timer.interval is None:
+                timer.active = False
+            else:
+                timer.due += timer.interval
+                if timer.due <= now:
+                    # Fell behind by more than one interval: don't burst
+                    timer.due = now + timer.interval
+                self._push(timer)
+            timer.func(*timer.args)
+
+    def __len__(self):
+        """Number of pending, non-cancelled callbacks."""
+        return sum(1 for entry in self._heap if entry[2].active)
+
+    def clear(self, now=0.0):
+        for entry in self._heap:
+            entry[2].active = False
+        self._heap = []
+        self.now = now
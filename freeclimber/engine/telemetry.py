@@ -0,0 +1,141 @@
+"""Action telemetry — per-class counters, lifetimes and per-frame churn."""
+
+from bisect import bisect_left
+from collections import deque
+
+# Upper bounds (seconds) of the lifetime histogram buckets; one more
+# bucket holds everything longer
+LIFETIME_BUCKETS = (0.1, 0.25, 0.5, 1.0, 2.0, 5.0, 10.0, 30.0)
+
+
+class _Counts:
+
+    __slots__ = ("created", "internal", "started", "ended", "aborted", "live",
+                 "lifetimes")
+
+    def __init__(self):
+        self.created = 0        # started instances allocated (free list was empty)
+        self.internal = 0       # allocated for the engine's own helpers
+        self.started = 0
+        self.ended = 0
+        self.aborted = 0
+        self.live = 0
+        self.lifetimes = [0] * (len(LIFETIME_BUCKETS) + 1)
+
+
+class ActionStats:
+    """Counts what the action system does, per concrete action class.
+
+    Only actions that run on their own are counted (interval actions,
+    ``Timeline``, ``Broadcast``...): instant actions and combinators such
+    as ``Repeat`` and ``Parallel`` are not, the actions they start are.
+    An action aborted by its own ``end()`` counts as ended; the ones a
+    scene switch drops count as aborted.  ``live`` going up over time
+    means actions that never finish.  Instances the engine uses inside
+    other actions (``Broadcast`` scratch tweens, ``Timeline`` steps) are
+    never started; their allocations count as ``internal``, so
+    ``created`` against ``started`` is the pool miss rate.
+
+    Off by default; the Director sets ``now`` and calls ``end_frame()``,
+    which keeps the number of starts plus finishes per frame in
+    ``churn``.  Counting starts with the actions started while enabled.
+    """
+
+    def __init__(self, frames=240):
+        self.enabled = False
+        self.now = 0.0
+        self.churn = deque(maxlen=frames)
+        self._classes = {}
+        self._frame_churn = 0
+
+    def _counts(self, cls):
+        c = self._classes.get(cls)
+        if c is None:
+            c = self._classes[cls] = _Counts()
+        return c
+
+    def created(self, cls, internal=False):
+        if internal:
+            self._counts(cls).internal += 1
+        else:
+            self._counts(cls).created += 1
+
+    def started(self, action):
+        c = self._counts(type(action))
+        if action.__dict__.pop("_fresh", False):
+            c.created += 1
+        c.started += 1
+        c.live += 1
+        action._born = self.now
+        self._frame_churn += 1
+
+    def finished(self, action, aborted):
+        """Count the end of an action counted by ``started()``."""
+        c = self._counts(type(action))
+        if aborted:
+            c.aborted += 1
+        else:
+            c.ended += 1
+        c.live -= 1
+        c.lifetimes[bisect_left(LIFETIME_BUCKETS, self.now - action._born)] += 1
+        action._born = None
+        self._frame_churn += 1
+
+    def end_frame(self):
+        self.churn.append(self._frame_churn)
+        self._frame_churn = 0
+
+    def clear(self):
+        """Reset the counters, keeping the live counts."""
+        for cls, c in list(self._classes.items()):
+            live = c.live
+            c = self._classes[cls] = _Counts()
+            c.live = live
+        self.churn.clear()
+        self._frame_churn = 0
+
+    # ------------------------------------------------------------------
+    # Reports
+    # ------------------------------------------------------------------
+
+    def live(self, cls=None):
+        """Running actions of class *cls* (exact type), or of any class."""
+        if cls is not None:
+            c = self._classes.get(cls)
+            return c.live if c is not None else 0
+        return sum(c.live for c in self._classes.values())
+
+    def report(self):
+        """Return ``{class name: {counter: value}}``, most live first.
+
+        Counters are ``created``, ``internal``, ``started``, ``ended``,
+        ``aborted``, ``live`` and ``lifetimes`` (counts per
+        ``LIFETIME_BUCKETS`` bucket).
+        """
+        rows = sorted(self._classes.items(),
+                      key=lambda item: (-item[1].live, item[0].__name__))
+        return dict((cls.__name__, {
+            "created": c.created, "internal": c.internal,
+            "started": c.started, "ended": c.ended,
+            "aborted": c.aborted, "live": c.live,
+            "lifetimes": list(c.lifetimes)}) for cls, c in rows)
+
+    def churn_stats(self):
+        """Return ``(mean, max)`` starts plus finishes per frame."""
+        if not self.churn:
+            return (0.0, 0)
+        return (sum(self.churn) / float(len(self.churn)), max(self.churn))
+
+    def overlay_lines(self, top=6):
+        """Text lines for the profiler overlay."""
+        mean, peak = self.churn_stats()
+        lines = ["actions %d live, churn %.1f/frame (max %d)"
+                 % (self.live(), mean, peak),
+                 "%-18s %5s %7s %7s" % ("class", "live", "started", "aborted")]
+        for name, row in list(self.report().items())[:top]:
+            lines.append("%-18s %5d %7d %7d" % (
+                name[:18], row["live"], row["started"], row["aborted"]))
+        return lines
+
+
+action_stats = ActionStats()
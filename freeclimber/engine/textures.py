@@ -0,0 +1,95 @@
+"""Shared GPU textures, one per bitmap, for the current renderer."""
+
+from collections import OrderedDict
+
+
+class TextureCache:
+    """Uploads each ``_Bitmap`` once and hands out the same ``Texture``.
+
+    Entities ``acquire()`` the texture of their shape and ``release()`` it
+    when the shape changes, when they are deleted and when their layer
+    is cleared or their scene ends, so an animation frame flip only
+    swaps references.  Textures nobody holds stay cached, least
+    recently used first out, up to ``max_idle`` of them; those of
+    transient bitmaps are dropped right away instead.  Short-lived
+    users (particles) call ``get()``, which doesn't count a reference.
+
+    Alpha and colour modulation are set on the texture right before each
+    blit, so sharing one texture between entities is safe.  Bitmaps are
+    keyed by identity: a changed surface needs a new ``_Bitmap``.  The
+    cache empties itself when asked for a different renderer.
+    """
+
+    def __init__(self, max_idle=256):
+        self.max_idle = max_idle
+        self.uploads = 0
+        self._renderer = None
+        self._textures = {}     # bitmap -> Texture
+        self._refs = {}         # bitmap -> reference count (> 0)
+        self._idle = OrderedDict()  # unreferenced bitmaps, oldest first
+
+    def __len__(self):
+        return len(self._textures)
+
+    def __contains__(self, bitmap):
+        return bitmap in self._textures
+
+    def get(self, renderer, bitmap):
+        """Return the texture of *bitmap*, uploading it on first use."""
+        if renderer is not self._renderer:
+            self.clear()
+            self._renderer = renderer
+        tex = self._textures.get(bitmap)
+        if tex is None:
+            try:
+                from pygame._sdl2.video import Texture
+                tex = Texture.from_surface(renderer, bitmap.surface)
+            except Exception:
+                return None
+            self.uploads += 1
+            self._textures[bitmap] = tex
+            self._idle[bitmap] = True
+            self._evict()
+        elif bitmap in self._idle:
+            self._idle.move_to_end(bitmap)
+        return tex
+
+    def acquire(self, renderer, bitmap):
+        """Like ``get()``, and keep the texture until ``release()``."""
+        tex = self.get(renderer, bitmap)
+        if tex is not None:
+            self._refs[bitmap] = self._refs.get(bitmap, 0) + 1
+            self._idle.pop(bitmap, None)
+        return tex
+
+    def release(self, bitmap):
+        n = self._refs.get(bitmap)
+        if n is None:
+            return
+        if n > 1:
+            self._refs[bitmap] = n - 1
+            return
+        del self._refs[bitmap]
+        if bitmap.transient:
+            del self._textures[bitmap]
+            return
+        self._idle[bitmap] = True
+        self._evict()
+
+    def refs(self, bitmap):
+        return self._refs.get(bitmap, 0)
+
+    def _evict(self):
+        idle = self._idle
+        while len(idle) > self.max_idle:
+            bitmap = idle.popitem(last=False)[0]
+            del self._textures[bitmap]
+
+    def clear(self):
+        self._textures.clear()
+        self._refs.clear()
+        self._idle.clear()
+        self._renderer = None
+
+
+textures = TextureCache()
@@ -0,0 +1,159 @@
+"""Batch tween engine — advances every running tween of one kind at once.
+
+Needs NumPy; without it every tween ticks as a separate action, which is
+faster than a pure-Python batch would be.
+"""
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+# Batching can be switched off to tick every tween as a separate action
+enabled = numpy is not None
+
+# Mode codes; anything else (custom mode functions) is not batched
+STOP, REPEAT, PINGPONG = 0, 1, 2
+
+
+class TweenBatch:
+    """Rows of (start, delta, elapsed, secs, mode, ease) for one kind of tween.
+
+    Each row belongs to a running ``IntervalAction`` and holds *channels*
+    values.  ``tick()`` advances all rows in one vectorized pass, hands
+    the new values to ``apply(entities, values)`` and then ends the rows
+    whose ``StopMode`` tween is done.  Easing curves are applied from
+    their lookup tables, one masked pass per curve in use.
+
+    Tweens added during a tick (or before the first one) wait in a
+    pending list and start on the next tick, like reactor objects.
+    """
+
+    def __init__(self, channels, apply):
+        self.channels = channels
+        self.apply = apply
+        self._actions = []
+        self._pending = []
+        self._curves = [None]   # ease code -> Easing; 0 is no easing
+        self._alloc(64)
+
+    def _alloc(self, capacity):
+        n = len(self._actions)
+        start = numpy.zeros((capacity, self.channels))
+        delta = numpy.zeros((capacity, self.channels))
+        elapsed = numpy.zeros(capacity)
+        secs = numpy.zeros(capacity)
+        mode = numpy.zeros(capacity, dtype=numpy.int8)
+        ease = numpy.zeros(capacity, dtype=numpy.int16)
+        if n:
+            start[:n] = self._start[:n]
+            delta[:n] = self._delta[:n]
+            elapsed[:n] = self._elapsed[:n]
+            secs[:n] = self._secs[:n]
+            mode[:n] = self._mode[:n]
+            ease[:n] = self._ease[:n]
+        self._start, self._delta = start, delta
+        self._elapsed, self._secs, self._mode = elapsed, secs, mode
+        self._ease = ease
+
+    def __len__(self):
+        return len(self._actions) + len(self._pending)
+
+    def __iter__(self):
+        return iter(self._actions + self._pending)
+
+    def add(self, action):
+        """Queue *action*; its ``_tween_row()`` is read when it joins."""
+        action._batch = self
+        action._row = -1
+        self._pending.append(action)
+
+    def remove(self, action):
+        row = action._row
+        action._batch = None
+        action._row = None
+        if row is None:
+            return
+        if row < 0:
+            self._pending.remove(action)
+            return
+        actions = self._actions
+        last = len(actions) - 1
+        if row != last:
+            moved = actions[last]
+            actions[row] = moved
+            moved._row = row
+            self._start[row] = self._start[last]
+            self._delta[row] = self._delta[last]
+            self._elapsed[row] = self._elapsed[last]
+            self._secs[row] = self._secs[last]
+            self._mode[row] = self._mode[last]
+            self._ease[row] = self._ease[last]
+        actions.pop()
+
+    def _merge(self):
+        pending, self._pending = self._pending, []
+        actions = self._actions
+        for action in pending:
+            start, delta, secs, mode, ease = action._tween_row()
+            row = len(actions)
+            if row >= len(self._secs):
+                self._alloc(2 * len(self._secs))
+            self._start[row] = start
+            self._delta[row] = delta
+            self._elapsed[row] = 0.0
+            self._secs[row] = secs
+            self._mode[row] = mode
+            self._ease[row] = self._ease_code(ease)
+            actions.append(action)
+            action._row = row
+
+    def _ease_code(self, ease):
+        if ease is None:
+            return 0
+        try:
+            return self._curves.index(ease)
+        except ValueError:
+            self._curves.append(ease)
+            return len(self._curves) - 1
+
+    def tick(self, delta):
+        if self._pending:
+            self._merge()
+        actions = self._actions
+        n = len(actions)
+        if not n:
+            return
+        elapsed = self._elapsed[:n]
+        elapsed += delta
+        secs = self._secs[:n]
+        timed = secs > 0
+        raw = numpy.ones(n)
+        numpy.divide(elapsed, secs, out=raw, where=timed)
+        mode = self._mode[:n]
+        bounce = raw % 2.0
+        t = numpy.where(mode == STOP, numpy.clip(raw, 0.0, 1.0),
+                        numpy.where(mode == REPEAT, raw % 1.0,
+                                    numpy.where(bounce <= 1.0, bounce, 2.0 - bounce)))
+        if len(self._curves) > 1:
+            codes = self._ease[:n]
+            for code in numpy.unique(codes[codes > 0]).tolist():
+                m = codes == code
+                t[m] = self._curves[code].map_array(t[m])
+        values = self._start[:n] + self._delta[:n] * t[:, None]
+        finished = numpy.flatnonzero((mode == STOP) & (raw >= 1.0))
+        done = [actions[i] for i in finished.tolist()]
+        self.apply([a.entity for a in actions], values.tolist())
+        for action in done:
+            # An earlier end() may have aborted this one already, and its
+            # pooled instance may be back as a pending tween
+            if action._batch is self and action._row >= 0:
+                action.end()
+
+    def clear(self):
+        for action in self._actions + self._pending:
+            action._batch = None
+            action._row = None
+        self._actions = []
+        self._pending = []
+        self._alloc(64)
@@ -42,7 +42,7 @@ def set_ticker(ticker, resolution):
 def main():
 
     pygame.mixer.pre_init(44100, -16, 2, 3702)
-    screen.init(SELECTED_RESOLUTION, fullscreen=FULLSCREEN, title="FreeClimber")
+    screen.init(SELECTED_RESOLUTION, fullscreen=FULLSCREEN, title="FreeClimber", vsync=VSYNC)
     try:
         icon = pygame.transform.scale(pygame.image.load(os.path.join(LINUX_GAME_PATH, 'images', 'climber', 'female', 'miniclimber_10.png')).convert_alpha(), (32, 32))
         screen._window.set_icon(icon)
@@ -55,6 +55,10 @@ def main():
             formatExceptionInfo()
 
     set_ticker(director.ticker, FPS)
+    director.ticker.set_fixed_step(FIXED_STEP)
+    director.pacer.max_fps = MAX_FPS
+    director.profiler.enabled = PROFILE
+    director.action_stats.enabled = PROFILE
     menu = Menu()
     intro = Intro(next_scene=menu, previous_scene=None)
     director.run(intro)
@@ -69,6 +73,14 @@ def main():
         print("accuracy rate %d%%" % ((director.realticks * 100) / (director.secs * director.ticker.resolution)))
     except ZeroDivisionError:
         formatExceptionInfo()
+    if PROFILE:
+        for name, secs in director.profiler.averages().items():
+            print("%-20s %.2f ms" % (name, secs * 1000.0))
+        director.profiler.dump_csv("freeclimber-profile.csv")
+        print("actions: churn %.1f/frame (max %d)" % director.action_stats.churn_stats())
+        for name, row in director.action_stats.report().items():
+            print("%-20s %5d live %7d started %7d aborted" % (
+                name, row["live"], row["started"], row["aborted"]))
     pygame.quit()
     director.quit()
     director.running = True
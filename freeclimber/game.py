@@ -10,7 +10,7 @@ from .config import *
 from .weather import *
 from .building import *
 from .actors import *
-import threading
+from glob import glob
 
 SELECTED_RESOLUTION = get_game_resolution()
 
@@ -30,6 +30,15 @@ class Game(Scene):
     ## nicely inside a circle.
     collengine = RadialCollisions
 
+    ## Two-key moves, resolved by the engine's input queue at poll time.
+    chords = {
+        'down': (K_s, K_k),
+        'up_right': (K_s, K_i),
+        'up_left': (K_w, K_k),
+        'right': (K_d, K_l),
+        'left': (K_a, K_j),
+    }
+
     def init(self, next_scene = None, previous_scene = None):
         self.next_scene = next_scene
         self.previous_scene = previous_scene
@@ -38,6 +47,7 @@ class Game(Scene):
         self.game_finished = False
         self.color_player = None
         self.secs = []
+        self.timer = None
 
 
     def enter(self, theme = 'default'):
@@ -54,27 +64,37 @@ class Game(Scene):
             debug("Modo demostración")
 
 
+    def leave(self):
+        if self.timer is not None:
+            self.timer.cancel()
+            self.timer = None
+
     def state_loading_realtick(self):
         debug("Cargando juego...")
         theme = self.theme
 
         if self.i == 0:
+            ## Decode every sprite in the background while the
+            ## loading screen keeps animating.
+            self.prefetch = resources.prefetch(self.sprite_paths(theme))
+
             self.msg.set_text("Cargando capas...")
             self.msg.set(centerx=SELECTED_RESOLUTION[0]//2, centery=SELECTED_RESOLUTION[1]//2).place("load")
 
             self.new_static("bg")
 
-            ## The actors layer contains the ship and bullets.
-            self.new_layer("city")
+            ## The building layers follow the camera, the city a
+            ## little; the sky, the HUD and the menus stay in place.
+            self.new_layer("city", parallax=CITY_PARALLAX)
             self.new_layer("weather_b")
             self.new_layer("particles")
-            self.new_layer("dummy")
-            self.new_layer("room")
-            self.new_layer("glass")
-            self.new_stabile("building")
-            self.new_stabile("actors")
+            self.new_layer("dummy", parallax=1)
+            self.new_layer("room", parallax=1)
+            self.new_layer("glass", parallax=1)
+            self.new_stabile("building", parallax=1)
+            self.new_stabile("actors", parallax=1)
 
-            self.new_layer("weather_f")
+            self.new_layer("weather_f", parallax=1)
             self.new_stabile("info")
             self.new_layer("points")
             self.new_stabile("pausa")
@@ -110,6 +130,13 @@ class Game(Scene):
             debug("Musica cargada")
 
         elif self.i == 3:
+            if not self.prefetch.finished:
+                self.msg.set_text("Cargando imagenes... %d%%" % (self.prefetch.fraction*100))
+                self.msg.set(centerx=SELECTED_RESOLUTION[0]//2, centery=SELECTED_RESOLUTION[1]//2)
+                return
+            ## Pack the theme, climber and common sprites into a few
+            ## atlas textures, so the renderer rarely switches textures.
+            resources.build_atlas(self.sprite_paths(theme))
             self.msg.set_text("Cargando escenario...")
             self.msg.set(centerx=SELECTED_RESOLUTION[0]//2, centery=SELECTED_RESOLUTION[1]//2).place("load")
             self.system = TestSystem()
@@ -157,7 +184,7 @@ class Game(Scene):
             self.mensaje = TextEntity(GLFont((_GPUTEK_FONT, SELECTED_RESOLUTION[0]//24),(255,165,0)), "Modo DEMO")
             self.mensaje.set(right=SELECTED_RESOLUTION[0]*39//40, bottom=SELECTED_RESOLUTION[1]*39//40).place("info")
             self.mensaje.do(Blink(0.5, 0.25))
-            now = pygame.time.get_ticks()
+            now = director.get_ticks()
             self.prev_movement = now
             self.next_movement = now
             debug("Demo preparada")
@@ -173,6 +200,15 @@ class Game(Scene):
                 e.do(Hide())
         self.i +=1
 
+    def sprite_paths(self, theme):
+        images = os.path.join(LINUX_GAME_PATH, 'images')
+        paths = set(glob(os.path.join(images, 'stages', theme, '*.png')))
+        paths.update(glob(os.path.join(images, 'stages', 'default', '*.png')))
+        paths.update(glob(os.path.join(images, 'climber', 'female', '*.png')))
+        paths.update(glob(os.path.join(images, 'climber', '*.png')))
+        paths.update(glob(os.path.join(images, 'common', '*.png')))
+        return sorted(paths)
+
     def enter_netGame(self):
         self.msg.set_text("Cargando cuenta atras...")
         self.msg.set(centerx=SELECTED_RESOLUTION[0]//2, centery=SELECTED_RESOLUTION[1]//2).place("load")
@@ -188,8 +224,7 @@ class Game(Scene):
                 e.do(Hide())
         if len(self.secs) :
             self.secs.pop().do(Show()+Delay(0.1)+CenteredScale(0,0.9,center)+Delete())
-            self.timer = threading.Timer(1.25, self.countdown)
-            self.timer.start()
+            self.timer = director.reactor.timers.schedule(1.25, self.countdown)
 
     def collision_player_bonus(self, player, item):
         if item.destroyed or self.is_paused():
@@ -207,21 +242,13 @@ class Game(Scene):
         self.player.lifes += 1
         self.player.update()
 
+    ## Both scroll the camera; the player stays where it is in the
+    ## building and the parallax layers follow.
     def subir(self):
         self.escenario.bajar(-self.player.height, secs= 0.25)
-        self.player.do(MoveDelta(0, -self.player.height, secs= 0.25))
-        for e in self.get_layer("weather_f"):
-            e.do(MoveDelta(0,-self.player.height, secs= 0.50))
-        for e in self.get_layer("city"):
-            e.do(MoveDelta(0,-self.player.height//16, secs= 0.50))
 
     def bajar(self):
         self.escenario.subir(SELECTED_RESOLUTION[1]//2, secs= 0.50)
-        self.player.do(MoveDelta(0, SELECTED_RESOLUTION[1]//2, secs= 0.50))
-        for e in self.get_layer("weather_f"):
-            e.do(MoveDelta(0,SELECTED_RESOLUTION[1]//2, secs= 0.50))
-        for e in self.get_layer("city"):
-            e.do(MoveDelta(0,SELECTED_RESOLUTION[1]//20, secs= 0.50))
 
     def collision_player_life1up(self, player, item):
         debug("Colision: vida extra")
@@ -229,7 +256,9 @@ class Game(Scene):
             return 0
         play_audio('bien.ogg',0.75)
         item.destroyed = True
-        item.do(MoveTo(player.lifeboard.right, player.lifeboard.centery, 1.0))
+        ## The life board is on screen, the item in the building
+        x, y = item.to_world(player.lifeboard.right, player.lifeboard.centery)
+        item.do(MoveTo(x, y, 1.0))
         item.do(Delay(0.9) + CallFunc(self.life1up))
         item.do(Delay(0.7) + CallFunc(item.destroy))
 
@@ -252,7 +281,7 @@ class Game(Scene):
         Supertirititran(scale = player.scale)
         play_audio('supertirititran.ogg',0.75)
         #play_audio('lema.wav')
-        player.do(Repeat(AlphaFade(200,0.5)+AlphaFade(128, 0.5), times=10)+AlphaFade(255,1.0))
+        player.do(Timeline(AlphaFade(200,0.5)+AlphaFade(128, 0.5), times=10)+AlphaFade(255,1.0))
 
 
     def collision_player_bomb(self, player, item):
@@ -299,7 +328,7 @@ class Game(Scene):
             self.cd.set(centerx=SELECTED_RESOLUTION[0]//2, centery=SELECTED_RESOLUTION[1]*3//4, scale = SELECTED_RESOLUTION[0]/(2*float(self.cd.width))).place("info")
             self.cd.do(ColorFade(colormap[self.player.color_player], 0.5))
             scale = self.cd.scale
-            self.cd.do(Repeat(Delay(0.4)+CenteredScale(scale*1.1, 0.5, (SELECTED_RESOLUTION[0]//2, SELECTED_RESOLUTION[1]*3//4))+CenteredScale(scale, 0.1, (SELECTED_RESOLUTION[0]//2, SELECTED_RESOLUTION[1]*3//4)), times=10)+CallFunc(self.exit_game))
+            self.cd.do(Timeline(Delay(0.4)+CenteredScale(scale*1.1, 0.5, (SELECTED_RESOLUTION[0]//2, SELECTED_RESOLUTION[1]*3//4))+CenteredScale(scale, 0.1, (SELECTED_RESOLUTION[0]//2, SELECTED_RESOLUTION[1]*3//4)), times=10)+CallFunc(self.exit_game))
         else:
             if VOLUME:
                 try:
@@ -313,29 +342,26 @@ class Game(Scene):
             self.cd = Entity(os.path.join(LINUX_GAME_PATH, 'images', 'common', 'gameover.png'))
             self.cd.set(centerx=SELECTED_RESOLUTION[0]//2, centery=SELECTED_RESOLUTION[1]//2, scale = SELECTED_RESOLUTION[0]/(2*float(self.cd.width))).place("info")
             scale = self.cd.scale
-            self.cd.do(Repeat(Delay(0.4)+CenteredScale(scale*1.1, 0.5, (SELECTED_RESOLUTION[0]//2, SELECTED_RESOLUTION[1]//2))+CenteredScale(scale, 0.1, (SELECTED_RESOLUTION[0]//2, SELECTED_RESOLUTION[1]//2)), times=10)+CallFunc(self.exit_game))
+            self.cd.do(Timeline(Delay(0.4)+CenteredScale(scale*1.1, 0.5, (SELECTED_RESOLUTION[0]//2, SELECTED_RESOLUTION[1]//2))+CenteredScale(scale, 0.1, (SELECTED_RESOLUTION[0]//2, SELECTED_RESOLUTION[1]//2)), times=10)+CallFunc(self.exit_game))
 
 
     def set_previous_scene(self, scene):
         self.previous_scene = scene
 
+    ## Pausing freezes the scene's clock: every action, emitter and timer stops
+    ## where it is (windows stay half closed) and goes on from there.
     def pause(self):
         if self.paused:
             self.pausedbg.do(Hide())
             self.pausedmsg.do(Hide())
             self.paused = False
-            for e in self.interrupted:
-                e.close_window(True)
-                self.interrupted.remove(e)
+            self.max_fps = None
         else:
-            self.interrupted = []
-            for e in self.get_layer("dummy"):
-                if isinstance(e, MetaWindow):
-                    if e.close_window(False):
-                        self.interrupted.append(e)
             self.pausedbg.do(Show())
             self.pausedmsg.do(Show())
             self.paused = True
+            self.max_fps = PAUSE_FPS
+        director.reactor.paused = self.paused
         try:
             pygame.mixer.music.fadeout(2000)
         except:
@@ -344,7 +370,9 @@ class Game(Scene):
 
     def exit_game(self):
         debug("Saliendo del juego...")
-        if self.previous_scene is not None:
+        if self.previous_scene is not None and self.previous_scene.suspended:
+            director.pop_scene()
+        elif self.previous_scene is not None:
             director.set_scene(self.previous_scene)
         else:
             director.quit()
@@ -363,7 +391,7 @@ class Game(Scene):
             debug("Decidiendo movimiento...")
             self.ia()
 
-        if not self.player.ismoving(): # scroll
+        if not self.player.ismoving() and not self.camera.has_actions(): # scroll
             debug("Comprobación de estados")
 
             if self.player.last_movement == "fall":
@@ -374,10 +402,10 @@ class Game(Scene):
                 self.player.move("fall")
                 play_audio('ups.ogg')
 
-            elif self.player.y < SELECTED_RESOLUTION[1]//4 and self.player.manos == 2:
+            elif self.player.screen_pos()[1] < SELECTED_RESOLUTION[1]//4 and self.player.manos == 2:
                 self.bajar()
 
-            elif self.player.y > SELECTED_RESOLUTION[1]*5//6 and self.player.manos == 2:
+            elif self.player.screen_pos()[1] > SELECTED_RESOLUTION[1]*5//6 and self.player.manos == 2:
                 self.subir()
 
             elif not self.game_finished and (self.player.level >= self.escenario.dim[0] and self.player.manos == 2) or self.player.lifes == 0: # game over
@@ -412,18 +440,22 @@ class Game(Scene):
             self.pause()
         if self.is_paused():
             return 0
-        keys = pygame.key.get_pressed()
-        if ((ev.key == K_s and keys[K_k]) or (ev.key == K_KP2)):
+        if ev.key == K_KP2:
             self.player.move('down', stage = self.escenario.escenario)
-        elif ((ev.key == K_i and keys[K_s]) or (ev.key == K_s and keys[K_i]) or (ev.key == K_KP9)):
+        elif ev.key == K_KP9:
             self.player.move('up_right', stage = self.escenario.escenario)
-        elif ((ev.key == K_w and keys[K_k]) or (ev.key == K_k and keys[K_w]) or (ev.key == K_KP7)):
+        elif ev.key == K_KP7:
             self.player.move('up_left', stage = self.escenario.escenario)
-        elif ((ev.key == K_d and keys[K_l]) or (ev.key == K_l and keys[K_d]) or (ev.key == K_KP6)):
+        elif ev.key == K_KP6:
             self.player.move('right', stage = self.escenario.escenario)
-        elif ((ev.key == K_a and keys[K_j]) or (ev.key == K_j and keys[K_a]) or (ev.key == K_KP4)):
+        elif ev.key == K_KP4:
             self.player.move('left', stage = self.escenario.escenario)
 
+    def handle_chord(self, ev):
+        if self.is_paused():
+            return 0
+        self.player.move(ev.chord, stage = self.escenario.escenario)
+
     def handle_joybuttondown(self, ev):
         if ev.button == 9:
             self.pause()
@@ -437,15 +469,16 @@ class Game(Scene):
     def handle_joyaxismotion(self, ev):
         if self.is_paused() or self.demo_mode:
             return 0
-        if ev.axis == 3 and ev.value < -0.2:
+        value = ev.peak     # coalesced motion: act on the largest deflection
+        if ev.axis == 3 and value < -0.2:
             self.player.move('up_right', stage = self.escenario.escenario)
-        elif ev.axis == 1 and ev.value < -0.9:
+        elif ev.axis == 1 and value < -0.9:
             self.player.move('up_left', stage = self.escenario.escenario)
-        elif ev.axis == 0 and ev.value < -0.9:
+        elif ev.axis == 0 and value < -0.9:
             self.player.move('left', stage = self.escenario.escenario)
-        elif ev.axis == 4 and ev.value > 0.8:
+        elif ev.axis == 4 and value > 0.8:
             self.player.move('right', stage = self.escenario.escenario)
-        if (ev.axis == 3 and ev.value > 0.5) or (ev.axis == 1 and ev.value > 0.9):
+        if (ev.axis == 3 and value > 0.5) or (ev.axis == 1 and value > 0.9):
             self.player.move('down', stage = self.escenario.escenario)
 
 
@@ -467,7 +500,7 @@ class Game(Scene):
                 formatExceptionInfo()
 
     def ia(self):
-        now = pygame.time.get_ticks()
+        now = director.get_ticks()
         if now > self.next_movement:
             self.prev_movement = now
             self.next_movement += self.player.auto_move(self.escenario.escenario)
@@ -29,6 +29,8 @@ class Logo(Entity):
 
 class Intro(Scene):
 
+    max_fps = MENU_FPS
+
     def init(self, next_scene=None, previous_scene=None):
         self.next_scene = next_scene
         self.previous_scene = previous_scene
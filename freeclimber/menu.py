@@ -1,7 +1,6 @@
 # -*- coding: utf-8 -*-
 
 import os
-import threading
 import pygame
 from pygame.locals import *
 from .engine import *
@@ -47,6 +46,8 @@ class MenuAnimation(Entity):
 
 class Menu(Scene):
 
+    max_fps = MENU_FPS
+
     def init(self, **kw):
         self._selected = 0
         self._options = ["EMPEZAR", "SALIR"]
@@ -63,17 +64,7 @@ class Menu(Scene):
         self.new_stabile("ui")
 
         screen.clear_color = (255, 255, 255, 255)
-
-        # Music
-        if VOLUME:
-            try:
-                pygame.mixer.music.stop()
-                pygame.mixer.music.set_volume(VOLUME * 0.01)
-                pygame.mixer.music.load(
-                    os.path.join(LINUX_GAME_PATH, MUSIC_PATH, 'menuintro.ogg'))
-                pygame.mixer.music.play(-1)
-            except Exception:
-                formatExceptionInfo()
+        self._play_music()
 
         W, H = SELECTED_RESOLUTION
 
@@ -117,6 +108,33 @@ class Menu(Scene):
     def leave(self):
         self._cancel_idle_timer()
 
+    def suspend(self):
+        # The demo timer keeps running: it pops the demo game
+        self._cancel_idle_timer()
+
+    def resume(self):
+        # Back from a pushed Game: layers and animation are still loaded
+        self._cancel_demo_timer()
+        self._selected = 0
+        self._update_colors()
+        self._play_music()
+        self._bg.do(AlphaFade(255, 1.0))
+        self._title.do(AlphaFade(255, 1.5))
+        for te in self._opt_entities:
+            te.do(AlphaFade(255, 1.0))
+        self._reset_idle_timer()
+
+    def _play_music(self):
+        if VOLUME:
+            try:
+                pygame.mixer.music.stop()
+                pygame.mixer.music.set_volume(VOLUME * 0.01)
+                pygame.mixer.music.load(
+                    os.path.join(LINUX_GAME_PATH, MUSIC_PATH, 'menuintro.ogg'))
+                pygame.mixer.music.play(-1)
+            except Exception:
+                formatExceptionInfo()
+
     # ------------------------------------------------------------------
     # Timers
     # ------------------------------------------------------------------
@@ -128,9 +146,7 @@ class Menu(Scene):
 
     def _reset_idle_timer(self):
         self._cancel_idle_timer()
-        self._idle_timer = threading.Timer(DEMO_IDLE_SECS, self._start_demo)
-        self._idle_timer.daemon = True
-        self._idle_timer.start()
+        self._idle_timer = director.scheduler.schedule(DEMO_IDLE_SECS, self._start_demo)
 
     def _cancel_demo_timer(self):
         if self._demo_timer is not None:
@@ -142,14 +158,13 @@ class Menu(Scene):
         from .game import Game
         juego = Game(previous_scene=self)
         juego.demo_mode = True
-        self._demo_timer = threading.Timer(DEMO_PLAY_SECS, self._end_demo)
-        self._demo_timer.daemon = True
-        self._demo_timer.start()
-        director.set_scene(juego)
+        self._demo_timer = director.scheduler.schedule(DEMO_PLAY_SECS, self._end_demo)
+        director.push_scene(juego)
 
     def _end_demo(self):
         self._demo_timer = None
-        director.set_scene(self)
+        if self.suspended:
+            director.pop_scene()
 
     # ------------------------------------------------------------------
     # Selection
@@ -178,7 +193,7 @@ class Menu(Scene):
                 te.do(AlphaFade(0, 1.0))
             self._title.do(AlphaFade(0, 1.5))
             self._bg.do(AlphaFade(0, 2.0)
-                        + CallFunc(director.set_scene, juego))
+                        + CallFunc(director.push_scene, juego))
         else:
             self._quit()
 
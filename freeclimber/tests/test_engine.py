@@ -44,6 +44,426 @@ def test_ticker():
     print("  [OK] Ticker")
 
 
+def test_ticker_fixed_step():
+    from freeclimber.engine import Ticker
+    t = Ticker(40)
+    t.reset()
+    t.set_fixed_step(True, max_steps=3)
+
+    t._accumulate(30)
+    assert t.steps == 1 and t.realtick
+    assert abs(t.alpha - 0.2) < 1e-6
+
+    # 4 steps due, only 3 allowed; the excess is dropped
+    t._accumulate(95)
+    assert t.steps == 3
+    assert t.dropped_ticks == 1
+    assert t.accumulator < t.tick_delay
+
+    # A long stall is clamped to max_frame_time
+    t._accumulate(10000)
+    assert t.steps == 3
+    assert t.dropped_ticks > 100
+    print("  [OK] Ticker fixed step")
+
+
+def test_interpolation_tracking():
+    from freeclimber.engine import director, Scene, Node
+
+    class Smooth(Node):
+        interpolate = True
+
+    scene = Scene()
+    director.scene = scene
+    try:
+        scene.new_layer("a")
+        scene.new_stabile("b")
+        a, b, c = [Smooth().place("a") for i in range(3)]
+        seen = [len(director._interpolated)]
+        b.place("b")                        # moved: still tracked
+        seen.append(len(director._interpolated))
+        scene.get_layer("b").remove(b)
+        a.delete()
+        seen.append(len(director._interpolated))
+        scene.get_layer("a").clear()
+        seen.append(len(director._interpolated))
+    finally:
+        director.scene = None
+    assert seen == [3, 3, 1, 0]
+    print("  [OK] Interpolation tracking")
+
+
+def _sim_time():
+    """``(ms clock, pacer clock, pacer sleep)`` on one virtual timeline.
+
+    Sleeping advances it; every read of the pacer clock costs 0.1 ms,
+    so busy-waits end.
+    """
+    now = [0.0]
+
+    def ms():
+        return now[0]
+
+    def clock():
+        now[0] += 0.1
+        return now[0] / 1000.0
+
+    def sleep(secs):
+        now[0] += secs * 1000.0
+
+    return ms, clock, sleep
+
+
+def test_frame_pacer():
+    from freeclimber.engine import FramePacer
+
+    ms, clock, sleep = _sim_time()
+    p = FramePacer(max_fps=100, clock=clock, sleep=sleep)
+    p.wait()
+    start = ms()
+    for _ in range(5):
+        p.wait()
+    assert 50.0 <= ms() - start < 51.0      # five 10 ms frames
+    assert abs(p.frame_time - 0.01) < 0.001
+
+    # Per-call override: 0 means uncapped
+    start = ms()
+    for _ in range(5):
+        p.wait(0)
+    assert ms() - start < 2.0               # only the clock reads
+    print("  [OK] FramePacer")
+
+
+def test_frame_cap_keeps_tick_rate():
+    from pygame._sdl2.video import Window, Renderer
+    from freeclimber.engine import director, Scene, Entity, FramePacer
+    from freeclimber.engine.resources import _Bitmap
+
+    class Counter(Entity):
+        draws = 0
+
+        def draw(self, renderer, dx=0.0, dy=0.0):
+            Counter.draws += 1
+
+    class Paused(Scene):
+        max_fps = 10                    # below the 40 Hz tick rate
+
+        def enter(self):
+            self.new_layer("bg")
+            self.sprite = Counter(_Bitmap(pygame.Surface((4, 4)))).place("bg")
+            self.steps = []
+
+        def realtick(self):
+            self.sprite.x += 1          # something to draw every tick
+            self.steps.append(director.ticker.steps)
+            if director.realticks == 40:
+                director.quit()
+
+    ms, clock, sleep = _sim_time()
+    window = Window("cap", (64, 64))
+    saved = (director._renderer, director.pacer, director.ticker.clock)
+    director._renderer = Renderer(window)
+    director.pacer = FramePacer(clock=clock, sleep=sleep)
+    director.ticker.clock = ms
+    director.ticker.set_fixed_step(True)
+    try:
+        scene = Paused()
+        director.run(scene)
+    finally:
+        director.ticker.set_fixed_step(False)
+        director._renderer, director.pacer, director.ticker.clock = saved
+        director.input.latency.clear()      # window events
+        del window
+    # One second: 40 realticks one step at a time, a frame every 100 ms
+    # counting the first
+    assert scene.steps == [1] * 40, scene.steps
+    assert Counter.draws == 11, Counter.draws
+    assert 1000.0 <= ms() < 1030.0
+    print("  [OK] Frame cap keeps the tick rate")
+
+
+def test_headless_run():
+    from freeclimber.engine import director, Scene, Node, MoveDelta
+
+    class Walk(Scene):
+        def enter(self):
+            self.new_layer("actors")
+            self.node = Node()
+            self.node.do(MoveDelta(100, 0, 1.0))
+            self.realticks = 0
+
+        def realtick(self):
+            self.realticks += 1
+            self.now = director.get_ticks()
+
+    def run():
+        scene = Walk()
+        n = director.run_headless(scene, realticks=20)
+        return n, scene.realticks, scene.node.x, scene.now
+
+    first = run()
+    assert first[0] == 20
+    assert first[1] == 20
+    # 20 realticks at 40 Hz is half a second on the virtual clock
+    assert abs(first[2] - 50.0) < 1e-6
+    assert first[3] == 500.0
+    assert run() == first  # deterministic
+    assert director.headless is False
+    print("  [OK] Headless run")
+
+
+def test_frame_profiler():
+    import csv
+    import tempfile
+    from freeclimber.engine import director, Scene
+
+    class Idle(Scene):
+        def enter(self):
+            self.new_layer("bg")
+
+    director.profiler.enabled = True
+    try:
+        director.profiler.clear()
+        director.run_headless(Idle, realticks=10)
+    finally:
+        director.profiler.enabled = False
+    prof = director.profiler
+    assert len(prof.frames) == 10
+    for phase in ("collisions", "events", "realtick", "tick", "reactor"):
+        assert phase in prof.phases
+    avg = prof.averages()
+    assert avg["total"] >= avg["reactor"]
+
+    with tempfile.NamedTemporaryFile("r", suffix=".csv") as f:
+        prof.dump_csv(f.name)
+        rows = list(csv.reader(f))
+    assert rows[0][:2] == ["frame", "total"]
+    assert len(rows) == 11
+    print("  [OK] Frame profiler")
+
+
+def test_scheduler():
+    from freeclimber.engine import Scheduler
+
+    s = Scheduler()
+    s.clear(1000.0)
+    fired = []
+    s.schedule(0.5, fired.append, "b")
+    s.schedule(0.25, fired.append, "a")
+    dropped = s.schedule(0.3, fired.append, "x")
+    every = s.schedule_interval(0.2, fired.append, "tick")
+    dropped.cancel()
+    assert len(s) == 3
+
+    s.run(1100.0)
+    assert fired == []
+    s.run(1250.0)
+    assert fired == ["tick", "a"]
+    s.run(1500.0)
+    assert fired == ["tick", "a", "tick", "b"]
+    every.cancel()
+    s.run(5000.0)
+    assert fired == ["tick", "a", "tick", "b"]
+    assert len(s) == 0
+    print("  [OK] Scheduler")
+
+
+def test_scheduler_headless():
+    from freeclimber.engine import director, Scene
+
+    class Countdown(Scene):
+        def enter(self):
+            self.fired = []
+            director.scheduler.schedule(1.0, self.fired.append, director.get_ticks)
+
+    scene = Countdown()
+    director.run_headless(scene, realticks=39)
+    assert scene.fired == []
+    scene = Countdown()
+    director.run_headless(scene, realticks=41)
+    assert len(scene.fired) == 1
+    print("  [OK] Scheduler on virtual time")
+
+
+def test_scheduler_pause():
+    from freeclimber.engine import director, Scene
+
+    class Paused(Scene):
+        def enter(self):
+            self.fired = []
+            director.reactor.timers.schedule(0.5, self.fire, "scene")
+            director.scheduler.schedule(0.5, self.fire, "global")
+
+        def fire(self, name):
+            self.fired.append((name, director.realticks))
+
+        def realtick(self):
+            if director.realticks == 10:
+                director.reactor.paused = True
+            elif director.realticks == 50:
+                director.reactor.paused = False
+                director.reactor.scale = 0.5
+
+    scene = Paused()
+    director.run_headless(scene, realticks=80)
+    # 225 ms before the pause, 40 realticks paused, then the other 275 ms
+    # at half speed; the global scheduler keeps ticker time
+    assert scene.fired == [("global", 19), ("scene", 71)], scene.fired
+    print("  [OK] Reactor timers pause with the scene")
+
+
+def test_scene_stack():
+    from freeclimber.engine import director, Scene, Node, MoveDelta
+
+    log = []
+
+    class Top(Scene):
+        def enter(self):
+            log.append("top enter")
+            self.n = 0
+
+        def leave(self):
+            log.append("top leave")
+
+        def realtick(self):
+            self.n += 1
+            if self.n == 5:
+                director.pop_scene()
+
+    class Base(Scene):
+        def enter(self):
+            log.append("base enter")
+            self.new_layer("actors")
+            self.node = Node()
+            self.node.do(MoveDelta(100, 0, 1.0))
+            self.n = 0
+
+        def suspend(self):
+            log.append("suspend")
+
+        def resume(self):
+            log.append("resume")
+
+        def realtick(self):
+            self.n += 1
+            if self.n == 10:
+                director.push_scene(Top)
+
+    base = Base()
+    director.run_headless(base, realticks=30)
+    assert log == ["base enter", "suspend", "top enter", "top leave",
+                   "resume"], log
+    # 25 realticks on the base scene; the move is frozen while covered
+    assert base.n == 25
+    assert abs(base.node.x - 62.5) < 1e-6, base.node.x
+    assert director.scene_stack == []
+    assert not base.suspended
+    print("  [OK] Scene stack")
+
+
+def test_abort_suspended_action():
+    from freeclimber.engine import director, Scene, Node, Delay, Blink
+
+    class Top(Scene):
+        def enter(self):
+            self.new_layer("hud")
+            self.n = 0
+
+        def realtick(self):
+            self.n += 1
+            if self.n == 1:
+                base.node.abort_actions()       # runs in the covered scene
+                self.other = Node()
+                self.other.do(Blink(0.05))      # reuses the pooled instance
+            elif self.n == 3:
+                director.pop_scene()
+
+    class Base(Scene):
+        def enter(self):
+            self.new_layer("actors")
+            self.node = Node()
+            self.node.do(Blink(0.05), Delay(10.0))
+            self.n = 0
+
+        def realtick(self):
+            self.n += 1
+            if self.n == 2:
+                self.resumed = len(director.reactor)
+                director.quit()
+            elif self.n == 1 and not director.scene_stack:
+                director.push_scene(Top)
+
+    base = Base()
+    director.run_headless(base, realticks=10)
+    assert base.resumed == 0                    # nothing left behind
+    assert not base.node.hidden
+    print("  [OK] Abort in a suspended scene")
+
+
+def test_input_queue():
+    from freeclimber.engine import InputQueue, CHORD
+
+    Event = pygame.event.Event
+    q = InputQueue()
+    chords = {"up_right": (pygame.K_s, pygame.K_i)}
+    q.poll(10, chords, [Event(pygame.KEYDOWN, key=pygame.K_s)])
+    q.poll(20, chords, [
+        Event(pygame.KEYDOWN, key=pygame.K_i),
+        Event(pygame.JOYAXISMOTION, instance_id=0, axis=1, value=-0.3),
+        Event(pygame.JOYAXISMOTION, instance_id=0, axis=1, value=-0.95),
+        Event(pygame.JOYAXISMOTION, instance_id=0, axis=0, value=0.2),
+        Event(pygame.JOYAXISMOTION, instance_id=0, axis=1, value=0.0),
+        Event(pygame.KEYUP, key=pygame.K_s),
+        Event(pygame.JOYAXISMOTION, instance_id=0, axis=1, value=-0.5),
+    ])
+    snap = q.take(30)
+    assert snap.chords == ["up_right"]
+    assert snap.pressed == frozenset([pygame.K_i])
+    types = [e.type for e in snap.events]
+    assert types == [pygame.KEYDOWN, pygame.KEYDOWN, CHORD,
+                     pygame.JOYAXISMOTION, pygame.JOYAXISMOTION,
+                     pygame.KEYUP, pygame.JOYAXISMOTION]
+    x, y = snap.events[3:5]
+    assert (x.axis, x.value) == (0, 0.2)
+    assert (y.axis, y.value) == (1, 0.0)    # back to centre, in place
+    assert y.peak == -0.95                  # largest deflection of the run
+    assert y.poll_time == 20
+    assert snap.events[6].value == -0.5     # not merged across the KEYUP
+    assert snap.events[0].poll_time == 10
+    assert q.take(40).events == []
+    print("  [OK] Input queue")
+
+
+def test_input_dispatch():
+    from freeclimber.engine import director, Scene
+
+    class Chords(Scene):
+        chords = {"left": (pygame.K_a, pygame.K_j)}
+
+        def enter(self):
+            self.got = []
+
+        def handle_keydown(self, ev):
+            self.got.append(ev.key)
+
+        def handle_chord(self, ev):
+            self.got.append(ev.chord)
+
+        def realtick(self):
+            if director.realticks == 1:
+                director.input.poll(director.get_ticks(), self.chords, [
+                    pygame.event.Event(pygame.KEYDOWN, key=pygame.K_a),
+                    pygame.event.Event(pygame.KEYDOWN, key=pygame.K_j),
+                ])
+
+    scene = Chords()
+    director.run_headless(scene, realticks=3)
+    assert scene.got == [pygame.K_a, pygame.K_j, "left"]
+    mean, worst = director.input.latency_stats()
+    assert worst == 25.0  # queued on one realtick, handled on the next
+    print("  [OK] Input dispatch")
+
+
 def test_reactor():
     from freeclimber.engine.director import Reactor
 
@@ -66,6 +486,44 @@ def test_reactor():
     print("  [OK] Reactor")
 
 
+def test_reactor_order():
+    from freeclimber.engine.director import Reactor
+
+    r = Reactor()
+    order = []
+
+    class Tickable:
+        def __init__(self, n):
+            self.n = n
+
+        def tick(self, delta):
+            order.append(self.n)
+            if self.n == 0:
+                r.remove(objs[2])       # removed mid-tick: skipped now
+                r.add(late)             # added mid-tick: ticks next time
+
+    objs = [Tickable(n) for n in range(100)]
+    late = Tickable(100)
+    for o in objs:
+        r.add(o)
+    r.add(objs[5])  # duplicate add is ignored
+    assert len(r) == 100
+    r.tick(0.01)
+    assert order == [n for n in range(100) if n != 2]
+    assert len(r) == 100
+
+    # Remove most of them; compaction keeps insertion order
+    for o in objs[10:90]:
+        r.remove(o)
+    del order[:]
+    r.tick(0.01)
+    expected = [n for n in range(100) if n != 2 and not 10 <= n < 90] + [100]
+    assert order == expected
+    assert len(r) == len(expected)
+    assert len(r._slots) == len(expected)
+    print("  [OK] Reactor ordering")
+
+
 def test_action_chaining():
     from freeclimber.engine.actions import Delay, AlphaFade, CallFunc, Hide, Show, Delete
 
@@ -161,6 +619,54 @@ def test_node_set():
     print("  [OK] Node.set()")
 
 
+def test_damage_tracking():
+    from freeclimber.engine import Scene, Node
+    from freeclimber.engine.node import damage
+
+    scene = Scene()
+    layer = scene.new_layer("actors")
+    node = Node()
+    damage.dirty = False
+    node.x = 10                     # not placed yet: nothing on screen
+    assert not damage.dirty
+    layer.add(node)
+    node._layer = layer
+    assert damage.dirty
+    damage.dirty = False
+    node.x = 10                     # same value
+    node.foo = 1                    # not a visual attribute
+    assert not damage.dirty
+    node.x = 11
+    assert damage.dirty
+    damage.dirty = False
+    node.delete()
+    assert damage.dirty
+    # Only the tracked attributes pay for it; the rest are plain writes
+    assert type(node).__setattr__ is object.__setattr__
+    print("  [OK] Damage tracking")
+
+
+def test_action_index():
+    from freeclimber.engine import (Node, MoveDelta, MoveTo, Delay, AlphaFade,
+                                    CenteredScale, Scale, director)
+
+    node = Node()
+    node.do(MoveDelta(1, 0, 1.0), MoveTo(5, 5, 1.0), Delay(1.0),
+            CenteredScale(2.0, 1.0), AlphaFade(0, 1.0))
+    assert len(node.current_actions) == 5
+    assert node.count_actions(Scale) == 1           # subclasses match
+    assert node.count_actions((MoveDelta, Delay)) == 2
+    assert node.has_actions(AlphaFade)
+    assert [type(a) for a in node.get_actions(MoveTo)] == [MoveTo]
+    node.abort_actions({MoveDelta, MoveTo, Delay})
+    assert node.count_actions() == 2
+    assert not node.has_actions((MoveDelta, MoveTo, Delay))
+    node.abort_actions()
+    assert not node.current_actions
+    director.reactor.clear()
+    print("  [OK] Action index")
+
+
 def test_entity_properties():
     from freeclimber.engine.entity import Entity
 
@@ -228,6 +734,343 @@ def test_text_entity():
     print("  [OK] TextEntity")
 
 
+def test_texture_cache():
+    import pygame
+    from pygame._sdl2.video import Window, Renderer
+    from freeclimber.engine import Entity, TextureCache, textures
+    from freeclimber.engine.resources import _Bitmap
+
+    pygame.init()
+    window = Window("textures", (64, 64))
+    renderer = Renderer(window)
+    frames = [_Bitmap(pygame.Surface((8, 8))) for i in range(3)]
+    textures.clear()
+    uploads = textures.uploads
+    try:
+        sprites = [Entity(frames[0]) for i in range(50)]
+        for e in sprites:
+            e.draw(renderer)
+        assert textures.uploads - uploads == 1
+        assert textures.refs(frames[0]) == 50
+        assert sprites[0]._texture is sprites[49]._texture
+        # An animation frame flip swaps references, no upload after the first
+        for i in range(6):
+            for e in sprites[:10]:
+                e.shape = frames[1 + i % 2]
+                e._texture_dirty = True
+                e.draw(renderer)
+        assert textures.uploads - uploads == 3
+        assert textures.refs(frames[0]) == 40
+        for e in sprites:
+            e.delete()
+        assert textures.refs(frames[0]) == 0 and frames[0] in textures
+        # Unreferenced textures are evicted oldest first
+        cache = TextureCache(max_idle=1)
+        a = cache.acquire(renderer, frames[0])
+        cache.get(renderer, frames[1])
+        cache.get(renderer, frames[2])
+        assert frames[0] in cache and frames[1] not in cache and len(cache) == 2
+        cache.release(frames[0])
+        assert frames[0] in cache and frames[2] not in cache   # just released
+        # Re-rendered text doesn't fill the idle list with its old bitmaps
+        from freeclimber.engine import GLFont, TextEntity
+        label = TextEntity(GLFont((None, 12), (255, 255, 255)), "0")
+        for i in range(20):
+            label.set_text(i)
+            label.draw(renderer)
+        assert len(textures) == 4 and textures.refs(label.shape) == 1
+        label.delete()
+        assert label.shape not in textures
+    finally:
+        textures.clear()
+        del renderer, window
+    print("  [OK] Texture cache")
+
+
+def test_texture_release_on_scene_switch():
+    import pygame
+    from pygame._sdl2.video import Window, Renderer
+    from freeclimber.engine import director, Scene, Entity, Composite, textures
+    from freeclimber.engine.resources import _Bitmap
+
+    pygame.init()
+    window = Window("switch", (64, 64))
+    renderer = Renderer(window)
+    frames = [_Bitmap(pygame.Surface((8, 8))) for i in range(3)]
+    held = []
+
+    def refs():
+        return sum(textures.refs(f) for f in frames)
+
+    class Level(Scene):
+        def enter(self):
+            self.new_layer("bg")
+            self.new_stabile("actors")
+            for i in range(20):
+                Entity(frames[i % 2]).place("bg")
+            parts = [Entity(frames[2]).place("actors") for i in range(3)]
+            Composite(parts).place("actors")
+            self.n = 0
+
+        def realtick(self):
+            self.n += 1
+            if self.n == 1:
+                for layer in self.ordered_layers:
+                    for e in layer:
+                        e._ensure_texture(renderer)
+                        for p in getattr(e, "parts", ()):
+                            p._ensure_texture(renderer)
+                held.append(refs())
+                director.set_scene(Level() if len(held) < 3 else Pushed())
+
+    class Pushed(Scene):
+        def realtick(self):
+            held.append(refs())
+            director.quit()
+
+    textures.clear()
+    try:
+        director.run_headless(Level(), realticks=10)
+        # Every level held its own references; none survived the switch
+        assert held == [23, 23, 23, 0], held
+        assert all(f in textures for f in frames)    # idle, still cached
+    finally:
+        textures.clear()
+        del renderer, window
+    print("  [OK] Textures released on scene switch")
+
+
+def test_atlas():
+    import tempfile
+    import pygame
+    from pygame._sdl2.video import Window, Renderer
+    from freeclimber.engine import Entity, textures, resources
+    from freeclimber.engine.atlas import pack
+
+    sizes = [(30, 10), (10, 30), (64, 64), (20, 20), (100, 8), (200, 10)]
+    places = pack(sizes, page_size=128, padding=2)
+    assert places[5] is None                        # wider than a page
+    rects = {}
+    for (w, h), place in zip(sizes, places):
+        if place is not None:
+            p, x, y = place
+            assert x + w <= 128 and y + h <= 128
+            rects.setdefault(p, []).append(pygame.Rect(x, y, w + 2, h + 2))
+    for page in rects.values():
+        assert all(a.collidelist([b for b in page if b is not a]) < 0 for a in page)
+
+    pygame.init()
+    window = Window("atlas", (64, 64))
+    renderer = Renderer(window)
+    colors = [(255, 0, 0), (0, 255, 0), (0, 0, 255)]
+    paths = []
+    for i, color in enumerate(colors):
+        path = os.path.join(tempfile.gettempdir(), "atlas_test_%d.png" % i)
+        surf = pygame.Surface((6 + i, 4), pygame.SRCALPHA)
+        surf.fill(color)
+        pygame.image.save(surf, path)
+        paths.append(path)
+    resources.clear()
+    textures.clear()
+    try:
+        loose = resources.get_bitmap(paths[0])
+        pages = resources.build_atlas(paths)
+        assert len(pages) == 1
+        frames = [resources.get_bitmap(p) for p in paths]
+        assert all(f.page is pages[0] for f in frames) and loose.page is None
+        assert frames[2].surface.get_at((0, 0)) == colors[2] + (255,)
+        sprite = Entity(frames[0], hotspot=(0, 0))
+        uploads = textures.uploads
+        for f, color in zip(frames, colors):
+            sprite.shape = f
+            sprite._texture_dirty = True
+            renderer.draw_color = (0, 0, 0, 255)
+            renderer.clear()
+            sprite.draw(renderer)
+            shot = renderer.to_surface()
+            assert shot.get_at((0, 0))[:3] == color
+            assert shot.get_at((f.width, 0))[:3] == (0, 0, 0)
+        assert textures.uploads - uploads == 1      # one page, one upload
+    finally:
+        resources.clear()
+        textures.clear()
+        for path in paths:
+            os.remove(path)
+        del renderer, window
+    print("  [OK] Texture atlas")
+
+
+def test_layer_culling():
+    import pygame
+    from pygame._sdl2.video import Window, Renderer
+    from freeclimber.engine import Entity, Scene, BitmapParticleSystem
+    from freeclimber.engine.resources import _Bitmap
+
+    bmp = _Bitmap(pygame.Surface((20, 10)))
+    e = Entity(bmp)
+    e.set(x=100, y=50)
+    assert e.bounds() == (90.0, 45.0, 110.0, 55.0)
+    e.scale = 2.0
+    assert e.bounds() == (80.0, 40.0, 120.0, 60.0)  # cache cleared on change
+    e.angle = 90
+    l, t, r, b = e.bounds()
+    assert abs((r - l) - (b - t)) < 1e-9 and r - l > 40
+
+    pygame.init()
+    window = Window("culling", (64, 64))
+    renderer = Renderer(window)
+    try:
+        scene = Scene()
+        for layer in (scene.new_layer("floors"), scene.new_stabile("items")):
+            for y in range(-2000, 2000, 100):
+                sprite = Entity(bmp)
+                sprite.set(x=30, y=y)
+                layer.add(sprite)
+            sprite.deleted = True
+            layer.add(BitmapParticleSystem())   # never culled
+            layer.draw(renderer, (-16, -16, 80, 80))
+            assert (layer.drawn, layer.culled) == (2, 38)
+            layer.draw(renderer)
+            assert (layer.drawn, layer.culled) == (40, 0)
+        assert scene.draw_stats() == {"floors": (40, 0), "items": (40, 0)}
+    finally:
+        del renderer, window
+    print("  [OK] Layer culling")
+
+
+def test_camera():
+    import pygame
+    from pygame._sdl2.video import Window, Renderer
+    from freeclimber.engine import director, Entity, Scene, MoveDelta
+    from freeclimber.engine.resources import _Bitmap
+
+    bmp = _Bitmap(pygame.Surface((20, 10)))
+
+    class Scroll(Scene):
+        def enter(self):
+            self.new_layer("world", parallax=1)
+            self.new_layer("far", parallax=0.5)
+            self.new_layer("hud")
+            self.sprites = {}
+            for name in ("world", "far", "hud"):
+                e = self.sprites[name] = Entity(bmp)
+                e.set(x=30, y=130).place(name)
+            self.camera.do(MoveDelta(0, 100, 0.2))
+
+    scene = Scroll()
+    director.run_headless(scene, realticks=40)
+    assert abs(scene.camera.y - 100.0) < 1e-6
+    world, far, hud = (scene.sprites[n] for n in ("world", "far", "hud"))
+    # Entities keep their coordinates; only where they are drawn changes
+    assert world.y == far.y == hud.y == 130
+    assert world.screen_pos() == (30, 30.0)
+    assert far.screen_pos() == (30, 80.0)
+    assert hud.screen_pos() == (30, 130)
+    assert world.to_world(*world.screen_pos()) == (30, 130.0)
+    assert world.screen_bounds() == (20.0, 25.0, 40.0, 35.0)
+
+    pygame.init()
+    window = Window("camera", (64, 64))
+    renderer = Renderer(window)
+    try:
+        view = (0, 0, 64, 64)
+        for layer in scene.ordered_layers:
+            layer.draw(renderer, view, scene.camera.offset(layer.parallax))
+        assert scene.draw_stats() == {"world": (1, 0), "far": (0, 1),
+                                      "hud": (0, 1)}
+    finally:
+        del renderer, window
+    # Entering again starts at the origin
+    director.run_headless(Scene(), realticks=1)
+    scene._activate()
+    assert (scene.camera.x, scene.camera.y) == (0.0, 0.0)
+    print("  [OK] Camera")
+
+
+def test_composite():
+    import pygame
+    from pygame._sdl2.video import Window, Renderer
+    from freeclimber.engine import director, Entity, Scene, Composite, MoveDelta
+    from freeclimber.engine.resources import _Bitmap
+
+    red = pygame.Surface((20, 20), pygame.SRCALPHA)
+    red.fill((255, 0, 0, 255))
+    blue = pygame.Surface((10, 10), pygame.SRCALPHA)
+    blue.fill((0, 0, 255, 255))
+    smoke = pygame.Surface((10, 10), pygame.SRCALPHA)
+    smoke.fill((0, 255, 0, 128))
+
+    class Cell(Scene):
+        def enter(self):
+            self.new_layer("back")
+            self.new_stabile("front")
+            self.wall = Entity(_Bitmap(red), hotspot=(0, 0)).place("front")
+            self.pane = Entity(_Bitmap(blue), hotspot=(0, 0)).set(x=5, y=5)
+            self.pane.place("front")
+            self.cell = Composite([self.wall, self.pane]).place("front")
+
+    scene = Cell()
+    director.run_headless(scene, realticks=1)
+    cell, wall, pane = scene.cell, scene.wall, scene.pane
+    assert cell.parts == [wall, pane]
+    assert list(scene.get_layer("front")) == [cell]
+    assert cell.bounds() == (0.0, 0.0, 20.0, 20.0)
+    assert wall.shape.binary_alpha and not _Bitmap(smoke).binary_alpha
+
+    pygame.init()
+    window = Window("composite", (64, 64))
+    renderer = Renderer(window)
+    try:
+        def frame():
+            renderer.draw_color = (0, 0, 0, 255)
+            renderer.clear()
+            scene.get_layer("front").draw(renderer, (0, 0, 64, 64))
+            return renderer.to_surface()
+
+        shot = frame()
+        assert shot.get_at((2, 2))[:3] == (255, 0, 0)
+        assert shot.get_at((8, 8))[:3] == (0, 0, 255)
+        frame()
+        assert cell.bakes == 1                      # nothing changed
+        pane.x += 8                                 # clipped at the right
+        shot = frame()
+        assert cell.bakes == 2
+        assert shot.get_at((8, 8))[:3] == (255, 0, 0)
+        assert shot.get_at((15, 8))[:3] == (0, 0, 255)
+        assert shot.get_at((24, 8))[:3] == (0, 0, 0)
+
+        # Translucent parts are drawn one by one, blended once
+        pane.alpha = 128
+        shot = frame()
+        assert cell.bakes == 2 and cell.stale
+        r, g, b = shot.get_at((15, 8))[:3]
+        assert abs(r - 127) <= 2 and g == 0 and abs(b - 128) <= 2
+        pane.alpha = 255
+        pane.shape = _Bitmap(smoke)
+        pane._texture_dirty = True
+        shot = frame()
+        assert cell.bakes == 2
+        r, g, b = shot.get_at((15, 8))[:3]
+        assert abs(r - 127) <= 2 and abs(g - 128) <= 2 and b == 0
+        pane.shape = _Bitmap(blue)
+        pane._texture_dirty = True
+        frame()
+        assert cell.bakes == 3 and not cell.stale
+
+        pane.do(MoveDelta(0, 0, 0.1))               # actions still run
+        assert pane.has_actions()
+        pane.x -= 8                                 # animated: not baked
+        frame()
+        assert cell.bakes == 3 and cell.stale
+        pane.delete()
+        assert cell.parts == [wall] and cell.stale
+        frame()
+        assert cell.bakes == 4
+    finally:
+        del renderer, window
+    print("  [OK] Composite")
+
+
 def test_repeat_action():
     from freeclimber.engine.actions import Repeat, Delay
 
@@ -238,6 +1081,356 @@ def test_repeat_action():
     print("  [OK] Repeat action")
 
 
+def test_action_pool():
+    from freeclimber.engine import director, Scene, Node
+    from freeclimber.engine.actions import (Repeat, MoveDelta, Delay,
+                                            CallFunc, _pools)
+
+    hits = []
+    step = MoveDelta(10, 0, 0.1) + Delay(0.05)
+    chain = step + CallFunc(hits.append, 1)
+    assert step._next._next is None     # a + b leaves a untouched
+
+    class Loop(Scene):
+        def enter(self):
+            self.new_layer("actors")
+            self.node = Node()
+            self.node.do(Repeat(chain, times=4) + CallFunc(hits.append, "end"))
+
+    _pools.clear()
+    scene = Loop()
+    director.run_headless(scene, realticks=40)
+    assert hits == [1, 1, 1, 1, "end"]
+    assert abs(scene.node.x - 40.0) < 1e-6
+    assert not scene.node.current_actions
+    # Every iteration reused the same pooled instances
+    assert len(_pools[MoveDelta]) == 1
+    assert len(_pools[Delay]) == 1
+    assert len(_pools[Repeat]) == 1
+    print("  [OK] Action pools")
+
+
+def test_action_stats():
+    from freeclimber.engine import (director, Scene, Node, MoveDelta, Delay,
+                                    Blink, CallFunc, Repeat, AlphaFade, Scale,
+                                    Timeline)
+    from freeclimber.engine.actions import _pools
+
+    stats = director.action_stats
+
+    class Busy(Scene):
+        def enter(self):
+            self.new_layer("actors")
+            self.a, self.b, self.c = Node(), Node(), Node()
+            self.a.do(Repeat(MoveDelta(1, 0, 0.1) + Delay(0.1), times=3)
+                      + CallFunc(self.a.do, Blink(0.1)))
+            self.b.do(AlphaFade(0, 2.0))
+            self.c.do(Delay(5.0))
+            self.d = Node()
+            self.d.do(Timeline(Scale(2.0, 0.1) + Scale(1.0, 0.1), times=1))
+
+        def realtick(self):
+            if director.realticks == 10:
+                self.b.abort_actions()
+
+    stats.enabled = True
+    stats.clear()
+    _pools.clear()
+    try:
+        scene = Busy()
+        director.run_headless(scene, realticks=40, frame_ms=25)
+        report = stats.report()
+        assert report["MoveDelta"]["started"] == 3
+        assert report["MoveDelta"]["ended"] == 3
+        assert sum(report["MoveDelta"]["lifetimes"][:2]) == 3   # <= 0.25 s
+        assert report["AlphaFade"]["aborted"] == 1
+        assert list(report)[:2] == ["Blink", "Delay"]       # most live first
+        assert stats.live(Blink) == 1 and stats.live() == 2
+        assert "CallFunc" not in report and "Repeat" not in report
+        # Timeline steps are allocated, never started
+        assert report["Timeline"]["started"] == report["Timeline"]["created"] == 1
+        assert report["Scale"]["internal"] == 2
+        assert report["Scale"]["created"] == report["Scale"]["started"] == 0
+        assert len(stats.churn) == 40 and stats.churn_stats()[1] >= 1
+        assert any("Blink" in line for line in stats.overlay_lines())
+        # A scene switch drops what's still running
+        director.reactor.clear()
+        assert stats.live() == 0 and stats.report()["Delay"]["aborted"] == 1
+        for row in stats.report().values():
+            assert sum(row["lifetimes"]) == row["ended"] + row["aborted"]
+    finally:
+        stats.enabled = False
+        stats.clear()
+    print("  [OK] Action telemetry")
+
+
+def test_time_domains():
+    from freeclimber.engine import (director, Scene, Node, MoveDelta, Move,
+                                    AlphaFade)
+
+    class Clocks(Scene):
+        def enter(self):
+            self.new_layer("world")
+            self.new_layer("hud", time_domain="ui")
+            self.new_layer("slow", time_domain="slow")
+            director.reactor.domain("slow").scale = 0.5
+            self.world, self.hud, self.slow = Node(), Node(), Node()
+            self.world.place("world")
+            self.hud.place("hud")
+            self.slow.place("slow")
+            self.fast = Node()
+            self.fast.time_domain = "fast"
+            director.reactor.domain("fast").scale = 2.0
+            self.world.do(MoveDelta(100, 0, 1.0))
+            self.hud.do(Move(10))
+            self.slow.do(MoveDelta(100, 0, 1.0))
+            self.fast.do(AlphaFade(0, 1.0))
+            self.frozen = None
+
+        def realtick(self):
+            if director.realticks == 8:     # 0.2 s
+                director.reactor.paused = True
+                self.frozen = self.world.x
+            elif director.realticks == 16:  # 0.4 s
+                assert self.world.x == self.frozen
+                director.reactor.paused = False
+
+    scene = Clocks()
+    director.run_headless(scene, realticks=24, frame_ms=25)
+    reactor = director.reactor
+    assert abs(scene.world.x - 40.0) < 1e-6         # 0.4 s of 0.6 s ran
+    assert abs(scene.slow.x - 30.0) < 1e-6          # half speed, not paused
+    assert abs(scene.hud.x - 6.0) < 1e-6            # the ui domain never paused
+    assert scene.fast.alpha == 0                    # 2x: done in 0.5 s
+    assert abs(reactor.time - 0.4) < 1e-6 and abs(reactor.domain("ui").time - 0.6) < 1e-6
+    assert len(reactor) == 3
+    scene.slow.abort_actions()
+    assert len(reactor) == 2
+    reactor.clear()
+    assert not reactor.paused and len(reactor) == 0
+    print("  [OK] Time domains")
+
+
+def test_offscreen_parking():
+    from freeclimber.engine import (director, Scene, Node, Animate, RepeatMode,
+                                    MoveDelta)
+
+    frames = list("abcdefg")
+
+    class Floors(Scene):
+        def enter(self):
+            self.new_layer("actors")
+            self.nodes = []
+            for y in (300, -2000, 5000):
+                n = Node()
+                n.y = y
+                n.do(Animate(frames, 0.7, RepeatMode))
+                self.nodes.append(n)
+            # A finite animation is never parked
+            self.nodes[1].do(Animate(frames, 0.5) + MoveDelta(0, 2300, 0.0))
+            self.parked = []
+
+        def realtick(self):
+            self.parked.append(director.reactor.parked)
+            if director.realticks == 20:
+                self.nodes[2].y = 200
+                self.nodes[2].abort_actions()
+
+    def run(margin):
+        director.offscreen_margin = margin
+        try:
+            scene = Floors()
+            director.run_headless(scene, realticks=61, frame_ms=10)
+        finally:
+            director.offscreen_margin = 64
+        return scene, [n.shape for n in scene.nodes[:2]]
+
+    scene, shapes = run(None)
+    assert max(scene.parked) == 0
+    scene, parked_shapes = run(64)
+    assert shapes == parked_shapes      # back in phase after scrolling in
+    assert max(scene.parked) == 2 and scene.parked[-1] == 0
+    assert len(director.reactor) == 2     # the aborted one left the park
+    print("  [OK] Off-screen parking")
+
+
+def test_tween_batch():
+    from freeclimber.engine import (director, Scene, Node, MoveDelta, MoveTo,
+                                    AlphaFade, Scale, CallFunc, RepeatMode,
+                                    PingPongMode)
+    from freeclimber.engine import tween
+
+    class Tweens(Scene):
+        def enter(self):
+            self.new_layer("actors")
+            self.nodes = [Node() for i in range(6)]
+            a, b, c, d, e, f = self.nodes
+            a.do(MoveDelta(30, -20, 0.3) + MoveTo(0, 0, 0.2))
+            b.do(AlphaFade(0, 0.4, RepeatMode))
+            c.do(Scale(2.0, 0.3, PingPongMode))
+            d.do(MoveDelta(50, 0, 1.0))
+            e.do(MoveDelta(5, 5, 0.0))
+            f.do(MoveDelta(-40, 0, 0.5))
+            # Enough rows to grow the arrays
+            for i in range(100):
+                n = Node()
+                n.do(MoveDelta(i, 1, 0.05 * (i % 7)))
+                self.nodes.append(n)
+
+        def realtick(self):
+            if director.realticks == 8:
+                self.nodes[3].abort_actions()
+                self.nodes[4].do(Scale(3.0, 0.1) + CallFunc(self.nodes[5].abort_actions))
+
+    def run():
+        scene = Tweens()
+        director.run_headless(scene, realticks=30, frame_ms=13)
+        n = len(director.reactor)
+        return n, [(e.x, e.y, e.alpha, e.scale) for e in scene.nodes]
+
+    if tween.numpy is None:
+        print("  [SKIP] Batched tweens (no NumPy)")
+        return
+    try:
+        tween.enabled = False
+        expected = run()
+        tween.enabled = True
+        assert run() == expected
+    finally:
+        tween.enabled = True
+    print("  [OK] Batched tweens")
+
+
+def test_easing():
+    from freeclimber.engine import (director, Scene, Node, MoveTo, AlphaFade,
+                                    Scale, PingPongMode, Timeline, CURVES,
+                                    QuadIn, QuadOut, BounceOut, ElasticOut)
+    from freeclimber.engine import tween
+
+    for name, curve in CURVES.items():
+        assert abs(curve(0.0)) < 1e-9 and abs(curve(1.0) - 1.0) < 1e-9, name
+        assert curve(-0.5) == curve(0.0) and curve(1.5) == curve(1.0), name
+        for i in range(37):
+            t = i / 36.0
+            assert abs(curve(t) - curve.func(t)) < 1e-3, (name, t)
+    assert QuadIn(0.5) < 0.5 < QuadOut(0.5)
+
+    class Eased(Scene):
+        def enter(self):
+            self.new_layer("actors")
+            self.nodes = [Node() for i in range(5)]
+            a, b, c, d, e = self.nodes
+            a.do(MoveTo(100, 50, 0.3, ease=BounceOut))
+            b.do(AlphaFade(0, 0.4, PingPongMode, ease=QuadIn))
+            c.do(Scale(2.0, 0.3, ease=ElasticOut))
+            d.do(MoveTo(100, 0, 0.3, ease=lambda t: t ** 0.5))
+            e.do(Timeline(MoveTo(100, 0, 0.2, ease=QuadOut) + MoveTo(0, 0, 0.2),
+                          times=1))
+            self.halfway = None
+
+        def realtick(self):
+            if director.get_ticks() == 100:     # halfway through the first step
+                self.halfway = self.nodes[4].x
+
+    def run():
+        scene = Eased()
+        director.run_headless(scene, realticks=40, frame_ms=10)
+        return scene.halfway, [(n.x, n.y, n.alpha, n.scale) for n in scene.nodes]
+
+    halfway, values = run()
+    assert values[0][:2] == (100.0, 50.0) and values[2][3] == 2.0
+    assert values[4][0] == 0.0 and halfway > 50.0
+    if tween.numpy is not None:
+        try:
+            tween.enabled = False
+            expected = run()
+        finally:
+            tween.enabled = True
+        assert (halfway, values) == expected
+    print("  [OK] Easing curves")
+
+
+def test_timeline():
+    from freeclimber.engine import (director, Scene, Node, AlphaFade, Delay,
+                                    CallFunc, Move, Repeat, Timeline)
+
+    done = []
+    pulse = Timeline(AlphaFade(200, 0.5) + AlphaFade(128, 0.5), times=3)
+    assert pulse.duration == 1.0 and len(pulse.steps) == 2
+    assert pulse.runs(AlphaFade) and not pulse.runs(Delay)
+
+    class Pulse(Scene):
+        def enter(self):
+            self.new_layer("actors")
+            self.node = Node()
+            self.node.do(pulse + CallFunc(done.append, 1))
+            self.seen = []
+
+        def realtick(self):
+            self.seen.append(self.node.alpha)
+
+    scene = Pulse()
+    director.run_headless(scene, realticks=130)
+    # seen[i] is the alpha after i ticks of 25 ms; offsets are exact, so
+    # no frame is lost at step boundaries
+    assert scene.seen[10] == 227       # 0.25 s: halfway to 200
+    assert scene.seen[50] == 164       # second iteration starts from 128
+    assert scene.seen[125] == 128 and done == [1]
+    assert not scene.node.current_actions
+
+    node = Node()
+    tl = Timeline(Delay(1.0) + AlphaFade(0, 1.0) + CallFunc(done.append, 2)).do(node)
+    tl.seek(1.5)
+    assert node.alpha == 127
+    tl.seek(0.5)
+    assert node.alpha == 127           # back in the Delay
+    tl.seek(2.0)
+    assert node.alpha == 0 and done == [1, 2]
+    tl.abort()
+
+    for bad in (Move(1, 0), Repeat(Delay(1.0))):
+        try:
+            Timeline(bad)
+            assert False, "compiled %r" % bad
+        except ValueError:
+            pass
+    director.reactor.clear()
+    print("  [OK] Timeline")
+
+
+def test_parallel_broadcast():
+    from freeclimber.engine import (director, Scene, Node, MoveDelta, MoveTo,
+                                    AlphaFade, Delay, CallFunc, Parallel,
+                                    Broadcast, Animate)
+
+    done = []
+
+    class Group(Scene):
+        def enter(self):
+            self.new_layer("actors")
+            self.owner = Node()
+            self.parts = [Node().set(x=i * 10.0) for i in range(50)]
+            self.owner.do(Broadcast(MoveDelta(0, 40, 0.5), self.parts)
+                          + CallFunc(done.append, "moved"))
+            self.owner.do(Parallel(AlphaFade(0, 0.2), Delay(0.4) + MoveTo(7, 7, 0.1))
+                          + CallFunc(done.append, "parallel"))
+            assert len(director.reactor) == 3
+
+    scene = Group()
+    director.run_headless(scene, realticks=30)
+    assert [(p.x, p.y) for p in scene.parts] == [(i * 10.0, 40.0) for i in range(50)]
+    assert (scene.owner.x, scene.owner.y, scene.owner.alpha) == (7.0, 7.0, 0)
+    assert sorted(done) == ["moved", "parallel"]
+    assert not scene.owner.current_actions
+
+    try:
+        Broadcast(Animate([]), [])
+        assert False, "broadcast an Animate"
+    except ValueError:
+        pass
+    print("  [OK] Parallel and Broadcast")
+
+
 def test_random_lazy():
     from freeclimber.engine.particles import Random
 
@@ -265,20 +1458,74 @@ def test_resources():
     print("  [OK] Resources")
 
 
+def test_resources_prefetch():
+    import glob
+    from freeclimber.engine.resources import ResourceHandler
+
+    stage = os.path.join(os.path.dirname(os.path.dirname(__file__)),
+                         "data", "images", "stages", "default")
+    paths = sorted(glob.glob(os.path.join(stage, "bonus_*.png")))
+    assert paths
+
+    handler = ResourceHandler(workers=2)
+    batch = handler.prefetch(paths + ["/nonexistent/path.png"])
+    assert batch.total == len(paths) + 1
+    batch.wait()
+    assert batch.finished and batch.fraction == 1.0
+    bmp = handler.get_bitmap(paths[0])
+    assert bmp is not None and bmp.width > 0
+    # Served from the cache, not decoded again
+    assert handler.get_bitmap(paths[0]) is bmp
+    assert handler.prefetch(paths).total == 0
+    assert handler.get_bitmap("/nonexistent/path.png") is None
+    print("  [OK] Resource prefetch")
+
+
 if __name__ == "__main__":
     print("Engine smoke tests:")
     test_imports()
     test_ticker()
+    test_ticker_fixed_step()
+    test_interpolation_tracking()
+    test_frame_pacer()
+    test_frame_cap_keeps_tick_rate()
+    test_headless_run()
+    test_frame_profiler()
+    test_scheduler()
+    test_scheduler_headless()
+    test_scheduler_pause()
+    test_scene_stack()
+    test_abort_suspended_action()
+    test_input_queue()
+    test_input_dispatch()
     test_reactor()
+    test_reactor_order()
     test_action_chaining()
     test_modes()
     test_collision()
     test_scene_layers()
     test_node_set()
+    test_damage_tracking()
+    test_action_index()
     test_entity_properties()
     test_glfont()
     test_text_entity()
+    test_texture_cache()
+    test_texture_release_on_scene_switch()
+    test_atlas()
+    test_layer_culling()
+    test_camera()
+    test_composite()
     test_repeat_action()
+    test_action_pool()
+    test_action_stats()
+    test_time_domains()
+    test_offscreen_parking()
+    test_tween_batch()
+    test_easing()
+    test_timeline()
+    test_parallel_broadcast()
     test_random_lazy()
     test_resources()
+    test_resources_prefetch()
     print("\nAll tests passed!")
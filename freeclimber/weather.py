@@ -92,6 +92,8 @@ class Cloud(Entity):
             y = -randint(abs(maxy), abs(maxy*2))
         else:
             y = randint(0, maxy)
+        ## x, y are on screen; front clouds scroll with the building
+        x, y = self.to_world(x, y)
         self.set(x=x, y=y, alpha=randint(191, 230))
 
 class Sky(Scene):